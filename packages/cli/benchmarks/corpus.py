@@ -0,0 +1,115 @@
+"""Seeded synthetic base/user/new triplets for merge benchmarks.
+
+Files look like generated CLAUDE.md / reference docs: ## sections with
+### subsections, list items, code fences and repeated lines (blank lines,
+table rows). The same spec always produces the same triplet.
+"""
+
+import random
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Shape of one generated merge triplet."""
+
+    name: str
+    sections: int
+    lines_per_section: int
+    edit_density: float  # Fraction of base lines each side edits
+    conflict_rate: float  # Fraction of template edits on lines the user edited
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class Triplet:
+    """Base, user and new versions of one file."""
+
+    base: str
+    user: str
+    new: str
+
+    @property
+    def size(self) -> int:
+        """Total characters across the three versions."""
+        return len(self.base) + len(self.user) + len(self.new)
+
+
+# Named corpus, small to large; benchmark baselines are keyed by name
+CORPUS: list[CorpusSpec] = [
+    CorpusSpec("small-sparse", 20, 20, 0.01, 0.0),
+    CorpusSpec("medium-sparse", 200, 25, 0.01, 0.1),
+    CorpusSpec("medium-dense", 200, 25, 0.10, 0.3),
+    CorpusSpec("many-sections", 2000, 5, 0.02, 0.1),
+    CorpusSpec("large-sparse", 1000, 100, 0.005, 0.1),
+]
+
+_WORDS = ["context", "planning", "task", "skill", "command", "template", "rule"]
+
+
+def _section(rng: random.Random, index: int, n_lines: int) -> list[str]:
+    """Generate one ## section with a subsection and a code fence."""
+    lines = [f"## Section {index}\n", "\n"]
+    for j in range(n_lines):
+        r = rng.random()
+        if j == n_lines // 2:
+            lines.extend(["\n", f"### Details {index}\n", "\n"])
+        elif r < 0.12:
+            lines.append("\n")
+        elif r < 0.22:
+            lines.append("| --- | --- |\n")
+        elif r < 0.25:
+            lines.extend(["```bash\n", f"run {rng.choice(_WORDS)} {j}\n", "```\n"])
+        else:
+            lines.append(f"- {rng.choice(_WORDS)} {rng.choice(_WORDS)} {index}.{j}\n")
+    lines.append("\n")
+    return lines
+
+
+def _apply_edits(
+    lines: list[str], positions: list[int], rng: random.Random, tag: str
+) -> list[str]:
+    """Replace, insert after or delete the lines at positions."""
+    edits = {pos: rng.random() for pos in positions}
+    result: list[str] = []
+    for pos, line in enumerate(lines):
+        kind = edits.get(pos)
+        if kind is None:
+            result.append(line)
+        elif kind < 0.6:
+            result.append(f"{line.rstrip()} ({tag} edit)\n")
+        elif kind < 0.85:
+            result.extend([line, f"- {tag} addition {pos}\n"])
+        # else: deleted
+    return result
+
+
+def make_triplet(spec: CorpusSpec) -> Triplet:
+    """Generate the triplet described by spec.
+
+    Both sides edit edit_density of the base lines. conflict_rate of the
+    template's edits land on lines the user also edited; the rest are
+    spread over lines the user left alone. Each side also appends a
+    section of its own.
+    """
+    rng = random.Random(
+        f"{spec.seed}:{spec.sections}:{spec.lines_per_section}"
+        f":{spec.edit_density}:{spec.conflict_rate}"
+    )
+    base = ["# Generated Project\n", "\n", "Platform-generated context.\n", "\n"]
+    for i in range(spec.sections):
+        base.extend(_section(rng, i, spec.lines_per_section))
+
+    n_edits = max(1, int(len(base) * spec.edit_density))
+    user_positions = rng.sample(range(len(base)), n_edits)
+    n_shared = int(n_edits * spec.conflict_rate)
+    untouched = sorted(set(range(len(base))) - set(user_positions))
+    new_positions = user_positions[:n_shared] + rng.sample(
+        untouched, min(n_edits - n_shared, len(untouched))
+    )
+
+    user = _apply_edits(base, user_positions, rng, "user")
+    user.extend(["## Local Notes\n", "\n", "- team-specific rule\n"])
+    new = _apply_edits(base, new_positions, rng, "template")
+    new.extend(["## New Template Section\n", "\n", "- new guidance\n"])
+    return Triplet("".join(base), "".join(user), "".join(new))
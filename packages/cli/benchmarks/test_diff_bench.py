@@ -0,0 +1,96 @@
+"""Diff engine benchmark against difflib.SequenceMatcher.
+
+Run with:
+
+    uv run pytest benchmarks/test_diff_bench.py
+
+Inputs are generated markdown-like files (list items, blank lines and
+repeated table rows) with about 1% of lines edited.
+"""
+
+import difflib
+import random
+import time
+from collections.abc import Callable
+
+import pytest
+
+from echograph_cli.core.diff import diff_opcodes
+from echograph_cli.core.merge import three_way_merge
+
+# Best-of-N to filter scheduler noise
+RUNS = 3
+
+
+def _make_file(n_lines: int, seed: int) -> list[str]:
+    """Generate a markdown-like file with many repeated lines."""
+    rng = random.Random(seed)
+    words = ["context", "planning", "task", "skill", "command", "template"]
+    lines: list[str] = []
+    for i in range(n_lines):
+        r = rng.random()
+        if r < 0.15:
+            lines.append("\n")
+        elif r < 0.3:
+            lines.append("| --- | --- |\n")
+        else:
+            lines.append(f"- {rng.choice(words)} item {i}\n")
+    return lines
+
+
+def _edit(lines: list[str], seed: int, tag: str) -> list[str]:
+    """Apply random replacements, insertions and deletions to ~1% of lines."""
+    rng = random.Random(seed)
+    edited = list(lines)
+    for n in range(len(lines) // 100):
+        k = rng.randrange(len(edited))
+        op = rng.random()
+        if op < 0.4:
+            edited[k] = f"{tag} edit {n}\n"
+        elif op < 0.7:
+            edited.insert(k, f"{tag} insert {n}\n")
+        else:
+            del edited[k]
+    return edited
+
+
+def _best_time(func: Callable[[], object]) -> float:
+    """Return the best wall time of RUNS calls in seconds."""
+    timings: list[float] = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@pytest.mark.parametrize("n_lines", [10_000, 50_000, 100_000])
+def test_diff_faster_than_sequence_matcher(n_lines: int) -> None:
+    """diff_opcodes should beat SequenceMatcher.get_opcodes on large files."""
+    base = _make_file(n_lines, seed=n_lines)
+    user = _edit(base, seed=1, tag="user")
+
+    ours = _best_time(lambda: diff_opcodes(base, user))
+    difflib_time = _best_time(
+        lambda: difflib.SequenceMatcher(None, base, user).get_opcodes()
+    )
+
+    print(
+        f"\n{n_lines} lines: diff {ours * 1000:.1f}ms, "
+        f"difflib {difflib_time * 1000:.1f}ms"
+    )
+    assert ours < difflib_time
+
+
+@pytest.mark.parametrize("n_lines", [10_000, 100_000])
+def test_three_way_merge_large_file(n_lines: int) -> None:
+    """Three-way merge of a large file should finish within budget."""
+    base_lines = _make_file(n_lines, seed=n_lines)
+    base = "".join(base_lines)
+    user = "".join(_edit(base_lines, seed=1, tag="user"))
+    new = "".join(_edit(base_lines, seed=2, tag="new"))
+
+    elapsed = _best_time(lambda: three_way_merge(base, user, new))
+
+    # Roughly 10us per line leaves headroom for slow CI machines
+    assert elapsed < n_lines * 10e-6
@@ -0,0 +1,86 @@
+"""Micro-benchmark: interned line ids versus plain string lists.
+
+Run with:
+
+    uv run pytest benchmarks/test_intern_bench.py -s
+"""
+
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import pytest
+
+from benchmarks.test_diff_bench import _edit, _make_file
+from echograph_cli.core.diff import LineInterner, diff_opcodes
+
+# Best-of-N to filter scheduler noise
+RUNS = 5
+
+
+def _retained_bytes(build: Callable[[], object]) -> int:
+    """Memory still allocated by build()'s result after it returns."""
+    tracemalloc.start()
+    try:
+        result = build()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained
+
+
+def _texts(n_lines: int) -> tuple[str, str, str]:
+    """Base, user and new texts for a three-way merge."""
+    base = _make_file(n_lines, seed=n_lines)
+    return (
+        "".join(base),
+        "".join(_edit(base, seed=1, tag="user")),
+        "".join(_edit(base, seed=2, tag="new")),
+    )
+
+
+@pytest.mark.parametrize("n_lines", [10_000, 100_000])
+def test_interned_lines_use_less_memory(n_lines: int) -> None:
+    """Interned merge inputs should retain well under the string lists."""
+    texts = _texts(n_lines)
+
+    def as_strings() -> object:
+        return [text.splitlines(keepends=True) for text in texts]
+
+    def as_ids() -> object:
+        interner = LineInterner()
+        ids = [interner.intern(text.splitlines(keepends=True)) for text in texts]
+        return ids, interner.lines()
+
+    strings = _retained_bytes(as_strings)
+    interned = _retained_bytes(as_ids)
+
+    print(f"\n{n_lines} lines: strings {strings // 1024}KiB, ids {interned // 1024}KiB")
+    assert interned < strings * 0.6
+
+
+@pytest.mark.parametrize("n_lines", [10_000, 100_000])
+def test_interned_diff_keeps_pace_with_strings(n_lines: int) -> None:
+    """Diffing ids, interning included, should cost about the same as strings."""
+    base, user, _ = _texts(n_lines)
+    base_lines = base.splitlines(keepends=True)
+    user_lines = user.splitlines(keepends=True)
+
+    def diff_strings() -> object:
+        return diff_opcodes(base_lines, user_lines)
+
+    def diff_ids() -> object:
+        interner = LineInterner()
+        return diff_opcodes(interner.intern(base_lines), interner.intern(user_lines))
+
+    timings: dict[str, list[float]] = {"strings": [], "ids": []}
+    for _ in range(RUNS):
+        for name, func in (("strings", diff_strings), ("ids", diff_ids)):
+            start = time.perf_counter()
+            func()
+            timings[name].append(time.perf_counter() - start)
+    strings, ids = min(timings["strings"]), min(timings["ids"])
+
+    print(f"\n{n_lines} lines: strings {strings * 1000:.1f}ms, ids {ids * 1000:.1f}ms")
+    assert ids < strings * 1.5
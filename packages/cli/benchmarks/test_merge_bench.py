@@ -0,0 +1,172 @@
+"""Merge engine regression benchmark over the seeded corpus.
+
+Run with:
+
+    uv run pytest benchmarks/test_merge_bench.py -s
+
+Each merge function runs on every corpus triplet (see benchmarks/corpus.py)
+and reports throughput and peak memory. Times are divided by a fixed
+calibration workload measured in the same run, so the recorded baseline
+carries over between machines. A benchmark fails when its calibrated time
+exceeds the baseline by more than ECHOGRAPH_BENCH_MAX_SLOWDOWN (default
+0.5, i.e. 50% slower).
+
+After an intended performance change, rewrite the baseline with:
+
+    ECHOGRAPH_BENCH_UPDATE_BASELINE=1 uv run pytest benchmarks/test_merge_bench.py
+"""
+
+import dataclasses
+import json
+import os
+import random
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+
+from benchmarks.corpus import CORPUS, CorpusSpec, Triplet, make_triplet
+from echograph_cli.core.merge import (
+    merge_claude_md_sections,
+    three_way_merge,
+    three_way_merge_sections,
+)
+
+BASELINE_FILE = Path(__file__).with_name("merge_baseline.json")
+DEFAULT_MAX_SLOWDOWN = 0.5
+
+# Best-of-N to filter scheduler noise
+RUNS = 5
+
+MERGES: dict[str, Callable[[Triplet], object]] = {
+    "three_way_merge": lambda t: three_way_merge(t.base, t.user, t.new),
+    "three_way_merge_sections": lambda t: three_way_merge_sections(
+        t.base, t.user, t.new
+    ),
+    "merge_claude_md_sections": lambda t: merge_claude_md_sections(t.user, t.new),
+}
+
+
+def _best_time(func: Callable[[], object]) -> float:
+    """Return the best wall time of RUNS calls in seconds."""
+    timings: list[float] = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _peak_bytes(func: Callable[[], object]) -> int:
+    """Peak memory allocated while func() runs."""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def _calibration_workload() -> None:
+    """Fixed pure-Python work (hashing, dicts, sorting) to scale timings by."""
+    rng = random.Random(0)
+    lines = [f"- item {rng.randrange(5000)}\n" for _ in range(50_000)]
+    counts: dict[str, int] = {}
+    for line in lines:
+        counts[line] = counts.get(line, 0) + 1
+    sorted(lines)
+
+
+@pytest.fixture(scope="module")
+def calibration() -> float:
+    """Best time of the calibration workload on this machine."""
+    return _best_time(_calibration_workload)
+
+
+@pytest.fixture(scope="module")
+def baseline() -> dict[str, float]:
+    """Recorded calibrated times, keyed "merge/corpus"."""
+    try:
+        data: dict[str, float] = json.loads(BASELINE_FILE.read_text("utf-8"))
+    except FileNotFoundError:
+        return {}
+    return data
+
+
+@pytest.fixture(scope="module")
+def results() -> Iterator[dict[str, float]]:
+    """Calibrated times measured in this run; written out when updating."""
+    measured: dict[str, float] = {}
+    yield measured
+    if os.environ.get("ECHOGRAPH_BENCH_UPDATE_BASELINE") and measured:
+        BASELINE_FILE.write_text(
+            json.dumps(dict(sorted(measured.items())), indent=2) + "\n", "utf-8"
+        )
+
+
+@pytest.fixture(scope="module")
+def triplets() -> dict[str, Triplet]:
+    """Generate each corpus triplet once."""
+    return {spec.name: make_triplet(spec) for spec in CORPUS}
+
+
+def test_corpus_is_deterministic() -> None:
+    """The same spec should always generate the same triplet."""
+    spec = CORPUS[1]
+
+    assert make_triplet(spec) == make_triplet(spec)
+    assert make_triplet(spec) != make_triplet(dataclasses.replace(spec, seed=1))
+
+
+def test_conflict_rate_controls_conflicts() -> None:
+    """Higher conflict rates should produce more line-level conflicts."""
+    counts = []
+    for rate in (0.0, 0.5):
+        triplet = make_triplet(CorpusSpec("rate", 50, 20, 0.05, rate))
+        _, conflicts = three_way_merge(
+            triplet.base, triplet.user, triplet.new, refine=False
+        )
+        counts.append(len(conflicts))
+
+    assert counts[0] < counts[1]
+
+
+@pytest.mark.parametrize("spec", CORPUS, ids=[spec.name for spec in CORPUS])
+@pytest.mark.parametrize("merge_name", list(MERGES))
+def test_merge_throughput(
+    merge_name: str,
+    spec: CorpusSpec,
+    triplets: dict[str, Triplet],
+    calibration: float,
+    baseline: dict[str, float],
+    results: dict[str, float],
+) -> None:
+    """Calibrated merge time should stay within the configured slowdown."""
+    triplet = triplets[spec.name]
+    merge = MERGES[merge_name]
+
+    elapsed = _best_time(lambda: merge(triplet))
+    peak = _peak_bytes(lambda: merge(triplet))
+    calibrated = elapsed / calibration
+    key = f"{merge_name}/{spec.name}"
+    results[key] = round(calibrated, 4)
+
+    print(
+        f"\n{key}: {triplet.size / elapsed / 1e6:.1f}MB/s, "
+        f"{elapsed * 1000:.1f}ms, peak {peak // 1024}KiB, "
+        f"{calibrated:.3f}x calibration"
+    )
+    if key not in baseline or os.environ.get("ECHOGRAPH_BENCH_UPDATE_BASELINE"):
+        return
+
+    max_slowdown = float(
+        os.environ.get("ECHOGRAPH_BENCH_MAX_SLOWDOWN", DEFAULT_MAX_SLOWDOWN)
+    )
+    limit = baseline[key] * (1 + max_slowdown)
+    assert calibrated <= limit, (
+        f"{key} took {calibrated:.3f}x calibration, "
+        f"baseline {baseline[key]:.3f}x (limit {limit:.3f}x)"
+    )
@@ -0,0 +1,53 @@
+"""Section merge scaling benchmark for generated CLAUDE.md files.
+
+Run with:
+
+    uv run pytest benchmarks/test_section_bench.py -s
+"""
+
+import time
+from collections.abc import Callable
+
+import pytest
+
+from echograph_cli.core.merge import merge_claude_md_sections, three_way_merge_sections
+
+# Best-of-N to filter scheduler noise
+RUNS = 3
+
+
+def _claude_md(n_sections: int, tag: str) -> str:
+    """Generate a CLAUDE.md with n sections of a few lines each."""
+    parts = ["# Generated Project\n\nPlatform-generated context.\n"]
+    for i in range(n_sections):
+        parts.append(f"## 🔧 Service {i} Rules\n\n- rule one\n- rule two {tag}\n")
+    return "\n".join(parts)
+
+
+def _best_time(func: Callable[[], object]) -> float:
+    """Return the best wall time of RUNS calls in seconds."""
+    timings: list[float] = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@pytest.mark.parametrize(
+    "merge",
+    [
+        lambda n: merge_claude_md_sections(_claude_md(n, "a"), _claude_md(2 * n, "a")),
+        lambda n: three_way_merge_sections(
+            _claude_md(n, "base"), _claude_md(n, "user"), _claude_md(2 * n, "base")
+        ),
+    ],
+    ids=["merge_claude_md_sections", "three_way_merge_sections"],
+)
+def test_section_merge_scales_linearly(merge: Callable[[int], object]) -> None:
+    """8x the sections should cost well under 64x (quadratic) the time."""
+    small = _best_time(lambda: merge(250))
+    large = _best_time(lambda: merge(2000))
+
+    print(f"\n250 sections {small * 1000:.1f}ms, 2000 sections {large * 1000:.1f}ms")
+    assert large < small * 16
@@ -0,0 +1,65 @@
+"""Cold-start benchmark for CLI subcommands.
+
+Each measurement runs in a fresh interpreter so nothing is cached in
+sys.modules. Run with:
+
+    uv run pytest benchmarks/test_startup.py
+
+Budgets can be scaled for slow CI machines with
+ECHOGRAPH_STARTUP_BUDGET_SCALE (e.g. 2.0 doubles every budget).
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from echograph_cli.main import LAZY_COMMANDS
+
+# Cold-start budget per subcommand in milliseconds (import + command build)
+DEFAULT_BUDGET_MS = 200.0
+BUDGETS_MS: dict[str, float] = {
+    # init/update need jinja2 and the merge engine by design
+    "init": 350.0,
+    "update": 300.0,
+}
+
+# Best-of-N to filter scheduler noise
+RUNS = 5
+
+MEASURE_SCRIPT = """\
+import time
+start = time.perf_counter()
+from echograph_cli.main import load_command
+load_command({name!r})
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def _cold_start_ms(name: str) -> float:
+    """Measure import + command construction time in a fresh interpreter."""
+    timings: list[float] = []
+    for _ in range(RUNS):
+        result = subprocess.run(
+            [sys.executable, "-c", MEASURE_SCRIPT.format(name=name)],
+            capture_output=True,
+            text=True,
+            check=True,
+            shell=False,
+        )
+        timings.append(float(result.stdout.strip()))
+    return min(timings)
+
+
+@pytest.mark.parametrize("name", list(LAZY_COMMANDS))
+def test_subcommand_cold_start_within_budget(name: str) -> None:
+    """Cold start of each subcommand should stay within its budget."""
+    scale = float(os.environ.get("ECHOGRAPH_STARTUP_BUDGET_SCALE", "1.0"))
+    budget = BUDGETS_MS.get(name, DEFAULT_BUDGET_MS) * scale
+
+    elapsed = _cold_start_ms(name)
+
+    assert elapsed <= budget, (
+        f"'echograph {name}' cold start took {elapsed:.1f}ms (budget {budget:.1f}ms)"
+    )
@@ -0,0 +1,69 @@
+"""Memory benchmark: streamed merge output versus building the merged string.
+
+Run with:
+
+    uv run pytest benchmarks/test_stream_bench.py -s
+
+Inputs are large generated reference docs (like PRPs/ai_docs) where the
+user and the template each edited a few sections.
+"""
+
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from echograph_cli.core.fileio import atomic_write_chunks, atomic_write_text
+from echograph_cli.core.merge import (
+    iter_three_way_merge_sections,
+    three_way_merge_sections,
+)
+
+
+def _reference_doc(n_sections: int, edited: set[int], tag: str) -> str:
+    """Generate a doc of n sections; sections in edited get a tagged line."""
+    parts = ["# API Reference\n"]
+    for i in range(n_sections):
+        body = "".join(f"- `endpoint_{i}_{j}` returns item {j}\n" for j in range(40))
+        note = f"- note from {tag}\n" if i in edited else ""
+        parts.append(f"## Endpoint {i}\n\n{body}{note}")
+    return "\n".join(parts)
+
+
+def _peak_bytes(run: Callable[[], None]) -> int:
+    """Peak memory allocated while run() executes."""
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+@pytest.mark.parametrize("n_sections", [500, 5000])
+def test_streamed_section_merge_peak_memory(n_sections: int, tmp_path: Path) -> None:
+    """Streaming a merge to disk should peak well below merging then writing."""
+    base = _reference_doc(n_sections, set(), "base")
+    user = _reference_doc(n_sections, set(range(0, n_sections, 50)), "user")
+    new = _reference_doc(n_sections, set(range(25, n_sections, 50)), "new")
+    target = tmp_path / "reference.md"
+
+    def full() -> None:
+        merged, _ = three_way_merge_sections(base, user, new)
+        atomic_write_text(target, merged)
+
+    def streamed() -> None:
+        atomic_write_chunks(target, iter_three_way_merge_sections(base, user, new))
+
+    full_peak = _peak_bytes(full)
+    expected = target.read_bytes()
+    streamed_peak = _peak_bytes(streamed)
+
+    print(
+        f"\n{n_sections} sections ({len(user) // 1024}KiB): "
+        f"full {full_peak // 1024}KiB, streamed {streamed_peak // 1024}KiB"
+    )
+    assert target.read_bytes() == expected
+    assert streamed_peak < full_peak * 0.7
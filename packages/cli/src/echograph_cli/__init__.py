@@ -1,5 +1,14 @@
 """EchoGraph CLI - Context Engineering for Claude Code."""
 
-from importlib.metadata import version
+from typing import Any
 
-__version__ = version("echograph")
+
+def __getattr__(name: str) -> Any:
+    """Resolve __version__ lazily - importlib.metadata is slow to import."""
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value = version("echograph")
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,27 +1,29 @@
 """Init command - scaffold .claude/ directory."""
 
+import json
 from collections.abc import Callable
+from dataclasses import asdict
 from pathlib import Path
 from typing import Annotated
 
 import typer
-from jinja2.exceptions import TemplateNotFound
 from rich.table import Table
 
-from echograph_cli.core.ai_merge import smart_merge_file
+from echograph_cli.core.ai_merge import AIMerge, AIMergePipeline, smart_merge_file
 from echograph_cli.core.merge import (
     ConflictMarkerStyle,
     merge_claude_md_sections,
     three_way_merge_sections,
 )
 from echograph_cli.core.models import ConflictResolution
+from echograph_cli.core.store import select_base_content
 from echograph_cli.core.templates import (
     copy_templates,
     detect_conflicts,
-    get_bundled_template,
     get_project_config,
+    get_template_catalog,
+    get_template_metadata,
     preview_templates,
-    render_template,
 )
 from echograph_cli.output import (
     console,
@@ -112,10 +114,25 @@ def _handle_claude_md_migration(path: Path) -> bool:
     return True
 
 
+def _recorded_base(path: Path, template_path: str) -> str:
+    """Template version a file started from, if a previous init recorded it.
+
+    Returns:
+        The base content, or "" for projects without template metadata
+    """
+    metadata_file = path / ".claude" / ".echograph-meta.json"
+    metadata = get_template_metadata(metadata_file)
+    if not metadata:
+        return ""
+    return select_base_content(metadata_file, metadata, template_path)
+
+
 def _resolve_conflicts_interactive(
     conflicts: list[tuple[str, Path]],
     get_template_content: Callable[[str], str] | None = None,
     smart_merge_available: bool = False,
+    get_base_content: Callable[[str], str] | None = None,
+    ai_cache: bool = True,
 ) -> dict[str, ConflictResolution | str]:
     """Prompt user for conflict resolution strategy.
 
@@ -123,6 +140,9 @@ def _resolve_conflicts_interactive(
         conflicts: List of (template_path, target_path) tuples
         get_template_content: Optional callable to get template content for diff display
         smart_merge_available: Whether AI merge is available (anthropic installed)
+        get_base_content: Optional callable (template_path) -> the recorded
+            base version, enabling three-way merges
+        ai_cache: Whether smart merges may reuse cached AI answers
 
     Returns:
         Dict mapping template_path to resolution (or SMART_MERGE_SENTINEL for AI merge)
@@ -198,10 +218,15 @@ def _resolve_conflicts_interactive(
                     try:
                         existing_content = target_path.read_text(encoding="utf-8")
                         template_content = get_template_content(template_path)
+                        base_content = (
+                            get_base_content(template_path)
+                            if get_base_content is not None
+                            else ""
+                        )
 
-                        # Use empty string as base (no three-way, just merge sections)
+                        # Without a recorded base this just merges sections
                         merged, section_conflicts = three_way_merge_sections(
-                            "",  # No base version available
+                            base_content,
                             existing_content,
                             template_content,
                             ConflictMarkerStyle.HTML_COMMENT,
@@ -226,10 +251,7 @@ def _resolve_conflicts_interactive(
                         continue
                     break
 
-                if (
-                    file_choice == "a"
-                    and get_template_content is not None
-                ):
+                if file_choice == "a" and get_template_content is not None:
                     # AI-assisted smart merge
                     try:
                         existing_content = target_path.read_text(encoding="utf-8")
@@ -241,6 +263,12 @@ def _resolve_conflicts_interactive(
                             filename=target_path.name,
                             console=console,
                             auto_approve=False,
+                            base_content=(
+                                get_base_content(template_path)
+                                if get_base_content is not None
+                                else ""
+                            ),
+                            ai_cache=ai_cache,
                         )
 
                         if result.user_approved:
@@ -269,6 +297,33 @@ def _resolve_conflicts_interactive(
     return resolutions
 
 
+def _run_batch_init(
+    base: Path,
+    patterns: list[str],
+    mode: str,
+    resolution: ConflictResolution,
+    workers: int | None,
+    dry_run: bool = False,
+) -> None:
+    """Initialize every matching project and print one JSON line per project."""
+    from echograph_cli.core.batch import expand_project_roots, run_batch_init
+
+    roots = expand_project_roots(base, patterns)
+    if not roots:
+        print_error(f"No project directories matched: {', '.join(patterns)}")
+        raise typer.Exit(1)
+
+    results = run_batch_init(roots, mode, resolution, workers, dry_run)
+
+    for result in results:
+        summary = asdict(result)
+        summary["path"] = str(result.path)
+        typer.echo(json.dumps(summary))
+
+    if any(r.status != "ok" for r in results):
+        raise typer.Exit(1)
+
+
 def init_command(
     path: Annotated[
         Path,
@@ -332,6 +387,39 @@ def init_command(
             help="Use AI-assisted merge for all conflicting files",
         ),
     ] = False,
+    no_ai_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-ai-cache",
+            help="Smart merge: ask the AI again instead of reusing cached answers",
+        ),
+    ] = False,
+    batch: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--batch",
+            help=(
+                "Initialize many projects non-interactively "
+                "(path or glob relative to PATH, repeatable)"
+            ),
+        ),
+    ] = None,
+    on_conflict: Annotated[
+        ConflictResolution,
+        typer.Option(
+            "--on-conflict",
+            help="Batch mode: how to handle existing files",
+            case_sensitive=False,
+        ),
+    ] = ConflictResolution.SKIP,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            help="Batch mode: number of worker processes (default: CPU count)",
+            min=1,
+        ),
+    ] = None,
 ) -> None:
     """Scaffold Context Engineering structure in your project.
 
@@ -339,14 +427,29 @@ def init_command(
     PLANNING.md, TASK.md, and optionally slash commands and skills.
 
     Use --dry-run to preview what files would be created.
+    Use --batch to initialize many projects at once, e.g.
+    `echograph init --batch "services/*" --on-conflict skip`.
     """
-    print_welcome_banner()
-
     # Determine mode
     if minimal and full:
         print_error("Cannot use both --minimal and --full")
         raise typer.Exit(1)
 
+    if batch:
+        # Non-interactive: no banner or prompts, JSON summary per project
+        resolution = ConflictResolution.OVERWRITE if force else on_conflict
+        _run_batch_init(
+            path,
+            batch,
+            "minimal" if minimal else "full",
+            resolution,
+            workers,
+            dry_run,
+        )
+        return
+
+    print_welcome_banner()
+
     mode = "minimal" if minimal else "full"
     if not minimal and not full and not dry_run:
         # Interactive mode - show clear menu
@@ -395,6 +498,7 @@ def init_command(
 
     # Get project configuration
     config = get_project_config(path)
+    catalog = get_template_catalog()
     console.print(f"\n[dim]Project: {config.project_name}[/dim]")
 
     # Handle CLAUDE.md merge if it exists and --merge is used
@@ -403,15 +507,7 @@ def init_command(
     if claude_md_path.exists() and merge:
         existing_content = claude_md_path.read_text(encoding="utf-8")
         # Render template with project config
-        context = {
-            "project_name": config.project_name,
-            "tech_stack": config.tech_stack,
-            "has_tests": config.has_tests,
-            "test_framework": config.test_framework,
-            "formatter": config.formatter,
-            "linter": config.linter,
-        }
-        template_content = render_template("CLAUDE.md.j2", context)
+        template_content = catalog.render("CLAUDE.md", config)
 
         merged_content, added_sections = merge_claude_md_sections(
             existing_content, template_content
@@ -440,19 +536,7 @@ def init_command(
             # Create a getter function for template content (for diff display)
             def get_template_content(template_path: str) -> str:
                 """Get rendered template content for a given template path."""
-                context = {
-                    "project_name": config.project_name,
-                    "tech_stack": config.tech_stack,
-                    "has_tests": config.has_tests,
-                    "test_framework": config.test_framework,
-                    "formatter": config.formatter,
-                    "linter": config.linter,
-                }
-                # Try .j2 template first, fall back to raw file
-                try:
-                    return render_template(f"{template_path}.j2", context)
-                except TemplateNotFound:
-                    return get_bundled_template(template_path)
+                return catalog.render(template_path, config)
 
             if smart_merge:
                 # --smart-merge flag: mark all conflicts for AI merge
@@ -463,6 +547,10 @@ def init_command(
                 conflict_resolutions = _resolve_conflicts_interactive(
                     [(c.template_path, c.target_path) for c in conflicts],
                     get_template_content=get_template_content,
+                    get_base_content=lambda template_path: _recorded_base(
+                        path, template_path
+                    ),
+                    ai_cache=not no_ai_cache,
                 )
 
             # Process smart merge files
@@ -539,52 +627,81 @@ def init_command(
             f"with AI-assisted merge...[/cyan]"
         )
 
-        def get_template_content_for_merge(template_path: str) -> str:
-            """Get rendered template content for smart merge."""
-            context = {
-                "project_name": config.project_name,
-                "tech_stack": config.tech_stack,
-                "has_tests": config.has_tests,
-                "test_framework": config.test_framework,
-                "formatter": config.formatter,
-                "linter": config.linter,
-            }
-            # Try .j2 template first, fall back to raw file
-            try:
-                return render_template(f"{template_path}.j2", context)
-            except TemplateNotFound:
-                return get_bundled_template(template_path)
-
-        for template_path, target_path in smart_merge_files:
-            try:
-                existing_content = target_path.read_text(encoding="utf-8")
-                template_content = get_template_content_for_merge(template_path)
-
-                result = smart_merge_file(
-                    user_content=existing_content,
-                    template_content=template_content,
-                    filename=target_path.name,
-                    console=console,
-                    auto_approve=smart_merge,  # Auto-approve with --smart-merge flag
+        with AIMergePipeline(use_cache=not no_ai_cache) as pipeline:
+            # Start every file's AI request first so they overlap, then
+            # review the results one file at a time, in order
+            queued: list[tuple[str, Path, str, str, str, AIMerge]] = []
+            for template_path, target_path in smart_merge_files:
+                try:
+                    existing_content = target_path.read_text(encoding="utf-8")
+                    template_content = catalog.render(template_path, config)
+                    base_content = _recorded_base(path, template_path)
+                    ai_merge = pipeline.prefetch(
+                        existing_content,
+                        template_content,
+                        target_path.name,
+                        base_content,
+                    )
+                except KeyboardInterrupt:
+                    console.print("\n[yellow]Aborted by user[/yellow]")
+                    raise typer.Exit(1)
+                except Exception as e:
+                    print_error(f"Smart merge failed for {template_path}: {e}")
+                    conflict_resolutions[template_path] = ConflictResolution.SKIP
+                    continue
+                queued.append(
+                    (
+                        template_path,
+                        target_path,
+                        existing_content,
+                        template_content,
+                        base_content,
+                        ai_merge,
+                    )
                 )
 
-                if result.user_approved:
-                    if not result.was_skipped_whitespace:
-                        # Only write if there were actual changes
-                        target_path.write_text(result.merged_content, encoding="utf-8")
-                        print_success(f"Smart merged: {template_path}")
-                    # else: whitespace skip already printed message, no action needed
-                else:
-                    print_warning(f"Skipped: {template_path}")
-
-                # Mark as handled
-                conflict_resolutions[template_path] = ConflictResolution.SKIP
-            except KeyboardInterrupt:
-                console.print("\n[yellow]Aborted by user[/yellow]")
-                raise typer.Exit(1)
-            except Exception as e:
-                print_error(f"Smart merge failed for {template_path}: {e}")
-                conflict_resolutions[template_path] = ConflictResolution.SKIP
+            for (
+                template_path,
+                target_path,
+                existing_content,
+                template_content,
+                base_content,
+                ai_merge,
+            ) in queued:
+                try:
+                    result = smart_merge_file(
+                        user_content=existing_content,
+                        template_content=template_content,
+                        filename=target_path.name,
+                        console=console,
+                        auto_approve=smart_merge,  # Auto-approve with --smart-merge
+                        base_content=base_content,
+                        ai_merge=ai_merge,
+                        ai_cache=not no_ai_cache,
+                    )
+
+                    if result.user_approved:
+                        if not result.was_skipped_whitespace:
+                            # Only write if there were actual changes
+                            target_path.write_text(
+                                result.merged_content, encoding="utf-8"
+                            )
+                            print_success(f"Smart merged: {template_path}")
+                        # else: whitespace skip already printed message
+                    else:
+                        print_warning(f"Skipped: {template_path}")
+
+                    # Mark as handled
+                    conflict_resolutions[template_path] = ConflictResolution.SKIP
+                except KeyboardInterrupt:
+                    console.print("\n[yellow]Aborted by user[/yellow]")
+                    raise typer.Exit(1)
+                except Exception as e:
+                    print_error(f"Smart merge failed for {template_path}: {e}")
+                    conflict_resolutions[template_path] = ConflictResolution.SKIP
+
+        if pipeline.usage.requests:
+            console.print(f"\n[dim]{pipeline.usage.summary()}[/dim]")
 
     # Convert any remaining SMART_MERGE_SENTINEL to SKIP
     final_resolutions: dict[str, ConflictResolution] = {}
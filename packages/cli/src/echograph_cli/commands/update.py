@@ -1,17 +1,34 @@
 """Update command - update templates with three-way merge."""
 
+from collections import deque
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Annotated
 
 import typer
 
 from echograph_cli import __version__
+from echograph_cli.core.cache import (
+    MAX_CACHED_INPUT_CHARS,
+    DiskCache,
+    cached_three_way_merge,
+    cached_three_way_merge_sections,
+    get_merge_cache,
+)
+from echograph_cli.core.fileio import atomic_write_chunks, atomic_write_text
 from echograph_cli.core.interactive_merge import InteractiveMerger
-from echograph_cli.core.merge import three_way_merge, three_way_merge_sections
+from echograph_cli.core.merge import (
+    MergeBackend,
+    iter_three_way_merge,
+    iter_three_way_merge_sections,
+)
+from echograph_cli.core.models import MergeConflict, MergeStats, SectionConflict
+from echograph_cli.core.store import read_template_version, select_base_content
 from echograph_cli.core.templates import (
-    get_bundled_template,
+    get_project_config,
+    get_template_catalog,
     get_template_metadata,
-    list_template_files,
+    save_template_metadata,
 )
 from echograph_cli.output import (
     console,
@@ -23,6 +40,78 @@ from echograph_cli.output import (
 )
 
 
+def _write_merged(path: Path, chunks: Iterable[str], dry_run: bool) -> None:
+    """Stream merged content to path, or just run the merge on a dry run.
+
+    The merge is consumed chunk by chunk either way, so conflicts are
+    counted without holding the merged file in memory.
+    """
+    if dry_run:
+        deque(chunks, maxlen=0)
+    else:
+        atomic_write_chunks(path, chunks)
+
+
+def _merge_into(
+    path: Path,
+    base: str,
+    user: str,
+    new: str,
+    *,
+    is_markdown: bool,
+    stats: MergeStats,
+    cache: DiskCache | None,
+    dry_run: bool,
+    backend: MergeBackend = MergeBackend.PYTHON,
+) -> int:
+    """Three-way merge into path (section-level for markdown).
+
+    Results for the same inputs are reused from the merge cache, so a real
+    run after --dry-run doesn't merge again. Inputs too large to cache are
+    streamed to disk. backend picks the engine for line-level merges.
+
+    Returns:
+        Number of conflicts written
+    """
+    if cache is not None and len(base) + len(user) + len(new) <= MAX_CACHED_INPUT_CHARS:
+        merged, conflicts = (
+            cached_three_way_merge_sections(cache, base, user, new, stats=stats)
+            if is_markdown
+            else cached_three_way_merge(
+                cache, base, user, new, stats=stats, backend=backend
+            )
+        )
+        if not dry_run:
+            atomic_write_text(path, merged)
+        return len(conflicts)
+
+    if is_markdown:
+        section_conflicts: list[SectionConflict] = []
+        _write_merged(
+            path,
+            iter_three_way_merge_sections(
+                base, user, new, stats=stats, conflicts=section_conflicts
+            ),
+            dry_run,
+        )
+        return len(section_conflicts)
+
+    line_conflicts: list[MergeConflict] = []
+    _write_merged(
+        path,
+        iter_three_way_merge(
+            base,
+            user,
+            new,
+            stats=stats,
+            conflicts=line_conflicts,
+            backend=backend,
+        ),
+        dry_run,
+    )
+    return len(line_conflicts)
+
+
 def update_command(
     path: Annotated[
         Path,
@@ -50,6 +139,17 @@ def update_command(
             help="Interactive merge mode with visual diff and three-panel view",
         ),
     ] = False,
+    merge_backend: Annotated[
+        MergeBackend,
+        typer.Option(
+            "--merge-backend",
+            help=(
+                "Line merge engine: python, git (git merge-file), or auto "
+                "(git for large files); git can align repeated lines differently"
+            ),
+            case_sensitive=False,
+        ),
+    ] = MergeBackend.PYTHON,
 ) -> None:
     """Update templates preserving your customizations.
 
@@ -72,19 +172,28 @@ def update_command(
         )
         raise typer.Exit(1)
 
-    metadata = get_template_metadata(metadata_file)
-    base_version = metadata.get("template_version", "unknown")
+    # Version check only reads the head of the index
+    try:
+        base_version = read_template_version(metadata_file) or "unknown"
+    except ValueError:
+        base_version = "unknown"
     current_version = __version__
 
     if base_version == current_version:
         print_info("Templates are already up to date.")
         return
 
+    metadata = get_template_metadata(metadata_file)
+
     console.print(
         f"[dim]Updating templates from {base_version} to {current_version}[/dim]\n"
     )
 
-    template_files = list_template_files("full")
+    # Render with the project config so new content is comparable to the
+    # rendered base stored at init time
+    catalog = get_template_catalog()
+    config = get_project_config(path)
+    template_files = catalog.list_files("full")
 
     # Check for existing interactive merge session
     if interactive:
@@ -98,6 +207,10 @@ def update_command(
 
     updated_count = 0
     conflict_count = 0
+    stats = MergeStats()
+    cache = get_merge_cache()
+    # New template contents, recorded as the next base snapshot
+    new_contents: dict[str, str] = {}
 
     with create_progress() as progress:
         task = progress.add_task("Checking files...", total=len(template_files))
@@ -105,21 +218,23 @@ def update_command(
         for template_rel_path in template_files:
             progress.advance(task)
             user_file = path / template_rel_path
+            new_content = catalog.render(template_rel_path, config)
+            new_contents[template_rel_path] = new_content
 
             if not user_file.exists():
                 # New file in template - just copy
                 if not dry_run:
                     user_file.parent.mkdir(parents=True, exist_ok=True)
-                    content = get_bundled_template(template_rel_path)
-                    user_file.write_text(content, encoding="utf-8")
+                    user_file.write_text(new_content, encoding="utf-8")
                 print_success(f"Added {template_rel_path}")
                 updated_count += 1
                 continue
 
-            # Get base, user, and new content
-            base_content = metadata.get("files", {}).get(template_rel_path, "")
+            # Get user content and the base version it was last synced to
             user_content = user_file.read_text(encoding="utf-8")
-            new_content = get_bundled_template(template_rel_path)
+            base_content = select_base_content(
+                metadata_file, metadata, template_rel_path
+            )
 
             # Skip if no changes in template
             if base_content == new_content:
@@ -151,44 +266,33 @@ def update_command(
                     conflict_count += file_conflicts
                 else:
                     print_success(f"Merged {template_rel_path}")
-            elif is_markdown:
-                # Use section-level merge for markdown files
-                merged, conflicts = three_way_merge_sections(
-                    base_content, user_content, new_content
-                )
-
-                if conflicts:
-                    if not dry_run:
-                        user_file.write_text(merged, encoding="utf-8")
-                    print_warning(
-                        f"Updated {template_rel_path} "
-                        f"with {len(conflicts)} section conflict(s)"
-                    )
-                    conflict_count += len(conflicts)
-                else:
-                    if not dry_run:
-                        user_file.write_text(merged, encoding="utf-8")
-                    print_success(f"Merged {template_rel_path}")
             else:
-                # Use line-level merge for other files
-                merged, conflicts = three_way_merge(
-                    base_content, user_content, new_content
+                file_conflicts = _merge_into(
+                    user_file,
+                    base_content,
+                    user_content,
+                    new_content,
+                    is_markdown=is_markdown,
+                    stats=stats,
+                    cache=cache,
+                    dry_run=dry_run,
+                    backend=merge_backend,
                 )
-
-                if conflicts:
-                    if not dry_run:
-                        user_file.write_text(merged, encoding="utf-8")
+                if file_conflicts:
+                    kind = "section conflict(s)" if is_markdown else "conflict(s)"
                     print_warning(
-                        f"Updated {template_rel_path} with {len(conflicts)} conflict(s)"
+                        f"Updated {template_rel_path} with {file_conflicts} {kind}"
                     )
-                    conflict_count += len(conflicts)
+                    conflict_count += file_conflicts
                 else:
-                    if not dry_run:
-                        user_file.write_text(merged, encoding="utf-8")
                     print_success(f"Merged {template_rel_path}")
 
             updated_count += 1
 
+    # Record this release as the base for the next update
+    if not dry_run:
+        save_template_metadata(metadata_file, new_contents, current_version)
+
     # Summary
     console.print()
     if dry_run:
@@ -198,6 +302,11 @@ def update_command(
         print_info("No updates needed.")
     else:
         console.print(f"[bold]Updated {updated_count} file(s)[/bold]")
+        if stats.auto_resolved:
+            print_info(
+                f"Auto-resolved {stats.auto_resolved} overlapping edit(s) "
+                "at line/word level"
+            )
         if conflict_count > 0:
             marker_hint = (
                 "<!-- CONFLICT:"
@@ -1,14 +1,31 @@
 """AI-assisted merge using Claude API."""
 
+import asyncio
+import random
+import re
+import threading
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future
 from dataclasses import dataclass
+from functools import partial
+from typing import Any, TypeVar
 
 from rich.console import Console
+from rich.markup import escape
 from rich.status import Status
 
-from echograph_cli.core.merge import (
-    ConflictMarkerStyle,
-    three_way_merge_sections,
+from echograph_cli.core.cache import (
+    ai_cache_key,
+    cached_three_way_merge_sections,
+    get_ai_cache,
+    get_merge_cache,
+    load_ai_response,
+    store_ai_response,
 )
+from echograph_cli.core.diff import diff_lines, similarity_ratio
+from echograph_cli.core.merge import ConflictMarkerStyle
+from echograph_cli.core.models import AIUsage, MergeStats
+from echograph_cli.core.new_sections import MIN_LOCAL_CONFIDENCE, detect_new_sections
 from echograph_cli.output import print_unified_diff
 
 
@@ -38,7 +55,6 @@ def _normalize_whitespace(content: str) -> str:
     while "\n\n\n" in text:
         text = text.replace("\n\n\n", "\n\n")
     # Remove blank lines after headers (## Header\n\n -> ## Header\n)
-    import re
     text = re.sub(r"(^#+\s+.+)\n\n+", r"\1\n", text, flags=re.MULTILINE)
     # Remove blank lines before headers
     text = re.sub(r"\n\n+(#+\s+)", r"\n\n\1", text)
@@ -57,24 +73,18 @@ def is_whitespace_only_diff(content1: str, content2: str) -> bool:
     if _normalize_whitespace(content1) == _normalize_whitespace(content2):
         return True
 
-    # If that fails, check if diff only contains blank line changes
-    import difflib
-
+    # If that fails, check if the diff only adds or removes blank lines
     lines1 = content1.replace("\r\n", "\n").split("\n")
     lines2 = content2.replace("\r\n", "\n").split("\n")
 
-    diff = list(difflib.unified_diff(lines1, lines2, lineterm=""))
-
-    # Check each changed line - if all changes are blank/whitespace-only, skip
-    for line in diff:
-        if line.startswith("---") or line.startswith("+++") or line.startswith("@@"):
+    for tag, i1, i2, j1, j2 in diff_lines(lines1, lines2):
+        if tag == "equal":
             continue
-        if line.startswith("-") or line.startswith("+"):
-            # Get the actual content (skip the +/- prefix)
-            content = line[1:]
-            # If this changed line has non-whitespace content, it's a real change
-            if content.strip():
-                return False
+        # If a changed line has non-whitespace content, it's a real change
+        if any(line.strip() for line in lines1[i1:i2]):
+            return False
+        if any(line.strip() for line in lines2[j1:j2]):
+            return False
 
     return True
 
@@ -85,8 +95,6 @@ def is_placeholder_only_diff(user_content: str, template_content: str) -> bool:
     Detects when user's file is the template with [[PLACEHOLDER]] values replaced.
     In this case, the user's content is "correct" and no merge is needed.
     """
-    import re
-
     # Find all placeholders in template like [[PROJECT_NAME]], [[AUTHOR]], etc.
     placeholders = re.findall(r"\[\[([A-Z_]+)\]\]", template_content)
 
@@ -124,14 +132,10 @@ def is_high_similarity(
     since they haven't made significant customizations and the template
     hasn't changed significantly.
     """
-    import difflib
-
-    # Use SequenceMatcher to compute similarity ratio
     user_normalized = _normalize_whitespace(user_content)
     template_normalized = _normalize_whitespace(template_content)
 
     # Replace placeholders in template with user's likely values for better matching
-    import re
     # Find placeholders and their approximate positions
     for match in re.finditer(r"\[\[([A-Z_]+)\]\]", template_normalized):
         # Replace with a generic marker for comparison
@@ -139,13 +143,22 @@ def is_high_similarity(
             match.group(0), "PLACEHOLDER_VALUE"
         )
 
-    ratio = difflib.SequenceMatcher(
-        None, user_normalized, template_normalized
-    ).ratio()
+    ratio = similarity_ratio(user_normalized, template_normalized)
 
     return ratio >= threshold
 
 
+AI_MODEL = "claude-sonnet-4-20250514"
+AI_MAX_TOKENS = 8192
+
+# Status codes worth retrying: rate limited, overloaded or briefly unavailable
+_RETRY_STATUS = frozenset({429, 500, 502, 503, 504, 529})
+AI_MAX_RETRIES = 5
+# Backoff when the API doesn't say how long to wait: 1s, 2s, 4s ... up to 30s
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+
 # New prompt strategy: Instead of asking AI to merge (which fails),
 # we ask it to ONLY identify new sections to append.
 # This is much safer - user content is never touched.
@@ -180,24 +193,28 @@ NONE
 - No new sections found in template
 ```"""
 
-EXTRACT_NEW_SECTIONS_USER = """Find NEW sections in the template that don't exist
-in the user's file.
+# The request is ordered system prompt, template, user file so the first
+# two form a prefix shared by every file merged against the same template.
+EXTRACT_NEW_SECTIONS_TEMPLATE = """\
+## Template (find NEW sections from this):
+```
+{template_content}
+```"""
 
+EXTRACT_NEW_SECTIONS_USER = """\
 ## User's Current File (DO NOT MODIFY - only check what sections exist):
 ```
 {user_content}
 ```
 
-## Template (find NEW sections from this):
-```
-{template_content}
-```
-
 ## File: {filename}
 
+Find NEW sections in the template above that don't exist in the user's file.
 List the section headers in each file, then output any genuinely NEW sections
 from the template that should be appended to the user's file."""
 
+_CACHE_CONTROL = {"type": "ephemeral"}
+
 # Keep old prompt for backwards compatibility but mark as deprecated
 MERGE_SYSTEM_PROMPT = EXTRACT_NEW_SECTIONS_SYSTEM
 
@@ -221,14 +238,8 @@ Analyze what the user has customized vs what is boilerplate, then output the mer
 content and brief summary in the specified format."""
 
 
-def get_anthropic_client(interactive: bool = True):
-    """Get Anthropic client, prompting for key if needed.
-
-    Args:
-        interactive: If True, prompt user for API key if not set.
-
-    Returns:
-        Configured Anthropic client.
+def _anthropic_module_and_key(interactive: bool) -> tuple[Any, str]:
+    """Import anthropic and find the API key, prompting for it if allowed.
 
     Raises:
         ImportError: If anthropic package not installed.
@@ -260,9 +271,47 @@ def get_anthropic_client(interactive: bool = True):
             "Or run interactively to be prompted."
         )
 
+    return anthropic, api_key
+
+
+def get_anthropic_client(interactive: bool = True) -> Any:
+    """Get Anthropic client, prompting for key if needed.
+
+    Args:
+        interactive: If True, prompt user for API key if not set.
+
+    Returns:
+        Configured Anthropic client.
+
+    Raises:
+        ImportError: If anthropic package not installed.
+        ValueError: If API key not available.
+    """
+    anthropic, api_key = _anthropic_module_and_key(interactive)
     return anthropic.Anthropic(api_key=api_key)
 
 
+def get_async_anthropic_client(interactive: bool = True) -> Any:
+    """Get AsyncAnthropic client, prompting for key if needed.
+
+    The SDK's own retries are turned off; AIMergePipeline retries rate
+    limited and overloaded requests itself so it can pause every worker
+    when the API asks for it.
+
+    Args:
+        interactive: If True, prompt user for API key if not set.
+
+    Returns:
+        Configured AsyncAnthropic client.
+
+    Raises:
+        ImportError: If anthropic package not installed.
+        ValueError: If API key not available.
+    """
+    anthropic, api_key = _anthropic_module_and_key(interactive)
+    return anthropic.AsyncAnthropic(api_key=api_key, max_retries=0)
+
+
 def detect_file_type(filename: str) -> str:
     """Detect file type for context in AI prompt."""
     ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
@@ -296,8 +345,6 @@ def _parse_sections_response(response_text: str) -> tuple[str | None, str]:
     Returns:
         Tuple of (new_sections or None if NONE, explanation)
     """
-    import re
-
     # Extract sections content
     sections_match = re.search(r"```sections\n(.*?)```", response_text, re.DOTALL)
     if sections_match:
@@ -334,46 +381,234 @@ def _parse_merge_response(response_text: str) -> tuple[str, str]:
     return sections or "", explanation
 
 
+class SectionsStreamParser:
+    """Incremental parser for a streamed extract-sections answer.
+
+    Text is fed as it arrives and the ```sections block is read line by
+    line. The parser notices when the block has closed, or opened with a
+    NONE verdict, so the caller can stop the stream without waiting for
+    (and paying for) the summary. Template sections can hold code blocks
+    opened by a bare ```, so a bare ``` line only counts as the end of
+    the block once the ```summary line follows it. If prose follows the
+    closing ``` instead, that ``` is first taken to open a code block;
+    when ```summary (or the end of the stream) arrives with that block
+    still open, the ``` was the close after all and the prose is dropped.
+    """
+
+    _OPEN = "```sections"
+
+    def __init__(self) -> None:
+        """Initialize an empty parser."""
+        self.text = ""
+        self.done = False
+        self._lines: list[str] | None = None  # Block lines, once it opens
+        self._pending = ""  # Incomplete last line
+        self._nested = False  # Inside a code block within the sections
+        self._maybe_end: int | None = None  # Line index of a bare ``` to confirm
+        self._reopened: int | None = None  # Same, once taken as a code block
+        self.last_header = ""  # Latest section header received
+
+    def feed(self, delta: str) -> None:
+        """Add streamed text; sets done once the answer is known."""
+        self.text += delta
+        if self.done:
+            return
+        self._pending += delta
+        *lines, self._pending = self._pending.split("\n")
+        for line in lines:
+            self._feed_line(line.rstrip("\r"))
+            if self.done:
+                return
+
+    def _feed_line(self, line: str) -> None:
+        """Handle one complete line of the answer."""
+        if self._lines is None:
+            if line.strip() == self._OPEN:
+                self._lines = []
+            return
+        fence = line.strip()
+        if fence.startswith("```summary"):
+            # Sections are over; drop anything after their closing ```
+            end = self._block_end()
+            if end is not None:
+                del self._lines[end:]
+            self.done = True
+            return
+        if self._maybe_end is not None:
+            if not fence:
+                self._lines.append(line)
+                return
+            # The bare ``` opened a code block (or closed the sections and
+            # prose follows); this line belongs to it
+            self._reopened, self._maybe_end = self._maybe_end, None
+            self._nested = True
+        if fence == "```" and not self._nested:
+            self._maybe_end = len(self._lines)
+            self._lines.append(line)
+            return
+        if not self._nested and fence.startswith("```"):
+            self._nested = True  # ```lang opens a code block
+        elif self._nested and fence == "```":
+            self._nested = False
+            self._reopened = None  # It was a real code block
+        elif fence.upper() == "NONE" and not any(map(str.strip, self._lines)):
+            self.done = True  # Nothing new; the rest is boilerplate
+        elif not self._nested and fence.startswith("#"):
+            self.last_header = fence
+        self._lines.append(line)
+
+    def _block_end(self) -> int | None:
+        """Line index where the sections block ended, if a ``` closed it."""
+        if self._maybe_end is not None:
+            return self._maybe_end
+        if self._nested:
+            return self._reopened
+        return None
+
+    @property
+    def line_count(self) -> int:
+        """Number of complete section lines received so far."""
+        return len(self._lines or ())
+
+    @property
+    def partial(self) -> str:
+        """The new sections received so far."""
+        if self._lines is None:
+            return ""
+        if self._maybe_end is not None:
+            return "\n".join(self._lines[: self._maybe_end])
+        # An unfinished fence line can't be classified yet; leave it out
+        if self.done or self._pending.lstrip().startswith("`"):
+            return "\n".join(self._lines)
+        return "\n".join([*self._lines, self._pending])
+
+    def result(self) -> tuple[str | None, str]:
+        """Parse what was received, like _parse_sections_response.
+
+        Returns:
+            Tuple of (new_sections or None, explanation); the explanation
+            lists the new headers if the stream stopped before the summary
+        """
+        if not self.done and self._pending:
+            # The stream ended without a final newline; classify that line
+            line, self._pending = self._pending, ""
+            self._feed_line(line.rstrip("\r"))
+
+        if self._lines is None:
+            return _parse_sections_response(self.text)
+
+        if not self.done and self._reopened is not None and self._nested:
+            # Stream ended inside a "code block" - it was prose after the close
+            sections: str | None = "\n".join(self._lines[: self._reopened]).strip()
+        else:
+            sections = self.partial.strip()
+        if not sections or sections.upper() == "NONE":
+            return None, "No new sections found in template"
+
+        summary = re.search(r"```summary\n(.*?)```", self.text, re.DOTALL)
+        if summary:
+            return sections, summary.group(1).strip()
+        titles = re.findall(r"^#{1,6}[ \t]+(.+?)[ \t]*$", sections, re.MULTILINE)
+        if not titles:
+            return sections, "Found new sections to append"
+        return sections, "\n".join(f"- New section: {t}" for t in titles)
+
+
+def _extract_request(
+    user_content: str, template_content: str, filename: str
+) -> dict[str, Any]:
+    """Keyword arguments for the messages.create call that extracts sections.
+
+    The system prompt and template come first, with a cache breakpoint
+    after the template, so merging more files against the same template
+    reads that prefix from the prompt cache; only the user's file is new
+    input each time. (The system prompt alone is below the minimum
+    cacheable length, so it gets no breakpoint of its own.)
+    """
+    template_block = EXTRACT_NEW_SECTIONS_TEMPLATE.format(
+        template_content=template_content
+    )
+    user_block = EXTRACT_NEW_SECTIONS_USER.format(
+        user_content=user_content, filename=filename
+    )
+    return {
+        "model": AI_MODEL,
+        "max_tokens": AI_MAX_TOKENS,
+        "system": [{"type": "text", "text": EXTRACT_NEW_SECTIONS_SYSTEM}],
+        "messages": [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": template_block,
+                        "cache_control": _CACHE_CONTROL,
+                    },
+                    {"type": "text", "text": user_block},
+                ],
+            }
+        ],
+    }
+
+
 def ai_extract_new_sections(
     user_content: str,
     template_content: str,
     filename: str,
+    use_cache: bool = True,
+    usage: AIUsage | None = None,
+    on_progress: Callable[[SectionsStreamParser], None] | None = None,
 ) -> tuple[str | None, str]:
     """Use Claude to identify NEW sections in template not in user's file.
 
     This is safer than asking AI to merge - it only extracts new content
-    to append, never modifying user's existing content.
+    to append, never modifying user's existing content. The answer is
+    streamed and the stream closed as soon as the sections are complete.
 
     Args:
         user_content: User's current file content
         template_content: New template content
         filename: Name of the file being merged
+        use_cache: If True, reuse an earlier answer to the same request
+        usage: Optional token counters, updated if the API is called
+        on_progress: Called with the parser as streamed text arrives
 
     Returns:
         Tuple of (new_sections_to_append or None, explanation)
     """
-    client = get_anthropic_client()
+    request = _extract_request(user_content, template_content, filename)
+    cache = get_ai_cache() if use_cache else None
+    key = ai_cache_key(request)
+    cached = load_ai_response(cache, key)
+    if cached is not None:
+        return cached
 
-    user_prompt = EXTRACT_NEW_SECTIONS_USER.format(
-        user_content=user_content,
-        template_content=template_content,
-        filename=filename,
-    )
+    client = get_anthropic_client()
 
-    response = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=8192,
-        system=EXTRACT_NEW_SECTIONS_SYSTEM,
-        messages=[{"role": "user", "content": user_prompt}],
-    )
+    parser = SectionsStreamParser()
+    # Leaving the block early closes the connection and stops generation
+    with client.messages.stream(**request) as stream:
+        for text in stream.text_stream:
+            parser.feed(text)
+            if on_progress is not None:
+                on_progress(parser)
+            if parser.done:
+                break
+        if usage is not None:
+            usage.add(stream.current_message_snapshot.usage)
 
-    return _parse_sections_response(response.content[0].text)
+    new_sections, explanation = parser.result()
+    store_ai_response(cache, key, new_sections, explanation)
+    return new_sections, explanation
 
 
 def ai_merge_content(
     user_content: str,
     template_content: str,
     filename: str,
+    use_cache: bool = True,
+    usage: AIUsage | None = None,
+    on_progress: Callable[[SectionsStreamParser], None] | None = None,
 ) -> tuple[str, str]:
     """Extract new sections and append to user content.
 
@@ -384,24 +619,298 @@ def ai_merge_content(
         user_content: User's current file content
         template_content: New template content
         filename: Name of the file being merged
+        use_cache: If True, reuse an earlier answer to the same request
+        usage: Optional token counters, updated if the API is called
+        on_progress: Called with the parser as streamed text arrives
 
     Returns:
         Tuple of (merged_content, explanation)
     """
     new_sections, explanation = ai_extract_new_sections(
-        user_content, template_content, filename
+        user_content, template_content, filename, use_cache, usage, on_progress
     )
 
+    return _append_sections(user_content, new_sections), explanation
+
+
+def _append_sections(user_content: str, new_sections: str | None) -> str:
+    """Append new sections to user content, unchanged if there are none."""
     if new_sections is None:
         # No new sections - return user content unchanged
-        return user_content, explanation
+        return user_content
 
     # Append new sections to user content
     # Ensure proper spacing between existing content and new sections
     user_stripped = user_content.rstrip()
-    merged = f"{user_stripped}\n\n{new_sections}\n"
+    return f"{user_stripped}\n\n{new_sections}\n"
 
-    return merged, explanation
+
+# (user_content, template_content, filename) -> (merged_content, explanation)
+AIMerge = Callable[[str, str, str], tuple[str, str]]
+
+_T = TypeVar("_T")
+
+# Transport failures the SDK raises without a status code
+_RETRY_ERROR_NAMES = frozenset({"APIConnectionError", "APITimeoutError"})
+
+
+def retry_delay(error: BaseException, attempt: int) -> float | None:
+    """Seconds to wait before retrying a failed API call, or None to give up.
+
+    Rate limited and overloaded responses are retried after their
+    retry-after header; other transient failures back off exponentially.
+
+    Args:
+        error: Exception raised by the API call
+        attempt: Number of retries already made
+    """
+    if attempt >= AI_MAX_RETRIES:
+        return None
+    transient = any(cls.__name__ in _RETRY_ERROR_NAMES for cls in type(error).__mro__)
+    if not transient and getattr(error, "status_code", None) not in _RETRY_STATUS:
+        return None
+
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    for name, seconds in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        try:
+            return max(0.0, float(headers[name]) * seconds)
+        except (KeyError, TypeError, ValueError):
+            continue  # Missing, or an HTTP date
+
+    delay = min(RETRY_BASE_DELAY * 2.0**attempt, RETRY_MAX_DELAY)
+    # Jitter so workers that failed together don't retry together
+    return delay * (1 + random.random() / 4)
+
+
+class AIMergePipeline:
+    """Runs AI section extraction for many files concurrently.
+
+    Requests go out on an asyncio loop in a background thread, at most
+    max_concurrency at a time, while the caller previews and approves
+    results on the main thread one file at a time, in order. When the API
+    asks for a pause (retry-after), every worker waits before sending more.
+
+    The client is created on the first request, so a batch that never
+    needs the AI never asks for an API key.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        client_factory: Callable[[], Any] | None = None,
+        use_cache: bool = True,
+    ) -> None:
+        """Initialize a pipeline; nothing starts until the first request.
+
+        Args:
+            max_concurrency: Most requests in flight at once
+                (default: ECHOGRAPH_AI_CONCURRENCY, or 4)
+            client_factory: Creates the async client
+                (default: get_async_anthropic_client)
+            use_cache: If True, answer repeated requests from the AI
+                response cache
+        """
+        from echograph_cli.core.config import get_ai_concurrency
+
+        self.max_concurrency = max_concurrency or get_ai_concurrency()
+        self._use_cache = use_cache
+        self._cache = get_ai_cache() if use_cache else None
+        self.usage = AIUsage()  # Updated from the background thread
+        self._client_factory = client_factory or get_async_anthropic_client
+        self._client: Any = None
+        self._client_error: Exception | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._resume_at = 0.0
+
+    def __enter__(self) -> "AIMergePipeline":
+        """Return the pipeline; requests start as files are submitted."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Cancel unfinished requests and stop the background loop."""
+        self.close()
+
+    def prefetch(
+        self,
+        user_content: str,
+        template_content: str,
+        filename: str,
+        base_content: str = "",
+    ) -> AIMerge:
+        """Start the AI request for a file now if smart_merge_file will need it.
+
+        Returns:
+            An ai_merge function for smart_merge_file that waits for this
+            request instead of making its own
+        """
+        if not needs_ai_merge(user_content, template_content, filename, base_content):
+            # Usually unused; if the AI is needed after all, keep the
+            # pipeline's cache setting
+            return partial(ai_merge_content, use_cache=self._use_cache)
+        future = self.submit(user_content, template_content, filename)
+
+        def merge(user: str, template: str, name: str) -> tuple[str, str]:
+            new_sections, explanation = future.result()
+            return _append_sections(user, new_sections), explanation
+
+        return merge
+
+    def submit(
+        self, user_content: str, template_content: str, filename: str
+    ) -> Future[tuple[str | None, str]]:
+        """Queue ai_extract_new_sections for a file.
+
+        Returns:
+            Future of (new_sections_to_append or None, explanation). It
+            raises the client's ImportError/ValueError if no client could
+            be created, or the API error once retries are exhausted.
+        """
+        request = _extract_request(user_content, template_content, filename)
+        key = ai_cache_key(request)
+        cached = load_ai_response(self._cache, key)
+        if cached is not None:
+            done: Future[tuple[str | None, str]] = Future()
+            done.set_result(cached)
+            return done
+
+        if self._client is None and self._client_error is None:
+            try:
+                self._client = self._client_factory()
+            except (ImportError, ValueError) as e:
+                self._client_error = e  # Ask for the key once, not per file
+
+        if self._client_error is not None:
+            failed: Future[tuple[str | None, str]] = Future()
+            failed.set_exception(self._client_error)
+            return failed
+
+        return self._run(self._extract(request, key))
+
+    def close(self) -> None:
+        """Cancel unfinished requests and stop the background loop."""
+        if self._loop is None or self._thread is None:
+            return
+        try:
+            self._run(self._shutdown()).result()
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = self._thread = None
+
+    def _run(self, coro: Coroutine[Any, Any, _T]) -> Future[_T]:
+        """Schedule a coroutine on the background loop, starting it if needed."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._loop.run_forever, name="echograph-ai", daemon=True
+            )
+            self._thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    async def _extract(
+        self, request: dict[str, Any], key: str
+    ) -> tuple[str | None, str]:
+        """Stream new sections, retrying transient API failures."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._semaphore:
+            attempt = 0
+            while True:
+                await asyncio.sleep(max(0.0, self._resume_at - loop.time()))
+                parser = SectionsStreamParser()
+                try:
+                    async with self._client.messages.stream(**request) as stream:
+                        async for text in stream.text_stream:
+                            parser.feed(text)
+                            if parser.done:
+                                break  # Closes the stream; skip the summary
+                        usage = stream.current_message_snapshot.usage
+                except Exception as error:
+                    delay = retry_delay(error, attempt)
+                    if delay is None:
+                        raise
+                    self._resume_at = max(self._resume_at, loop.time() + delay)
+                    attempt += 1
+                else:
+                    break
+
+        self.usage.add(usage)
+        result = parser.result()
+        store_ai_response(self._cache, key, *result)
+        return result
+
+    async def _shutdown(self) -> None:
+        """Cancel outstanding requests and close the client."""
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        close = getattr(self._client, "close", None)
+        if close is not None:
+            await close()
+
+
+# (check, console message, explanation) for files that need no merge
+_SKIP_CHECKS: tuple[tuple[Callable[[str, str], bool], str, str], ...] = (
+    (
+        is_whitespace_only_diff,
+        "whitespace differences only",
+        "Skipped - only whitespace differences",
+    ),
+    (
+        # User's file is just the template with placeholders filled in
+        is_placeholder_only_diff,
+        "placeholder substitutions only",
+        "Skipped - template with placeholders filled",
+    ),
+    (
+        is_high_similarity,
+        "files nearly identical",
+        "Skipped - files are >95% similar, keeping user version",
+    ),
+)
+
+
+def _skip_reason(user_content: str, template_content: str) -> tuple[str, str] | None:
+    """Return (console message, explanation) if the file needs no merge."""
+    for check, message, explanation in _SKIP_CHECKS:
+        if check(user_content, template_content):
+            return message, explanation
+    return None
+
+
+def needs_ai_merge(
+    user_content: str,
+    template_content: str,
+    filename: str,
+    base_content: str = "",
+) -> bool:
+    """Check, without output, whether smart_merge_file would call the AI.
+
+    Lets a batch start its API requests before reviewing the first file.
+    The section merge result is cached, so smart_merge_file reuses it.
+    """
+    if _skip_reason(user_content, template_content) is not None:
+        return False
+    if not filename.endswith(".md"):
+        return True
+    _, conflicts = cached_three_way_merge_sections(
+        get_merge_cache(),
+        base_content,
+        user_content,
+        template_content,
+        ConflictMarkerStyle.HTML_COMMENT,
+    )
+    if not conflicts:
+        return False
+    local = detect_new_sections(user_content, template_content)
+    return local.confidence < MIN_LOCAL_CONFIDENCE
 
 
 def smart_merge_file(
@@ -410,11 +919,16 @@ def smart_merge_file(
     filename: str,
     console: Console,
     auto_approve: bool = False,
+    base_content: str = "",
+    ai_merge: AIMerge | None = None,
+    ai_cache: bool = True,
 ) -> AIMergeResult:
     """Perform smart merge with preview and approval flow.
 
-    For markdown files, uses section-level merge first.
-    For other files or when sections conflict, uses AI merge.
+    For markdown files, uses section-level merge first. When sections
+    conflict, the template's new sections are found from the outlines
+    (see detect_new_sections); the AI is only asked when that answer is
+    uncertain, and for other files.
 
     Args:
         user_content: User's current file content
@@ -422,6 +936,13 @@ def smart_merge_file(
         filename: Name of the file being merged
         console: Rich console for output
         auto_approve: If True, skip confirmation prompt
+        base_content: Template version the user's file started from, if
+            known. Lets sections both sides edited merge locally by line
+            and word instead of going to the AI.
+        ai_merge: Replaces ai_merge_content for the AI step, e.g. with a
+            request AIMergePipeline.prefetch already started
+        ai_cache: If False, ask the AI again even if it already answered
+            for the same files
 
     Returns:
         AIMergeResult with merged content and metadata
@@ -433,63 +954,50 @@ def smart_merge_file(
 
     # Check for interrupt before any processing
     try:
-        # Skip if only whitespace differences
-        if is_whitespace_only_diff(user_content, template_content):
-            console.print(
-                f"[dim]Skipping {filename} - whitespace differences only[/dim]"
-            )
-            return AIMergeResult(
-                merged_content=user_content,
-                explanation="Skipped - only whitespace differences",
-                had_conflicts=False,
-                user_approved=True,
-                was_skipped_whitespace=True,
-            )
-
-        # Skip if user's file is just the template with placeholders filled in
-        if is_placeholder_only_diff(user_content, template_content):
-            console.print(
-                f"[dim]Skipping {filename} - placeholder substitutions only[/dim]"
-            )
-            return AIMergeResult(
-                merged_content=user_content,
-                explanation="Skipped - template with placeholders filled",
-                had_conflicts=False,
-                user_approved=True,
-                was_skipped_whitespace=True,
-            )
-
-        # Skip if files are >95% similar
-        if is_high_similarity(user_content, template_content):
-            console.print(
-                f"[dim]Skipping {filename} - files nearly identical[/dim]"
-            )
-            return AIMergeResult(
-                merged_content=user_content,
-                explanation="Skipped - files are >95% similar, keeping user version",
-                had_conflicts=False,
-                user_approved=True,
-                was_skipped_whitespace=True,
-            )
+        skip = _skip_reason(user_content, template_content)
     except KeyboardInterrupt:
         console.print("\n[yellow]Aborted by user[/yellow]")
         raise typer.Exit(1)
 
+    if skip is not None:
+        message, explanation = skip
+        console.print(f"[dim]Skipping {filename} - {message}[/dim]")
+        return AIMergeResult(
+            merged_content=user_content,
+            explanation=explanation,
+            had_conflicts=False,
+            user_approved=True,
+            was_skipped_whitespace=True,
+        )
+
     is_markdown = filename.endswith(".md")
+    found_locally = False
+    merged_content = ""
+    explanation = ""
 
     # For markdown, try section-level merge first
     if is_markdown:
+        stats = MergeStats()
         try:
-            merged, conflicts = three_way_merge_sections(
-                "",  # No base version
+            # Repeated init attempts reuse the earlier merge result
+            merged, conflicts = cached_three_way_merge_sections(
+                get_merge_cache(),
+                base_content,
                 user_content,
                 template_content,
                 ConflictMarkerStyle.HTML_COMMENT,
+                stats=stats,
             )
         except KeyboardInterrupt:
             console.print("\n[yellow]Aborted by user[/yellow]")
             raise typer.Exit(1)
 
+        if stats.auto_resolved:
+            console.print(
+                f"[dim]Resolved {stats.auto_resolved} overlapping section "
+                f"edit(s) in {filename} locally[/dim]"
+            )
+
         if not conflicts:
             # Clean merge - no AI needed
             # But still check if merged content is different from user's content
@@ -542,64 +1050,99 @@ def smart_merge_file(
                     user_approved=False,
                 )
 
-        # Has conflicts - use AI to resolve
-        console.print(
-            f"[yellow]Found {len(conflicts)} section conflict(s) - "
-            f"using AI to resolve[/yellow]"
-        )
-
-    # Use AI merge with spinner
-    merged_content = ""
-    explanation = ""
-
-    with Status(
-        f"[cyan]Analyzing {filename}... (you'll review before any changes)[/cyan]",
-        console=console,
-        spinner="dots",
-    ) as status:
-        try:
-            merged_content, explanation = ai_merge_content(
-                user_content,
-                template_content,
-                filename,
-            )
-        except KeyboardInterrupt:
-            status.stop()
-            console.print("\n[yellow]Aborted by user[/yellow]")
-            raise typer.Exit(1)
-        except ImportError as e:
-            status.stop()
-            console.print(f"[red]{e}[/red]")
-            return AIMergeResult(
-                merged_content=user_content,
-                explanation="AI merge unavailable - kept original",
-                had_conflicts=True,
-                user_approved=False,
-            )
-        except ValueError as e:
-            status.stop()
-            console.print(f"[red]{e}[/red]")
-            return AIMergeResult(
-                merged_content=user_content,
-                explanation="AI merge unavailable - kept original",
-                had_conflicts=True,
-                user_approved=False,
+        # Has conflicts. The AI would only add the template's missing
+        # sections, which the outlines usually answer on their own
+        local = detect_new_sections(user_content, template_content)
+        found_locally = local.confidence >= MIN_LOCAL_CONFIDENCE
+        if found_locally:
+            console.print(
+                f"[yellow]Found {len(conflicts)} section conflict(s) - "
+                f"keeping your sections[/yellow]"
             )
-        except Exception as e:
-            status.stop()
-            console.print(f"[red]AI merge failed: {e}[/red]")
-            return AIMergeResult(
-                merged_content=user_content,
-                explanation=f"AI merge failed: {e}",
-                had_conflicts=True,
-                user_approved=False,
+            if local.content is None:
+                console.print(
+                    f"[dim]Skipping {filename} - no new template sections[/dim]"
+                )
+                return AIMergeResult(
+                    merged_content=user_content,
+                    explanation="Skipped - no new sections in template",
+                    had_conflicts=False,
+                    user_approved=True,
+                    was_skipped_whitespace=True,
+                )
+            merged_content = _append_sections(user_content, local.content)
+            explanation = "\n".join(f"- New section: {t}" for t in local.titles)
+        else:
+            console.print(
+                f"[yellow]Found {len(conflicts)} section conflict(s) - "
+                f"using AI to resolve[/yellow]"
             )
 
+    if not found_locally:
+        # Use AI merge with spinner
+        with Status(
+            f"[cyan]Analyzing {filename}... (you'll review before any changes)[/cyan]",
+            console=console,
+            spinner="dots",
+        ) as status:
+            try:
+                if ai_merge is not None:
+                    merged_content, explanation = ai_merge(
+                        user_content, template_content, filename
+                    )
+                else:
+
+                    def show_progress(parser: SectionsStreamParser) -> None:
+                        """Show the latest new section while the answer streams."""
+                        if parser.last_header:
+                            status.update(
+                                f"[cyan]Analyzing {filename}... "
+                                f"{parser.line_count} line(s) of new sections, "
+                                f"latest: {escape(parser.last_header)}[/cyan]"
+                            )
+
+                    merged_content, explanation = ai_merge_content(
+                        user_content,
+                        template_content,
+                        filename,
+                        ai_cache,
+                        on_progress=show_progress,
+                    )
+            except KeyboardInterrupt:
+                status.stop()
+                console.print("\n[yellow]Aborted by user[/yellow]")
+                raise typer.Exit(1)
+            except ImportError as e:
+                status.stop()
+                console.print(f"[red]{e}[/red]")
+                return AIMergeResult(
+                    merged_content=user_content,
+                    explanation="AI merge unavailable - kept original",
+                    had_conflicts=True,
+                    user_approved=False,
+                )
+            except ValueError as e:
+                status.stop()
+                console.print(f"[red]{e}[/red]")
+                return AIMergeResult(
+                    merged_content=user_content,
+                    explanation="AI merge unavailable - kept original",
+                    had_conflicts=True,
+                    user_approved=False,
+                )
+            except Exception as e:
+                status.stop()
+                console.print(f"[red]AI merge failed: {e}[/red]")
+                return AIMergeResult(
+                    merged_content=user_content,
+                    explanation=f"AI merge failed: {e}",
+                    had_conflicts=True,
+                    user_approved=False,
+                )
+
     # Check if AI merge result only differs in whitespace
     if is_whitespace_only_diff(user_content, merged_content):
-        console.print(
-            f"[dim]Skipping {filename} - AI found whitespace only[/dim]"
-        )
+        console.print(f"[dim]Skipping {filename} - AI found whitespace only[/dim]")
         return AIMergeResult(
             merged_content=user_content,
             explanation="Skipped - only whitespace differences after AI analysis",
@@ -636,7 +1179,8 @@ def smart_merge_file(
         )
 
     # Show diff preview
-    console.print(f"\n[bold cyan]AI Merge Preview: {filename}[/bold cyan]")
+    source = "Section" if found_locally else "AI"
+    console.print(f"\n[bold cyan]{source} Merge Preview: {filename}[/bold cyan]")
     print_unified_diff(user_content, merged_content, filename)
 
     console.print(f"\n[dim]{explanation}[/dim]")
@@ -715,35 +1259,58 @@ def batch_smart_merge(
     files: list[tuple[str, str, str]],  # (filename, user_content, template_content)
     console: Console,
     auto_approve: bool = False,
+    max_concurrency: int | None = None,
+    ai_cache: bool = True,
 ) -> dict[str, AIMergeResult]:
     """Batch process multiple files with smart merge.
 
+    AI requests for all files start up front and overlap (see
+    AIMergePipeline); previews and approval prompts still come one file
+    at a time, in order.
+
     Args:
         files: List of (filename, user_content, template_content) tuples
         console: Rich console for output
         auto_approve: If True, skip all confirmation prompts
+        max_concurrency: Most AI requests in flight at once
+            (default: ECHOGRAPH_AI_CONCURRENCY, or 4)
+        ai_cache: If False, ask the AI again even if it already answered
+            for the same files
 
     Returns:
         Dict mapping filename to AIMergeResult
     """
     results: dict[str, AIMergeResult] = {}
 
-    for i, (filename, user_content, template_content) in enumerate(files, 1):
-        console.print(f"\n[dim]Processing {i}/{len(files)}: {filename}[/dim]")
+    with AIMergePipeline(max_concurrency, use_cache=ai_cache) as pipeline:
+        merges = [
+            pipeline.prefetch(user_content, template_content, filename)
+            for filename, user_content, template_content in files
+        ]
+
+        for i, ((filename, user_content, template_content), ai_merge) in enumerate(
+            zip(files, merges, strict=True), 1
+        ):
+            console.print(f"\n[dim]Processing {i}/{len(files)}: {filename}[/dim]")
+
+            result = smart_merge_file(
+                user_content=user_content,
+                template_content=template_content,
+                filename=filename,
+                console=console,
+                auto_approve=auto_approve,
+                ai_merge=ai_merge,
+                ai_cache=ai_cache,
+            )
 
-        result = smart_merge_file(
-            user_content=user_content,
-            template_content=template_content,
-            filename=filename,
-            console=console,
-            auto_approve=auto_approve,
-        )
+            results[filename] = result
 
-        results[filename] = result
+            if result.user_approved:
+                console.print(f"[green]Merged: {filename}[/green]")
+            else:
+                console.print(f"[yellow]Skipped: {filename}[/yellow]")
 
-        if result.user_approved:
-            console.print(f"[green]Merged: {filename}[/green]")
-        else:
-            console.print(f"[yellow]Skipped: {filename}[/yellow]")
+    if pipeline.usage.requests:
+        console.print(f"\n[dim]{pipeline.usage.summary()}[/dim]")
 
     return results
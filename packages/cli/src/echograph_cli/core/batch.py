@@ -0,0 +1,133 @@
+"""Non-interactive init across many project directories."""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from echograph_cli.core.fileio import text_differs
+from echograph_cli.core.models import (
+    BatchProjectResult,
+    ConflictResolution,
+    ProjectConfig,
+)
+from echograph_cli.core.templates import (
+    config_key,
+    get_project_config,
+    get_template_catalog,
+    plan_template_writes,
+    render_templates,
+    write_templates,
+)
+
+
+def expand_project_roots(base: Path, patterns: list[str]) -> list[Path]:
+    """Expand project paths and glob patterns into project directories.
+
+    Args:
+        base: Directory relative patterns are resolved against
+        patterns: Paths or glob patterns (e.g. "services/*")
+
+    Returns:
+        Unique, resolved directories in the order they were matched
+    """
+    roots: list[Path] = []
+    for pattern in patterns:
+        if any(ch in pattern for ch in "*?["):
+            matches = sorted(base.glob(pattern))
+        else:
+            matches = [base / pattern]
+        for match in matches:
+            if match.is_dir():
+                resolved = match.resolve()
+                if resolved not in roots:
+                    roots.append(resolved)
+    return roots
+
+
+def _init_project(
+    root: Path,
+    project_name: str,
+    contents: dict[str, str],
+    resolution: ConflictResolution,
+    dry_run: bool = False,
+) -> BatchProjectResult:
+    """Write pre-rendered templates into one project (runs in a worker)."""
+    try:
+        resolutions = {rel: resolution for rel in contents}
+        planned = plan_template_writes(
+            root, list(contents), False, resolutions, dry_run=dry_run
+        )
+        if dry_run:
+            created = [
+                rel
+                for rel in planned
+                if contents[rel] and text_differs(root / rel, contents[rel])
+            ]
+        else:
+            written = write_templates(
+                root, {rel: contents[rel] for rel in planned}, changed_only=True
+            )
+            created = [str(p.relative_to(root)) for p in written]
+        return BatchProjectResult(
+            path=root,
+            project_name=project_name,
+            status="ok",
+            created=created,
+            skipped=[rel for rel in contents if rel not in planned],
+            dry_run=dry_run,
+        )
+    except Exception as e:
+        return BatchProjectResult(
+            path=root,
+            project_name=project_name,
+            status="error",
+            error=str(e),
+        )
+
+
+def run_batch_init(
+    roots: list[Path],
+    mode: str,
+    resolution: ConflictResolution = ConflictResolution.SKIP,
+    workers: int | None = None,
+    dry_run: bool = False,
+) -> list[BatchProjectResult]:
+    """Initialize many projects without prompting.
+
+    Projects are grouped by identical ProjectConfig so each distinct
+    template set is rendered once; writes fan out over a process pool.
+
+    Args:
+        roots: Project directories to initialize
+        mode: "minimal" or "full"
+        resolution: How to handle files that already exist
+        workers: Process pool size (default: CPU count)
+        dry_run: If True, report what would be written without touching disk
+
+    Returns:
+        One result per project, in the order of roots
+    """
+    template_files = get_template_catalog().list_files(mode)
+
+    configs: dict[Path, ProjectConfig] = {}
+    rendered: dict[tuple[Any, ...], dict[str, str]] = {}
+    for root in roots:
+        config = get_project_config(root)
+        configs[root] = config
+        key = config_key(config)
+        if key not in rendered:
+            rendered[key] = render_templates(template_files, config)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _init_project,
+                root,
+                configs[root].project_name,
+                rendered[config_key(configs[root])],
+                resolution,
+                dry_run,
+            )
+            for root in roots
+        ]
+        return [future.result() for future in futures]
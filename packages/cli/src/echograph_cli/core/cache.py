@@ -0,0 +1,289 @@
+"""Size-bounded on-disk caches for merge results and AI responses.
+
+Entries live under <cache dir>/merge/<sha256>, zlib-compressed JSON. The
+key hashes the three merge inputs together with the merge algorithm
+version and options, so a changed input or a new merge engine never
+reuses a stale result. Reads refresh an entry's mtime; when the cache
+grows past its size limit the least recently used entries are removed.
+
+AI responses are kept the same way under <cache dir>/ai, keyed by the
+whole API request (model, system prompt, user file and template), and
+also expire after AI_CACHE_TTL seconds.
+"""
+
+import json
+import os
+import re
+import time
+import zlib
+from collections.abc import Callable, Mapping
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, TypeVar
+
+from echograph_cli.core.fileio import atomic_write_bytes
+from echograph_cli.core.merge import (
+    MERGE_ALGORITHM_VERSION,
+    ConflictMarkerStyle,
+    MergeBackend,
+    three_way_merge,
+    three_way_merge_sections,
+)
+from echograph_cli.core.models import MergeConflict, MergeStats, SectionConflict
+from echograph_cli.core.store import content_sha256
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Inputs larger than this (all three together) are streamed, not cached
+MAX_CACHED_INPUT_CHARS = 4 * 1024 * 1024
+
+# AI answers depend on the model, so don't keep them forever
+AI_CACHE_TTL = 30 * 24 * 60 * 60
+AI_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+_KEY_RE = re.compile(r"[0-9a-f]{64}")
+
+_Conflict = TypeVar("_Conflict", MergeConflict, SectionConflict)
+
+
+class DiskCache:
+    """Least-recently-used store of small blobs in one directory."""
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Initialize a cache in root holding at most max_bytes of entries."""
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> Path:
+        """Entry file for a key."""
+        if not _KEY_RE.fullmatch(key):
+            raise KeyError(key)
+        return self.root / key
+
+    def get(self, key: str) -> bytes | None:
+        """Load an entry and mark it as recently used.
+
+        Returns:
+            The stored bytes, or None if missing or unreadable
+        """
+        path = self._path(key)
+        try:
+            data = zlib.decompress(path.read_bytes())
+            os.utime(path)
+        except (OSError, zlib.error):
+            return None
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store an entry, then evict old entries past the size limit.
+
+        Write failures are ignored - the cache is only an optimization.
+        """
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(self._path(key), zlib.compress(data))
+        except OSError:
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries until under max_bytes."""
+        entries: list[tuple[float, int, Path]] = []
+        total = 0
+        try:
+            with os.scandir(self.root) as it:
+                for entry in it:
+                    if not _KEY_RE.fullmatch(entry.name):
+                        continue
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+                    total += stat.st_size
+        except OSError:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def get_merge_cache() -> DiskCache | None:
+    """The merge result cache, or None if on-disk caches are disabled."""
+    from echograph_cli.core.config import cache_enabled, get_cache_dir
+
+    if not cache_enabled():
+        return None
+    return DiskCache(get_cache_dir() / "merge")
+
+
+def merge_cache_key(kind: str, base: str, user: str, new: str, *options: Any) -> str:
+    """Cache key for one merge of base/user/new with the given options."""
+    parts = [
+        f"v{MERGE_ALGORITHM_VERSION}",
+        kind,
+        *map(str, options),
+        content_sha256(base),
+        content_sha256(user),
+        content_sha256(new),
+    ]
+    return content_sha256("\0".join(parts))
+
+
+def _cached_merge(
+    cache: DiskCache | None,
+    key: str,
+    merge: Callable[[MergeStats], tuple[str, list[_Conflict]]],
+    conflict_type: type[_Conflict],
+    size: int,
+    stats: MergeStats | None,
+) -> tuple[str, list[_Conflict]]:
+    """Look up a merge result, computing and storing it on a miss."""
+    if cache is None or size > MAX_CACHED_INPUT_CHARS:
+        return merge(stats or MergeStats())
+
+    data = cache.get(key)
+    if data is not None:
+        try:
+            entry = json.loads(data)
+            merged: str = entry["merged"]
+            conflicts = [conflict_type(**c) for c in entry["conflicts"]]
+            auto_resolved = int(entry["auto_resolved"])
+        except (ValueError, KeyError, TypeError):
+            pass  # Corrupt entry - recompute and overwrite it
+        else:
+            if stats is not None:
+                stats.auto_resolved += auto_resolved
+            return merged, conflicts
+
+    run_stats = MergeStats()
+    merged, conflicts = merge(run_stats)
+    if stats is not None:
+        stats.auto_resolved += run_stats.auto_resolved
+    entry = {
+        "merged": merged,
+        "conflicts": [asdict(c) for c in conflicts],
+        "auto_resolved": run_stats.auto_resolved,
+    }
+    cache.put(key, json.dumps(entry).encode("utf-8"))
+    return merged, conflicts
+
+
+def cached_three_way_merge(
+    cache: DiskCache | None,
+    base: str,
+    user: str,
+    new: str,
+    marker_style: ConflictMarkerStyle = ConflictMarkerStyle.GIT,
+    *,
+    stats: MergeStats | None = None,
+    backend: MergeBackend = MergeBackend.PYTHON,
+) -> tuple[str, list[MergeConflict]]:
+    """three_way_merge, reusing an earlier result for the same inputs.
+
+    Args:
+        cache: Cache to use, or None to always merge
+        base: Original template content (from previous version)
+        user: User's modified version
+        new: New template version
+        marker_style: Style for conflict markers (default: GIT)
+        stats: Optional counters, updated as if the merge had run
+        backend: Line merge engine; part of the key, as engines can differ
+
+    Returns:
+        Tuple of (merged_content, list_of_conflicts)
+    """
+    key = merge_cache_key("lines", base, user, new, marker_style.value, backend.value)
+    return _cached_merge(
+        cache,
+        key,
+        lambda s: three_way_merge(
+            base, user, new, marker_style, stats=s, backend=backend
+        ),
+        MergeConflict,
+        len(base) + len(user) + len(new),
+        stats,
+    )
+
+
+def cached_three_way_merge_sections(
+    cache: DiskCache | None,
+    base: str,
+    user: str,
+    new: str,
+    marker_style: ConflictMarkerStyle = ConflictMarkerStyle.HTML_COMMENT,
+    *,
+    stats: MergeStats | None = None,
+) -> tuple[str, list[SectionConflict]]:
+    """three_way_merge_sections, reusing an earlier result for the same inputs.
+
+    Args:
+        cache: Cache to use, or None to always merge
+        base: Original template content (from previous version)
+        user: User's current version
+        new: New template version
+        marker_style: Style for conflict markers (default: HTML_COMMENT)
+        stats: Optional counters, updated as if the merge had run
+
+    Returns:
+        Tuple of (merged_content, list_of_section_conflicts)
+    """
+    key = merge_cache_key("sections", base, user, new, marker_style.value)
+    return _cached_merge(
+        cache,
+        key,
+        lambda s: three_way_merge_sections(base, user, new, marker_style, stats=s),
+        SectionConflict,
+        len(base) + len(user) + len(new),
+        stats,
+    )
+
+
+def get_ai_cache() -> DiskCache | None:
+    """The AI response cache, or None if on-disk caches are disabled."""
+    from echograph_cli.core.config import cache_enabled, get_cache_dir
+
+    if not cache_enabled():
+        return None
+    return DiskCache(get_cache_dir() / "ai", AI_CACHE_MAX_BYTES)
+
+
+def ai_cache_key(request: Mapping[str, Any]) -> str:
+    """Cache key for an API request, given as messages.create keyword arguments."""
+    return content_sha256(json.dumps(request, sort_keys=True))
+
+
+def load_ai_response(
+    cache: DiskCache | None, key: str, max_age: float = AI_CACHE_TTL
+) -> tuple[str | None, str] | None:
+    """Look up a cached extract-sections answer.
+
+    Returns:
+        (new_sections or None, explanation), or None on a miss or if the
+        entry is older than max_age seconds
+    """
+    if cache is None:
+        return None
+    data = cache.get(key)
+    if data is None:
+        return None
+    try:
+        entry = json.loads(data)
+        created = float(entry["created"])
+        sections: str | None = entry["sections"]
+        explanation: str = entry["explanation"]
+    except (ValueError, KeyError, TypeError):
+        return None  # Corrupt entry - the next answer overwrites it
+    if not 0 <= time.time() - created <= max_age:
+        return None
+    return sections, explanation
+
+
+def store_ai_response(
+    cache: DiskCache | None, key: str, sections: str | None, explanation: str
+) -> None:
+    """Save an extract-sections answer for load_ai_response."""
+    if cache is None:
+        return
+    entry = {"created": time.time(), "sections": sections, "explanation": explanation}
+    cache.put(key, json.dumps(entry).encode("utf-8"))
@@ -15,6 +15,42 @@ else:
 
 CONFIG_FILE = CONFIG_DIR.expanduser() / "config.yaml"
 
+
+def get_cache_dir() -> Path:
+    """Return the cache directory (XDG cache on Linux, LocalAppData on Windows).
+
+    Resolved on each call so ECHOGRAPH_CACHE_DIR / XDG_CACHE_HOME changes
+    take effect without reimporting.
+    """
+    override = os.environ.get("ECHOGRAPH_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA", "~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME", "~/.cache")
+    return Path(base).expanduser() / "echograph"
+
+
+def cache_enabled() -> bool:
+    """Check whether on-disk caches are enabled (ECHOGRAPH_NO_CACHE unset)."""
+    return os.environ.get("ECHOGRAPH_NO_CACHE", "") in ("", "0")
+
+
+DEFAULT_AI_CONCURRENCY = 4
+
+
+def get_ai_concurrency() -> int:
+    """Return how many AI merge requests may run at once.
+
+    Set with ECHOGRAPH_AI_CONCURRENCY; unset or invalid values use the default.
+    """
+    try:
+        return max(1, int(os.environ.get("ECHOGRAPH_AI_CONCURRENCY", "")))
+    except ValueError:
+        return DEFAULT_AI_CONCURRENCY
+
+
 # force_terminal=True ensures colors work on Windows PowerShell
 # where Rich's auto-detection may fail
 console = Console(force_terminal=True)
@@ -0,0 +1,398 @@
+"""Line diff engine for merges and diff display.
+
+Replaces difflib.SequenceMatcher on merge paths. The algorithm:
+
+1. Trim the common prefix and suffix of the range.
+2. Use lines that occur exactly once on both sides as patience anchors
+   (longest increasing subsequence), and recurse into the gaps.
+3. Gaps without unique lines are diffed with Myers' O(ND) algorithm,
+   bounded so pathological inputs degrade to a plain replace instead of
+   quadratic time.
+
+There is no junk heuristic, so files with many repeated lines (blank
+lines, markdown tables) diff correctly. Output is compatible with
+SequenceMatcher.get_matching_blocks() / get_opcodes().
+
+Text is diffed as interned lines: each distinct line gets an integer id
+and every side becomes an array('I'), so the algorithm hashes and
+compares small ints instead of strings.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Hashable, Iterable, Iterator, Sequence
+
+Opcode = tuple[str, int, int, int, int]
+Block = tuple[int, int, int]
+
+# Upper bound on Myers work per gap, in (edit distance x gap size) steps
+MYERS_WORK_BUDGET = 4_000_000
+MYERS_MIN_D = 64
+
+# Lines compared one by one before galloping over common prefixes/suffixes
+_SCAN_LINES = 8
+
+
+class LineInterner:
+    """Map each distinct line to a small integer id.
+
+    Share one interner across all sides of a diff or merge so equal lines
+    get equal ids.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty interner."""
+        self._ids: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Number of distinct lines seen."""
+        return len(self._ids)
+
+    def intern(self, lines: Iterable[str]) -> "array[int]":
+        """Return the ids of lines as an array('I')."""
+        ids = self._ids
+        # len(ids) is evaluated before setdefault inserts, so new ids are dense
+        return array("I", [ids.setdefault(line, len(ids)) for line in lines])
+
+    def lines(self) -> list[str]:
+        """Distinct lines indexed by id."""
+        return list(self._ids)  # Dicts keep insertion order, which is id order
+
+
+def _common_prefix(
+    a: Sequence[Hashable], alo: int, ahi: int, b: Sequence[Hashable], blo: int, bhi: int
+) -> int:
+    """Length of the common prefix of a[alo:ahi] and b[blo:bhi].
+
+    Gallops with slice comparisons, which run in C (a memcmp for arrays),
+    then binary-searches the mismatch.
+    """
+    limit = min(ahi - alo, bhi - blo)
+    k = 0
+    # Most gaps between anchors differ right away - check a few lines first
+    while k < limit and k < _SCAN_LINES and a[alo + k] == b[blo + k]:
+        k += 1
+    if k < _SCAN_LINES:
+        return k
+    step, growing = 16, True
+    while step:
+        i, j = alo + k, blo + k
+        if k + step <= limit and a[i : i + step] == b[j : j + step]:
+            k += step
+            if growing:
+                step *= 2
+        else:
+            growing = False
+            step //= 2
+    return k
+
+
+def _common_suffix(
+    a: Sequence[Hashable], alo: int, ahi: int, b: Sequence[Hashable], blo: int, bhi: int
+) -> int:
+    """Length of the common suffix of a[alo:ahi] and b[blo:bhi]."""
+    limit = min(ahi - alo, bhi - blo)
+    k = 0
+    while k < limit and k < _SCAN_LINES and a[ahi - 1 - k] == b[bhi - 1 - k]:
+        k += 1
+    if k < _SCAN_LINES:
+        return k
+    step, growing = 16, True
+    while step:
+        i, j = ahi - k, bhi - k
+        if k + step <= limit and a[i - step : i] == b[j - step : j]:
+            k += step
+            if growing:
+                step *= 2
+        else:
+            growing = False
+            step //= 2
+    return k
+
+
+def _patience_anchors(
+    a: Sequence[Hashable], alo: int, ahi: int, b: Sequence[Hashable], blo: int, bhi: int
+) -> list[tuple[int, int]]:
+    """Find (i, j) pairs of lines unique on both sides, in increasing order."""
+    # Index of the only occurrence, or -1 once a line is seen twice
+    a_unique: dict[Hashable, int] = {}
+    for i in range(alo, ahi):
+        line = a[i]
+        a_unique[line] = -1 if line in a_unique else i
+    b_unique: dict[Hashable, int] = {}
+    for j in range(blo, bhi):
+        line = b[j]
+        if line in a_unique:
+            b_unique[line] = -1 if line in b_unique else j
+
+    pairs = [
+        (a_unique[line], j)
+        for line, j in b_unique.items()
+        if j >= 0 and a_unique[line] >= 0
+    ]
+    if not pairs:
+        return []
+    pairs.sort()
+
+    # Longest increasing subsequence on j (patience sorting)
+    tails: list[int] = []  # j value at the top of each pile
+    tops: list[int] = []  # index into pairs of each pile top
+    back: list[int] = [-1] * len(pairs)
+    for k, (_, j) in enumerate(pairs):
+        pile = bisect_left(tails, j)
+        if pile == len(tails):
+            tails.append(j)
+            tops.append(k)
+        else:
+            tails[pile] = j
+            tops[pile] = k
+        back[k] = tops[pile - 1] if pile > 0 else -1
+
+    anchors: list[tuple[int, int]] = []
+    k = tops[-1]
+    while k >= 0:
+        anchors.append(pairs[k])
+        k = back[k]
+    anchors.reverse()
+    return anchors
+
+
+def _myers_blocks(
+    a: Sequence[Hashable], alo: int, ahi: int, b: Sequence[Hashable], blo: int, bhi: int
+) -> list[Block]:
+    """Matching blocks for a range using Myers' greedy O(ND) algorithm.
+
+    Returns [] (a full replace) when the edit distance exceeds the work
+    budget for this range.
+    """
+    n = ahi - alo
+    m = bhi - blo
+    max_d = min(n + m, max(MYERS_MIN_D, MYERS_WORK_BUDGET // (n + m)))
+    offset = max_d + 1
+    v = [0] * (2 * max_d + 3)
+    trace: list[list[int]] = []
+
+    for d in range(max_d + 1):
+        # Keep a copy of the diagonals reachable at this d for backtracking
+        trace.append(v[offset - d - 1 : offset + d + 2])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]  # Step down (insertion)
+            else:
+                x = v[offset + k - 1] + 1  # Step right (deletion)
+            y = x - k
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                return _myers_backtrack(trace, d, n, m, alo, blo)
+    return []
+
+
+def _myers_backtrack(
+    trace: list[list[int]], d_end: int, n: int, m: int, alo: int, blo: int
+) -> list[Block]:
+    """Recover diagonal runs (snakes) from the recorded Myers frontiers."""
+    blocks: list[Block] = []
+    x, y = n, m
+    for d in range(d_end, 0, -1):
+        frontier = trace[d]  # v[-d-1 .. d+1] before step d
+        k = x - y
+
+        def at(diag: int, frontier: list[int] = frontier, d: int = d) -> int:
+            return frontier[diag + d + 1]
+
+        if k == -d or (k != d and at(k - 1) < at(k + 1)):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = at(prev_k)
+        prev_y = prev_x - prev_k
+        # Snake from the end of the edit step to (x, y)
+        start_x = prev_x if prev_k == k + 1 else prev_x + 1
+        start_y = start_x - k
+        if x > start_x:
+            blocks.append((alo + start_x, blo + start_y, x - start_x))
+        x, y = prev_x, prev_y
+    if x > 0:
+        blocks.append((alo, blo, x))  # Leading snake at d == 0
+    blocks.reverse()
+    return blocks
+
+
+def matching_blocks(a: Sequence[Hashable], b: Sequence[Hashable]) -> list[Block]:
+    """Return matching blocks like SequenceMatcher.get_matching_blocks().
+
+    Blocks are (i, j, n) triples with a[i:i+n] == b[j:j+n], strictly
+    increasing in i and j, adjacent blocks merged, and a final
+    (len(a), len(b), 0) sentinel.
+    """
+    blocks: list[Block] = []
+    stack = [(0, len(a), 0, len(b))]
+
+    while stack:
+        alo, ahi, blo, bhi = stack.pop()
+
+        prefix = _common_prefix(a, alo, ahi, b, blo, bhi)
+        if prefix:
+            blocks.append((alo, blo, prefix))
+            alo += prefix
+            blo += prefix
+
+        suffix = _common_suffix(a, alo, ahi, b, blo, bhi)
+        if suffix:
+            ahi -= suffix
+            bhi -= suffix
+            blocks.append((ahi, bhi, suffix))
+
+        if alo == ahi or blo == bhi:
+            continue
+
+        anchors = _patience_anchors(a, alo, ahi, b, blo, bhi)
+        if anchors:
+            prev_i, prev_j = alo, blo
+            for ai, bj in anchors:
+                # Gaps empty on either side are pure inserts/deletes
+                if prev_i < ai and prev_j < bj:
+                    stack.append((prev_i, ai, prev_j, bj))
+                blocks.append((ai, bj, 1))
+                prev_i, prev_j = ai + 1, bj + 1
+            stack.append((prev_i, ahi, prev_j, bhi))
+        else:
+            blocks.extend(_myers_blocks(a, alo, ahi, b, blo, bhi))
+
+    blocks.sort()
+
+    # Merge adjacent blocks
+    merged: list[Block] = []
+    for i, j, n in blocks:
+        if merged:
+            pi, pj, pn = merged[-1]
+            if pi + pn == i and pj + pn == j:
+                merged[-1] = (pi, pj, pn + n)
+                continue
+        merged.append((i, j, n))
+    merged.append((len(a), len(b), 0))
+    return merged
+
+
+def diff_opcodes(a: Sequence[Hashable], b: Sequence[Hashable]) -> list[Opcode]:
+    """Return opcodes like SequenceMatcher.get_opcodes().
+
+    Each opcode is (tag, i1, i2, j1, j2) with tag one of "equal",
+    "replace", "delete" or "insert".
+    """
+    opcodes: list[Opcode] = []
+    i = j = 0
+    for ai, bj, size in matching_blocks(a, b):
+        if i < ai and j < bj:
+            opcodes.append(("replace", i, ai, j, bj))
+        elif i < ai:
+            opcodes.append(("delete", i, ai, j, bj))
+        elif j < bj:
+            opcodes.append(("insert", i, ai, j, bj))
+        i, j = ai + size, bj + size
+        if size:
+            opcodes.append(("equal", ai, i, bj, j))
+    return opcodes
+
+
+def diff_lines(a: Sequence[str], b: Sequence[str]) -> list[Opcode]:
+    """diff_opcodes() for two line lists, compared as interned ids."""
+    interner = LineInterner()
+    return diff_opcodes(interner.intern(a), interner.intern(b))
+
+
+def group_opcodes(opcodes: list[Opcode], n: int = 3) -> Iterator[list[Opcode]]:
+    """Group opcodes into hunks with n lines of context.
+
+    Same behaviour as SequenceMatcher.get_grouped_opcodes().
+    """
+    codes = list(opcodes) or [("equal", 0, 1, 0, 1)]
+    # Trim context at the start and end
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = (tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2)
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = (tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n))
+
+    group: list[Opcode] = []
+    for tag, i1, i2, j1, j2 in codes:
+        # Split long unchanged runs into two context blocks
+        if tag == "equal" and i2 - i1 > 2 * n:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Unified diff range as "start,length" (1-based)."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1  # Empty ranges begin at the line just before
+    return f"{beginning},{length}"
+
+
+def unified_diff(
+    a: Sequence[str],
+    b: Sequence[str],
+    fromfile: str = "",
+    tofile: str = "",
+    n: int = 3,
+    lineterm: str = "\n",
+) -> Iterator[str]:
+    """Unified diff of two line lists, formatted like difflib.unified_diff()."""
+    started = False
+    for group in group_opcodes(diff_lines(a, b), n):
+        if not started:
+            started = True
+            yield f"--- {fromfile}{lineterm}"
+            yield f"+++ {tofile}{lineterm}"
+        first, last = group[0], group[-1]
+        file1 = _format_range(first[1], last[2])
+        file2 = _format_range(first[3], last[4])
+        yield f"@@ -{file1} +{file2} @@{lineterm}"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in a[i1:i2]:
+                    yield " " + line
+                continue
+            if tag in ("replace", "delete"):
+                for line in a[i1:i2]:
+                    yield "-" + line
+            if tag in ("replace", "insert"):
+                for line in b[j1:j2]:
+                    yield "+" + line
+
+
+def similarity_ratio(a: str, b: str) -> float:
+    """Similarity of two texts in [0, 1], like SequenceMatcher.ratio().
+
+    Matched lines count all their characters; replaced blocks are then
+    diffed character by character. This avoids a full character-level
+    diff of the whole text.
+    """
+    total = len(a) + len(b)
+    if not total:
+        return 1.0
+    a_lines = a.splitlines(keepends=True)
+    b_lines = b.splitlines(keepends=True)
+
+    matched = 0
+    for tag, i1, i2, j1, j2 in diff_lines(a_lines, b_lines):
+        if tag == "equal":
+            matched += sum(len(line) for line in a_lines[i1:i2])
+        elif tag == "replace":
+            a_text = "".join(a_lines[i1:i2])
+            b_text = "".join(b_lines[j1:j2])
+            matched += sum(size for _, _, size in matching_blocks(a_text, b_text))
+    return 2.0 * matched / total
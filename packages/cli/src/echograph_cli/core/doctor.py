@@ -4,8 +4,8 @@ import json
 import shutil
 from pathlib import Path
 
-from echograph_cli import __version__
 from echograph_cli.core.models import DoctorCheck
+from echograph_cli.core.store import read_template_version
 
 
 def check_claude_cli() -> DoctorCheck:
@@ -123,6 +123,8 @@ def check_git_repo(path: Path) -> DoctorCheck:
 
 def check_template_version(path: Path) -> DoctorCheck:
     """Check if templates are up to date."""
+    from echograph_cli import __version__
+
     metadata_file = path / ".claude" / ".echograph-meta.json"
 
     if not metadata_file.exists():
@@ -133,8 +135,7 @@ def check_template_version(path: Path) -> DoctorCheck:
         )
 
     try:
-        metadata = json.loads(metadata_file.read_text())
-        template_version = metadata.get("template_version", "unknown")
+        template_version = read_template_version(metadata_file) or "unknown"
 
         if template_version == __version__:
             return DoctorCheck(
@@ -148,7 +149,7 @@ def check_template_version(path: Path) -> DoctorCheck:
             message=f"Templates are v{template_version}, latest is v{__version__}",
             fix_hint="Run 'echograph update' to update templates",
         )
-    except (json.JSONDecodeError, KeyError):
+    except ValueError:
         return DoctorCheck(
             name="Template Version",
             passed=False,
@@ -0,0 +1,109 @@
+"""Crash-safe file writing helpers."""
+
+import hashlib
+import os
+import shutil
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+
+def encode_text(content: str) -> bytes:
+    """Encode text exactly as Path.write_text(encoding="utf-8") would.
+
+    Text-mode writes translate newlines to os.linesep, so the same
+    translation is applied here to keep files byte-identical.
+    """
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    return content.encode("utf-8")
+
+
+def file_sha256(path: Path) -> str | None:
+    """Return the SHA-256 of a file, or None if it can't be read."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes via a temp file in the same directory and os.replace.
+
+    Readers never see a partially written file, and a crash leaves either
+    the old or the new content. An existing file keeps its permissions.
+
+    Args:
+        path: Target file (parent directory must exist)
+        data: Content to write
+    """
+    atomic_write_blocks(path, (data,))
+
+
+def atomic_write_blocks(path: Path, blocks: Iterable[bytes]) -> None:
+    """Atomically write bytes produced incrementally.
+
+    Blocks are written to the temp file as they arrive, so the full content
+    never has to be held in memory. If the iterable raises, the target is
+    left untouched.
+
+    Args:
+        path: Target file (parent directory must exist)
+        blocks: Content, in order
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for block in blocks:
+                f.write(block)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_text(path: Path, content: str) -> None:
+    """Atomically write UTF-8 text to path."""
+    atomic_write_bytes(path, encode_text(content))
+
+
+def atomic_write_chunks(path: Path, chunks: Iterable[str]) -> None:
+    """Atomically write UTF-8 text produced chunk by chunk (e.g. a merge)."""
+    atomic_write_blocks(path, (encode_text(chunk) for chunk in chunks))
+
+
+def write_text_if_changed(path: Path, content: str) -> bool:
+    """Atomically write text unless the file already has this exact content.
+
+    Args:
+        path: Target file (parent directory must exist)
+        content: Text content to write
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    data = encode_text(content)
+    if not _differs(path, data):
+        return False
+    atomic_write_bytes(path, data)
+    return True
+
+
+def text_differs(path: Path, content: str) -> bool:
+    """Return True if write_text_if_changed would write content to path."""
+    return _differs(path, encode_text(content))
+
+
+def _differs(path: Path, data: bytes) -> bool:
+    try:
+        if path.stat().st_size == len(data):
+            if file_sha256(path) == hashlib.sha256(data).hexdigest():
+                return False
+    except OSError:
+        pass  # Missing file - write it
+    return True
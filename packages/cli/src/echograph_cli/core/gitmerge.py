@@ -0,0 +1,147 @@
+"""diff3 chunks from `git merge-file`, for large inputs.
+
+git's xdiff merge runs in C and is much faster than the Python engine on
+big files. Its output (with --diff3 markers) is parsed back into the same
+MergeChunk stream that core/merge.py produces, so conflict markers,
+word-level refinement and MergeConflict records work unchanged.
+
+xdiff can align repeated lines differently from the Python engine, so
+this backend is opt-in (MergeBackend.GIT / AUTO), never the default.
+"""
+
+import re
+import shutil
+import subprocess
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+from echograph_cli.core.models import MergeChunk
+
+# Long markers so a line in the user's file can't be mistaken for one
+_MARKER_SIZE = 40
+_START = "<" * _MARKER_SIZE
+_BASE = "|" * _MARKER_SIZE
+_SEP = "=" * _MARKER_SIZE
+_END = ">" * _MARKER_SIZE
+
+# Line breaks str.splitlines() honours but git doesn't
+_OTHER_LINE_BREAKS_RE = re.compile("[\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
+# git merge-file exits with the number of conflicts (capped at 127),
+# or a negative / >127 status on error
+_MAX_CONFLICT_STATUS = 127
+
+
+@lru_cache(maxsize=1)
+def git_executable() -> str | None:
+    """Path of git on PATH, or None if it isn't installed."""
+    return shutil.which("git")
+
+
+def supports_git_merge(base: str, user: str, new: str) -> bool:
+    """Check that git would split all three texts into the same lines.
+
+    git only breaks lines at "\\n" and rewrites a missing final newline
+    before a conflict marker, so texts with other line breaks or without
+    a trailing newline stay on the Python engine.
+    """
+    for text in (base, user, new):
+        if text and not text.endswith("\n"):
+            return False
+        if _OTHER_LINE_BREAKS_RE.search(text):
+            return False
+    return True
+
+
+def git_diff3_chunks(base: str, user: str, new: str) -> list[MergeChunk] | None:
+    """Merge with `git merge-file -p --diff3` and parse the result.
+
+    Args:
+        base: Original template content
+        user: User's modified version
+        new: New template version
+
+    Returns:
+        The merge as stable and conflict chunks, or None if git isn't
+        available or failed
+    """
+    git = git_executable()
+    if git is None:
+        return None
+
+    with tempfile.TemporaryDirectory(prefix="echograph-merge-") as tmp:
+        paths = []
+        for name, content in (("user", user), ("base", base), ("new", new)):
+            path = Path(tmp) / name
+            path.write_bytes(content.encode("utf-8"))
+            paths.append(str(path))
+        try:
+            result = subprocess.run(
+                [
+                    git,
+                    "merge-file",
+                    "-p",
+                    "--diff3",
+                    f"--marker-size={_MARKER_SIZE}",
+                    *paths,
+                ],
+                capture_output=True,
+                check=False,
+                shell=False,
+            )
+        except OSError:
+            return None
+
+    if not 0 <= result.returncode <= _MAX_CONFLICT_STATUS:
+        return None
+    try:
+        return _parse_diff3(result.stdout.decode("utf-8"))
+    except (UnicodeDecodeError, ValueError):
+        return None
+
+
+def _marker(line: str) -> str | None:
+    """The conflict marker a line consists of (plus optional label), if any."""
+    marker = line[:_MARKER_SIZE]
+    rest = line[_MARKER_SIZE:]
+    if marker in (_START, _BASE, _SEP, _END) and (rest == "\n" or rest[:1] == " "):
+        return marker
+    return None
+
+
+def _parse_diff3(output: str) -> list[MergeChunk]:
+    """Split git's diff3-style output into stable and conflict chunks.
+
+    Raises:
+        ValueError: If the conflict markers are malformed
+    """
+    chunks: list[MergeChunk] = []
+    stable: list[str] = []
+    sides: list[list[str]] = []  # user, base, new of the open conflict
+
+    for line in output.splitlines(keepends=True):
+        marker = _marker(line)
+        if marker == _START and not sides:
+            if stable:
+                chunks.append(MergeChunk(lines=stable))
+                stable = []
+            sides = [[]]
+        elif marker == _BASE and len(sides) == 1:
+            sides.append([])
+        elif marker == _SEP and len(sides) == 2:
+            sides.append([])
+        elif marker == _END and len(sides) == 3:
+            user, base, new = sides
+            chunks.append(MergeChunk(conflict=True, base=base, user=user, new=new))
+            sides = []
+        elif sides:
+            sides[-1].append(line)
+        else:
+            stable.append(line)
+
+    if sides:
+        raise ValueError("Unterminated conflict in git merge-file output")
+    if stable:
+        chunks.append(MergeChunk(lines=stable))
+    return chunks
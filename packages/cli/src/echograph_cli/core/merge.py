@@ -1,10 +1,31 @@
 """Three-way merge for template updates."""
 
-import difflib
 import re
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
 from enum import Enum
+from functools import lru_cache
 
-from echograph_cli.core.models import MergeConflict, SectionConflict
+from echograph_cli.core.diff import LineInterner, diff_opcodes
+from echograph_cli.core.minhash import Signature, best_pairs, signature
+from echograph_cli.core.models import (
+    MergeChunk,
+    MergeConflict,
+    MergeStats,
+    OutlineNode,
+    SectionConflict,
+)
+from echograph_cli.core.outline import head_end, nodes_at_level, parse_outline
+
+# Bump whenever merge output can change for the same inputs; it is part
+# of the on-disk merge cache key (see core/cache.py)
+MERGE_ALGORITHM_VERSION = 4
+
+# A changed base range [i1, i2) and its replacement [j1, j2) on one side
+Hunk = tuple[int, int, int, int]
+
+# Words, whitespace runs and single punctuation characters
+_TOKEN_RE = re.compile(r"\w+|\s+|[^\w\s]")
 
 
 class ConflictMarkerStyle(Enum):
@@ -14,6 +35,24 @@ class ConflictMarkerStyle(Enum):
     HTML_COMMENT = "html"  # <!-- CONFLICT: ... -->
 
 
+class MergeBackend(Enum):
+    """Engine used for line-level three-way merges.
+
+    The engines can align hunks differently when lines repeat (blank
+    lines, "---", closing fences), so the same inputs may merge to
+    different text or conflicts. PYTHON is the default; git is opt-in.
+    """
+
+    AUTO = "auto"  # git for inputs of GIT_MERGE_MIN_CHARS or more, if installed
+    PYTHON = "python"
+    GIT = "git"  # git whenever installed and the inputs allow it
+
+
+# Below this total input size, starting a git process costs more than the
+# Python merge takes
+GIT_MERGE_MIN_CHARS = 128 * 1024
+
+
 def get_conflict_markers(style: ConflictMarkerStyle) -> tuple[str, str, str]:
     """Return (start, separator, end) markers for given style.
 
@@ -37,11 +76,236 @@ def get_conflict_markers(style: ConflictMarkerStyle) -> tuple[str, str, str]:
     )
 
 
+def _hunks(base_ids: Sequence[int], side_ids: Sequence[int]) -> list[Hunk]:
+    """Changed regions of one side relative to base, in base order."""
+    return [
+        (i1, i2, j1, j2)
+        for tag, i1, i2, j1, j2 in diff_opcodes(base_ids, side_ids)
+        if tag != "equal"
+    ]
+
+
+def _overlaps(a1: int, a2: int, b1: int, b2: int) -> bool:
+    """Check whether two base ranges touch the same lines.
+
+    Insertions (empty ranges) overlap another insertion at the same point,
+    or a change they fall strictly inside. Changes that are merely
+    adjacent don't overlap, so their order is unambiguous.
+    """
+    if a1 == a2 and b1 == b2:
+        return a1 == b1
+    if a1 == a2:
+        return b1 < a1 < b2
+    if b1 == b2:
+        return a1 < b1 < a2
+    return a1 < b2 and b1 < a2
+
+
+def _side_range(
+    hunks: list[Hunk], lo: int, hi: int, side_ids: "array[int]"
+) -> "array[int]":
+    """One side's line ids for base range [lo, hi), given its hunks inside it."""
+    if not hunks:
+        return array("I")
+    first, last = hunks[0], hunks[-1]
+    # Outside its hunks a side equals base, so the offsets carry over
+    j_start = first[2] - (first[0] - lo)
+    j_end = last[3] + (hi - last[1])
+    return side_ids[j_start:j_end]
+
+
+def _diff3_ids(
+    base_ids: "array[int]",
+    user_ids: "array[int]",
+    new_ids: "array[int]",
+    lines: list[str],
+) -> Iterator[MergeChunk]:
+    """diff3 over interned line ids, decoding chunks through lines[id]."""
+
+    def decode(ids: "array[int]") -> list[str]:
+        return list(map(lines.__getitem__, ids))
+
+    user_hunks = _hunks(base_ids, user_ids)
+    new_hunks = _hunks(base_ids, new_ids)
+    ui = ni = 0
+    pos = 0  # Base lines before pos have been emitted
+
+    while ui < len(user_hunks) or ni < len(new_hunks):
+        # Start a region at the earliest remaining hunk
+        if ni >= len(new_hunks) or (
+            ui < len(user_hunks) and user_hunks[ui][:2] <= new_hunks[ni][:2]
+        ):
+            region_user, region_new = [user_hunks[ui]], []
+            ui += 1
+        else:
+            region_user, region_new = [], [new_hunks[ni]]
+            ni += 1
+        lo, hi = (region_user or region_new)[0][:2]
+
+        # Grow the region while the next hunk on either side overlaps it
+        while True:
+            if ui < len(user_hunks) and _overlaps(lo, hi, *user_hunks[ui][:2]):
+                hunk = user_hunks[ui]
+                region_user.append(hunk)
+                ui += 1
+            elif ni < len(new_hunks) and _overlaps(lo, hi, *new_hunks[ni][:2]):
+                hunk = new_hunks[ni]
+                region_new.append(hunk)
+                ni += 1
+            else:
+                break
+            lo, hi = min(lo, hunk[0]), max(hi, hunk[1])
+
+        if pos < lo:
+            yield MergeChunk(lines=decode(base_ids[pos:lo]))
+        pos = hi
+
+        user_part = _side_range(region_user, lo, hi, user_ids)
+        new_part = _side_range(region_new, lo, hi, new_ids)
+        if not region_new:
+            yield MergeChunk(lines=decode(user_part))
+        elif not region_user:
+            yield MergeChunk(lines=decode(new_part))
+        elif user_part == new_part:
+            yield MergeChunk(lines=decode(user_part))
+        else:
+            yield MergeChunk(
+                conflict=True,
+                base=decode(base_ids[lo:hi]),
+                user=decode(user_part),
+                new=decode(new_part),
+            )
+
+    if pos < len(base_ids):
+        yield MergeChunk(lines=decode(base_ids[pos:]))
+
+
+def iter_diff3_chunks(
+    base_lines: Sequence[str],
+    user_lines: Sequence[str],
+    new_lines: Sequence[str],
+) -> Iterator[MergeChunk]:
+    """Merge three line sequences, yielding stable and conflict chunks.
+
+    Both change lists are walked once with two pointers. Overlapping
+    hunks from either side are grouped into a single region; a region
+    changed by only one side takes that side, and a region changed by
+    both is stable if both produce the same lines and a conflict
+    otherwise. After diffing this is linear in the number of lines.
+
+    Args:
+        base_lines: Original template lines
+        user_lines: User's lines
+        new_lines: New template lines
+
+    Yields:
+        MergeChunk objects in output order
+    """
+    interner = LineInterner()
+    base_ids = interner.intern(base_lines)
+    user_ids = interner.intern(user_lines)
+    new_ids = interner.intern(new_lines)
+    return _diff3_ids(base_ids, user_ids, new_ids, interner.lines())
+
+
+def refine_conflict(base: str, user: str, new: str) -> str | None:
+    """Re-merge a conflicting hunk word by word.
+
+    Edits that touch different words of the same lines (e.g. the user
+    renamed a path while the template fixed a typo further along) merge
+    cleanly at token level.
+
+    Returns:
+        The merged text, or None if the edits overlap at token level too
+    """
+    interner = LineInterner()
+    base_ids = interner.intern(_TOKEN_RE.findall(base))
+    user_ids = interner.intern(_TOKEN_RE.findall(user))
+    new_ids = interner.intern(_TOKEN_RE.findall(new))
+
+    merged: list[str] = []
+    for chunk in _diff3_ids(base_ids, user_ids, new_ids, interner.lines()):
+        if chunk.conflict:
+            return None
+        merged.extend(chunk.lines)
+    resolved = "".join(merged)
+
+    # Line hunks end at a newline; a result that lost it (e.g. one side
+    # emptied a blank line the other side typed into) would run into the
+    # next line
+    if resolved and not resolved.endswith("\n"):
+        if all(not side or side.endswith("\n") for side in (base, user, new)):
+            return None
+    return resolved
+
+
+def _with_newline(lines: list[str]) -> list[str]:
+    """Make sure the last line ends with a newline before a marker follows."""
+    if lines and not lines[-1].endswith("\n"):
+        return lines[:-1] + [lines[-1] + "\n"]
+    return lines
+
+
+def _python_chunks(base: str, user: str, new: str) -> Iterator[MergeChunk]:
+    """diff3 chunks from the pure-Python engine."""
+    # Only the interned ids and one copy of each distinct line stay alive
+    interner = LineInterner()
+    base_ids = interner.intern(base.splitlines(keepends=True))
+    user_ids = interner.intern(user.splitlines(keepends=True))
+    new_ids = interner.intern(new.splitlines(keepends=True))
+    return _diff3_ids(base_ids, user_ids, new_ids, interner.lines())
+
+
+def _git_chunks(
+    base: str, user: str, new: str, backend: MergeBackend
+) -> list[MergeChunk] | None:
+    """diff3 chunks from git merge-file, if the backend selects it.
+
+    Returns None (use the Python engine) when git isn't installed, fails,
+    or would split the inputs into lines differently.
+    """
+    if backend is MergeBackend.PYTHON:
+        return None
+    if (
+        backend is MergeBackend.AUTO
+        and len(base) + len(user) + len(new) < GIT_MERGE_MIN_CHARS
+    ):
+        return None
+
+    from echograph_cli.core import gitmerge
+
+    if gitmerge.git_executable() is None:
+        return None
+    if not gitmerge.supports_git_merge(base, user, new):
+        return None
+    git_chunks = gitmerge.git_diff3_chunks(base, user, new)
+    if git_chunks is None:
+        return None
+
+    # git conflicts on adjacent edits, which this engine merges; its
+    # conflict regions are small, so re-merge them here for the same result
+    chunks: list[MergeChunk] = []
+    for chunk in git_chunks:
+        if chunk.conflict:
+            chunks.extend(
+                _python_chunks(
+                    "".join(chunk.base), "".join(chunk.user), "".join(chunk.new)
+                )
+            )
+        else:
+            chunks.append(chunk)
+    return chunks
+
+
 def three_way_merge(
     base: str,
     user: str,
     new: str,
     marker_style: ConflictMarkerStyle = ConflictMarkerStyle.GIT,
+    *,
+    refine: bool = True,
+    stats: MergeStats | None = None,
+    backend: MergeBackend = MergeBackend.PYTHON,
 ) -> tuple[str, list[MergeConflict]]:
     """Perform three-way merge preserving user customizations.
 
@@ -50,106 +314,121 @@ def three_way_merge(
         user: User's modified version
         new: New template version
         marker_style: Style for conflict markers (default: GIT)
+        refine: Re-merge conflicting hunks word by word before giving up
+        stats: Optional counters, updated with conflicts resolved by refine
+        backend: Line merge engine; AUTO uses git merge-file for large inputs
+            (results can differ from PYTHON, see MergeBackend)
 
     Returns:
         Tuple of (merged_content, list_of_conflicts)
     """
-    # If base is empty, this is a new file - take new version
-    if not base:
-        return new, []
-
-    # If user hasn't changed from base, take new version
-    if user == base:
-        return new, []
+    conflicts: list[MergeConflict] = []
+    merged = "".join(
+        iter_three_way_merge(
+            base,
+            user,
+            new,
+            marker_style,
+            refine=refine,
+            stats=stats,
+            conflicts=conflicts,
+            backend=backend,
+        )
+    )
+    return merged, conflicts
 
-    # If new hasn't changed from base, keep user version
-    if new == base:
-        return user, []
 
-    # If user and new are the same, no conflict
-    if user == new:
-        return user, []
+def iter_three_way_merge(
+    base: str,
+    user: str,
+    new: str,
+    marker_style: ConflictMarkerStyle = ConflictMarkerStyle.GIT,
+    *,
+    refine: bool = True,
+    stats: MergeStats | None = None,
+    conflicts: list[MergeConflict] | None = None,
+    backend: MergeBackend = MergeBackend.PYTHON,
+) -> Iterator[str]:
+    """Three-way merge that yields the merged text piece by piece.
 
-    # Perform line-by-line merge
-    base_lines = base.splitlines(keepends=True)
-    user_lines = user.splitlines(keepends=True)
-    new_lines = new.splitlines(keepends=True)
+    Same result as three_way_merge, without building the merged string;
+    pair it with fileio.atomic_write_chunks to stream a merge to disk.
 
-    conflicts: list[MergeConflict] = []
-    merged_lines: list[str] = []
-
-    # Use SequenceMatcher to find differences
-    user_matcher = difflib.SequenceMatcher(None, base_lines, user_lines)
-    new_matcher = difflib.SequenceMatcher(None, base_lines, new_lines)
-
-    # Build change maps
-    user_changes: dict[int, tuple[str, int, int, int, int]] = {}
-    for op in user_matcher.get_opcodes():
-        if op[0] != "equal":
-            user_changes[op[1]] = op
-
-    new_changes: dict[int, tuple[str, int, int, int, int]] = {}
-    for op in new_matcher.get_opcodes():
-        if op[0] != "equal":
-            new_changes[op[1]] = op
-
-    i = 0
-    while i < len(base_lines):
-        user_op = user_changes.get(i)
-        new_op = new_changes.get(i)
-
-        if user_op is None and new_op is None:
-            # No changes at this position
-            merged_lines.append(base_lines[i])
-            i += 1
-        elif user_op is None and new_op is not None:
-            # Only new template changed
-            _, i1, i2, j1, j2 = new_op
-            merged_lines.extend(new_lines[j1:j2])
-            i = i2
-        elif user_op is not None and new_op is None:
-            # Only user changed - preserve their changes
-            _, i1, i2, j1, j2 = user_op
-            merged_lines.extend(user_lines[j1:j2])
-            i = i2
-        else:
-            # Both changed - check if same change or conflict
-            assert user_op is not None and new_op is not None
-            _, u_i1, u_i2, u_j1, u_j2 = user_op
-            _, n_i1, n_i2, n_j1, n_j2 = new_op
+    Args:
+        base: Original template content (from previous version)
+        user: User's modified version
+        new: New template version
+        marker_style: Style for conflict markers (default: GIT)
+        refine: Re-merge conflicting hunks word by word before giving up
+        stats: Optional counters, updated with conflicts resolved by refine
+        conflicts: Optional list that conflicts are appended to as they
+            are produced (complete once the generator is exhausted)
+        backend: Line merge engine; AUTO uses git merge-file for large inputs
+            (results can differ from PYTHON, see MergeBackend)
+
+    Yields:
+        Consecutive pieces of the merged content
+    """
+    # If base is empty, this is a new file - take new version
+    # If user hasn't changed from base, take new version
+    if not base or user == base:
+        yield new
+        return
 
-            user_content = "".join(user_lines[u_j1:u_j2])
-            new_content = "".join(new_lines[n_j1:n_j2])
+    # If new hasn't changed from base, or both sides agree, keep user version
+    if new == base or user == new:
+        yield user
+        return
 
-            if user_content == new_content:
-                # Same change - use either
-                merged_lines.extend(user_lines[u_j1:u_j2])
-            else:
-                # Conflict - add markers
-                conflict = MergeConflict(
-                    line_number=len(merged_lines) + 1,
-                    base_content="".join(base_lines[u_i1:u_i2]),
-                    user_content=user_content,
-                    new_content=new_content,
-                )
-                conflicts.append(conflict)
+    chunks = _git_chunks(base, user, new, backend) or _python_chunks(base, user, new)
 
-                # Add conflict markers
-                start, sep, end = get_conflict_markers(marker_style)
-                merged_lines.append(start)
-                merged_lines.extend(user_lines[u_j1:u_j2])
-                merged_lines.append(sep)
-                merged_lines.extend(new_lines[n_j1:n_j2])
-                merged_lines.append(end)
+    start, sep, end = get_conflict_markers(marker_style)
+    line_count = 0
 
-            i = max(u_i2, n_i2)
+    for chunk in chunks:
+        if not chunk.conflict:
+            yield from chunk.lines
+            line_count += len(chunk.lines)
+            continue
 
-    return "".join(merged_lines), conflicts
+        if refine:
+            resolved = refine_conflict(
+                "".join(chunk.base), "".join(chunk.user), "".join(chunk.new)
+            )
+            if resolved is not None:
+                yield resolved
+                line_count += len(resolved.splitlines())
+                if stats is not None:
+                    stats.auto_resolved += 1
+                continue
+
+        if conflicts is not None:
+            conflicts.append(
+                MergeConflict(
+                    line_number=line_count + 1,
+                    base_content="".join(chunk.base),
+                    user_content="".join(chunk.user),
+                    new_content="".join(chunk.new),
+                )
+            )
+        user_lines = _with_newline(chunk.user)
+        new_lines = _with_newline(chunk.new)
+        yield start
+        yield from user_lines
+        yield sep
+        yield from new_lines
+        yield end
+        line_count += len(user_lines) + len(new_lines) + 3
 
 
 def parse_markdown_sections(content: str) -> dict[str, str]:
     """Parse markdown into sections by ## headers.
 
+    Headers inside fenced code blocks are ignored. A repeated title gets a
+    " (2)", " (3)", ... suffix instead of overwriting the earlier section.
+    A # header after the first ## section starts a section of its own, so
+    its intro text is kept; joining the values gives back the content.
+
     Args:
         content: Markdown content
 
@@ -157,142 +436,364 @@ def parse_markdown_sections(content: str) -> dict[str, str]:
         Dict mapping section titles to their content (including header)
     """
     sections: dict[str, str] = {}
+    root = parse_outline(content)
+    nodes = nodes_at_level(root, 2)
+    if nodes:
+        first = nodes[0].start
+        nodes = sorted(
+            nodes + [n for n in _higher_nodes(root) if n.start > first],
+            key=lambda n: n.start,
+        )
 
-    # Split by ## headers, keeping the delimiter
-    pattern = r"(^## .+$)"
-    parts = re.split(pattern, content, flags=re.MULTILINE)
-
-    # First part before any ## header
-    if parts[0].strip():
-        sections["_preamble"] = parts[0]
-
-    # Process header/content pairs
-    for i in range(1, len(parts), 2):
-        if i + 1 < len(parts):
-            header = parts[i].strip()
-            section_content = parts[i + 1]
-            # Extract section title without ##
-            title = header.replace("## ", "").strip()
-            sections[title] = header + "\n" + section_content
-        elif parts[i].strip():
-            # Header without content
-            header = parts[i].strip()
-            title = header.replace("## ", "").strip()
-            sections[title] = header + "\n"
+    preamble = content[: nodes[0].start] if nodes else content
+    if preamble.strip():
+        sections["_preamble"] = preamble
+
+    for i, node in enumerate(nodes):
+        end = nodes[i + 1].start if i + 1 < len(nodes) else len(content)
+        title = node.title
+        n = 2
+        while title in sections:
+            title = f"{node.title} ({n})"
+            n += 1
+        sections[title] = content[node.start : end]
 
     return sections
 
 
+def _higher_nodes(node: OutlineNode) -> Iterator[OutlineNode]:
+    """Headers above ## level (i.e. #), in document order."""
+    for child in node.children:
+        if child.level < 2:
+            yield child
+            yield from _higher_nodes(child)
+
+
+_TITLE_NOISE_RE = re.compile(r"[^\w\s]")
+
+# Normalized-title key: (normalized title, occurrence of that title)
+TitleKey = tuple[str, int]
+
+# Estimated shingle similarity at which a dropped and an added section
+# are treated as one renamed section
+RENAME_SIMILARITY = 0.5
+
+
+@lru_cache(maxsize=4096)
+def normalize_title(title: str) -> str:
+    """Normalize a section title for matching (case, emoji, punctuation)."""
+    return _TITLE_NOISE_RE.sub("", title).lower().strip()
+
+
+class TitleIndex:
+    """Normalized-title lookup over one level of a document outline.
+
+    Built once per node list; lookups are O(1), so matching the sections
+    of two documents is linear in their number. # headers are keyed by
+    position rather than title: the document title usually holds the
+    project name, which the user may rename or detection may change.
+    """
+
+    def __init__(self, nodes: Iterable[OutlineNode]) -> None:
+        """Index nodes by normalized title and occurrence of that title."""
+        seen: dict[str, int] = {}
+        self.entries: list[tuple[TitleKey, OutlineNode]] = []
+        for node in nodes:
+            normalized = normalize_title(node.title) if node.level >= 2 else ""
+            seen[normalized] = seen.get(normalized, 0) + 1
+            self.entries.append(((normalized, seen[normalized]), node))
+        self._by_key = dict(self.entries)
+        self.titles = set(seen)
+
+    def get(self, key: TitleKey) -> OutlineNode | None:
+        """Node with the given key, if any."""
+        return self._by_key.get(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Check for a key, or for a normalized title at any occurrence."""
+        if isinstance(key, str):
+            return key in self.titles
+        return key in self._by_key
+
+
+class _SectionMerger:
+    """Merges three outline trees, descending only into changed branches."""
+
+    def __init__(
+        self,
+        base: str,
+        user: str,
+        new: str,
+        marker_style: ConflictMarkerStyle,
+        refine: bool,
+        stats: MergeStats | None,
+        conflicts: list[SectionConflict],
+    ) -> None:
+        """Store the three texts and merge options."""
+        self.base = base
+        self.user = user
+        self.new = new
+        self.markers = get_conflict_markers(marker_style)
+        self.refine = refine
+        self.stats = stats
+        self.conflicts = conflicts
+
+    def _conflict(self, title: str, base: str, user: str, new: str) -> str:
+        """Record a section conflict and return it wrapped in markers."""
+        self.conflicts.append(
+            SectionConflict(
+                section_title=title,
+                base_content=base,
+                user_content=user,
+                new_content=new,
+            )
+        )
+        start, sep, end = self.markers
+        return f"{start}{user.rstrip()}\n{sep}{new.rstrip()}\n{end}"
+
+    def iter_merge(
+        self, base: OutlineNode | None, user: OutlineNode, new: OutlineNode
+    ) -> Iterator[str]:
+        """Merge the document roots, yielding the output piece by piece.
+
+        Merged sections are separated by one blank line. Parts are yielded
+        as soon as their subtree is merged, so only one section's text is
+        built at a time.
+        """
+        whole = self._merge_whole(base, user, new)
+        if whole is not None:
+            yield whole
+            return
+
+        first = True
+        for part in self._iter_parts(base, user, new):
+            if not part.strip():
+                continue
+            if not first:
+                yield "\n\n"
+            yield part.rstrip()
+            first = False
+        yield "\n"
+
+    def _merge_whole(
+        self, base: OutlineNode | None, user: OutlineNode, new: OutlineNode
+    ) -> str | None:
+        """Merge a node without descending, or None if its children differ."""
+        user_text = self.user[user.start : user.end]
+        new_text = self.new[new.start : new.end]
+
+        # Whole subtree unchanged on one side - no need to look inside
+        if user.digest == new.digest:
+            return user_text
+        if base is not None and user.digest == base.digest:
+            return new_text
+        if base is not None and new.digest == base.digest:
+            return user_text
+
+        # The document and top-level titles always descend; leaf sections
+        # below them conflict as a whole
+        if user.level >= 2 and not (user.children or new.children):
+            base_text = self.base[base.start : base.end] if base else ""
+            if self.refine and base_text:
+                # Edits to different lines or words of the section still merge
+                merged, line_conflicts = three_way_merge(
+                    base_text, user_text, new_text, refine=True
+                )
+                if not line_conflicts:
+                    if self.stats is not None:
+                        self.stats.auto_resolved += 1
+                    return merged
+            return self._conflict(user.title, base_text, user_text, new_text)
+
+        return None
+
+    def _iter_parts(
+        self, base: OutlineNode | None, user: OutlineNode, new: OutlineNode
+    ) -> Iterator[str]:
+        """Merged head and child sections of a node that changed inside."""
+        yield self._merge_head(base, user, new)
+
+        base_index = TitleIndex(base.children) if base else None
+        user_index = TitleIndex(user.children)
+        new_index = TitleIndex(new.children)
+        renamed = self._align_renamed(base_index, user_index, new_index)
+
+        # Keep user order, then append sections new in the template
+        for key, user_child in user_index.entries:
+            new_child = new_index.get(key) or renamed.get(key)
+            if new_child is None:
+                # Section only in user - keep it
+                yield self.user[user_child.start : user_child.end]
+                continue
+            base_child = base_index.get(key) if base_index else None
+            whole = self._merge_whole(base_child, user_child, new_child)
+            if whole is None:
+                yield from self._iter_parts(base_child, user_child, new_child)
+            else:
+                yield whole
+
+        paired = {id(node) for node in renamed.values()}
+        for key, new_child in new_index.entries:
+            if key not in user_index and id(new_child) not in paired:
+                # New section - add it
+                yield self.new[new_child.start : new_child.end]
+
+    def _align_renamed(
+        self,
+        base_index: TitleIndex | None,
+        user_index: TitleIndex,
+        new_index: TitleIndex,
+    ) -> dict[TitleKey, OutlineNode]:
+        """Match sections the template renamed or moved by content similarity.
+
+        Candidates are the user's sections whose title the template
+        dropped since base, and template sections whose title is new since
+        base. The base version of each dropped section is compared with
+        each added one; MinHash signatures are computed once per candidate.
+
+        Returns:
+            Added template section for each renamed user section key
+        """
+        if base_index is None:
+            return {}  # Without a base, a user's own section could look renamed
+        added = [
+            node
+            for key, node in new_index.entries
+            if key not in user_index and key not in base_index
+        ]
+        if not added:
+            return {}
+
+        left: list[tuple[TitleKey, Signature]] = []
+        for key, _ in user_index.entries:
+            base_child = base_index.get(key)
+            if base_child is None or key in new_index:
+                continue
+            sig = signature(self.base[base_child.body_start : base_child.end])
+            if sig is not None:
+                left.append((key, sig))
+        right: list[tuple[OutlineNode, Signature]] = []
+        for node in added:
+            sig = signature(self.new[node.body_start : node.end])
+            if sig is not None:
+                right.append((node, sig))
+        if not left or not right:
+            return {}
+
+        pairs = best_pairs(
+            [sig for _, sig in left], [sig for _, sig in right], RENAME_SIMILARITY
+        )
+        return {left[i][0]: right[j][0] for i, j in pairs}
+
+    def _merge_head(
+        self, base: OutlineNode | None, user: OutlineNode, new: OutlineNode
+    ) -> str:
+        """Merge a node's own header and intro text."""
+        user_head = self.user[user.start : head_end(user)]
+        # Without a base, the preamble and document title stay as the
+        # user wrote them
+        if user.level < 2 and base is None:
+            return user_head
+
+        new_head = self.new[new.start : head_end(new)]
+        base_head = self.base[base.start : head_end(base)] if base else ""
+        user_key, new_key = user_head.rstrip(), new_head.rstrip()
+        if user_key == new_key or (base and new_key == base_head.rstrip()):
+            return user_head
+        if base and user_key == base_head.rstrip():
+            return new_head
+        title = user.title if user.level else "_preamble"
+        return self._conflict(title, base_head, user_head, new_head)
+
+
 def three_way_merge_sections(
     base: str,
     user: str,
     new: str,
     marker_style: ConflictMarkerStyle = ConflictMarkerStyle.HTML_COMMENT,
+    *,
+    refine: bool = True,
+    stats: MergeStats | None = None,
 ) -> tuple[str, list[SectionConflict]]:
     """Three-way merge at section level for markdown files.
 
-    Parses markdown by ## headers and merges sections intelligently:
+    Parses each version into a header tree and merges it top-down:
     - Sections only in user are preserved
     - Sections only in new template are added
-    - Identical sections are kept as-is
-    - Modified sections are merged or marked as conflicts
+    - Subtrees with equal content hashes are taken without comparing text
+    - A section changed on both sides is merged subsection by subsection,
+      so a conflict covers only the smallest section both sides changed
+    - A leaf section both sides changed is re-merged line by line and then
+      word by word before it is reported as a conflict
 
     Args:
         base: Original template content (from previous version)
         user: User's current version
         new: New template version
         marker_style: Style for conflict markers (default: HTML_COMMENT)
+        refine: Try line and word-level merges of conflicting sections
+        stats: Optional counters, updated with conflicts resolved by refine
 
     Returns:
         Tuple of (merged_content, list_of_section_conflicts)
     """
-    base_sections = parse_markdown_sections(base) if base else {}
-    user_sections = parse_markdown_sections(user)
-    new_sections = parse_markdown_sections(new)
-
     conflicts: list[SectionConflict] = []
-    result_parts: list[str] = []
-
-    # Track which sections we've processed
-    processed_sections: set[str] = set()
-
-    # Helper to normalize section titles for comparison
-    def normalize_title(title: str) -> str:
-        return re.sub(r"[^\w\s]", "", title).lower().strip()
-
-    # Build a map of normalized titles to actual titles
-    new_title_map = {normalize_title(t): t for t in new_sections}
-    base_title_map = {normalize_title(t): t for t in base_sections}
-
-    # Process user's sections first (preserve their order)
-    for user_title, user_content in user_sections.items():
-        if user_title == "_preamble":
-            result_parts.append(user_content)
-            processed_sections.add("_preamble")
-            continue
-
-        normalized = normalize_title(user_title)
-        processed_sections.add(normalized)
-
-        # Check if section exists in new template
-        if normalized in new_title_map:
-            new_title = new_title_map[normalized]
-            new_content = new_sections[new_title]
-
-            # Check base for three-way comparison
-            base_content = ""
-            if normalized in base_title_map:
-                base_title = base_title_map[normalized]
-                base_content = base_sections[base_title]
-
-            # Determine how to handle this section
-            if user_content == new_content:
-                # Same content - keep either
-                result_parts.append(user_content)
-            elif user_content == base_content:
-                # User didn't change from base - take new version
-                result_parts.append(new_content)
-            elif new_content == base_content:
-                # New template didn't change from base - keep user version
-                result_parts.append(user_content)
-            else:
-                # Both changed differently - this is a conflict
-                conflict = SectionConflict(
-                    section_title=user_title,
-                    base_content=base_content,
-                    user_content=user_content,
-                    new_content=new_content,
-                )
-                conflicts.append(conflict)
+    merged = "".join(
+        iter_three_way_merge_sections(
+            base,
+            user,
+            new,
+            marker_style,
+            refine=refine,
+            stats=stats,
+            conflicts=conflicts,
+        )
+    )
+    return merged, conflicts
 
-                # Add with conflict markers
-                start, sep, end = get_conflict_markers(marker_style)
-                result_parts.append(
-                    f"{start}{user_content.rstrip()}\n{sep}{new_content.rstrip()}\n{end}"
-                )
-        else:
-            # Section only in user - keep it
-            result_parts.append(user_content)
 
-    # Add new sections that don't exist in user's file
-    for new_title, new_content in new_sections.items():
-        if new_title == "_preamble":
-            continue
+def iter_three_way_merge_sections(
+    base: str,
+    user: str,
+    new: str,
+    marker_style: ConflictMarkerStyle = ConflictMarkerStyle.HTML_COMMENT,
+    *,
+    refine: bool = True,
+    stats: MergeStats | None = None,
+    conflicts: list[SectionConflict] | None = None,
+) -> Iterator[str]:
+    """Section-level merge that yields the merged text section by section.
 
-        normalized = normalize_title(new_title)
-        if normalized not in processed_sections:
-            # New section - add it
-            result_parts.append(new_content)
+    Same result as three_way_merge_sections, without building the merged
+    string; pair it with fileio.atomic_write_chunks to stream to disk.
 
-    # Join with proper spacing
-    merged = ""
-    for i, part in enumerate(result_parts):
-        if i == 0:
-            merged = part.rstrip()
-        else:
-            merged += "\n\n" + part.rstrip()
+    Args:
+        base: Original template content (from previous version)
+        user: User's current version
+        new: New template version
+        marker_style: Style for conflict markers (default: HTML_COMMENT)
+        refine: Try line and word-level merges of conflicting sections
+        stats: Optional counters, updated with conflicts resolved by refine
+        conflicts: Optional list that section conflicts are appended to
+            (complete once the generator is exhausted)
 
-    return merged + "\n", conflicts
+    Yields:
+        Consecutive pieces of the merged content
+    """
+    merger = _SectionMerger(
+        base,
+        user,
+        new,
+        marker_style,
+        refine,
+        stats,
+        conflicts if conflicts is not None else [],
+    )
+    yield from merger.iter_merge(
+        parse_outline(base) if base else None,
+        parse_outline(user),
+        parse_outline(new),
+    )
 
 
 def merge_claude_md_sections(
@@ -311,8 +812,7 @@ def merge_claude_md_sections(
     Returns:
         Tuple of (merged_content, list_of_added_section_names)
     """
-    existing_sections = parse_markdown_sections(existing)
-    template_sections = parse_markdown_sections(template)
+    known_titles = TitleIndex(nodes_at_level(parse_outline(existing), 2)).titles
 
     added_sections: list[str] = []
     result_parts: list[str] = []
@@ -321,22 +821,13 @@ def merge_claude_md_sections(
     result_parts.append(existing.rstrip())
 
     # Find sections in template that don't exist in user's file
-    for title, content in template_sections.items():
-        if title == "_preamble":
+    # (case-insensitive, ignoring emojis)
+    for node in nodes_at_level(parse_outline(template), 2):
+        normalized = normalize_title(node.title)
+        if normalized in known_titles:
             continue
-
-        # Check if section exists (case-insensitive, ignore emojis)
-        title_normalized = re.sub(r"[^\w\s]", "", title).lower().strip()
-        exists = False
-
-        for existing_title in existing_sections:
-            existing_normalized = re.sub(r"[^\w\s]", "", existing_title).lower().strip()
-            if title_normalized == existing_normalized:
-                exists = True
-                break
-
-        if not exists:
-            added_sections.append(title)
-            result_parts.append("\n\n" + content.rstrip())
+        known_titles.add(normalized)  # Add repeated template titles once
+        added_sections.append(node.title)
+        result_parts.append("\n\n" + template[node.start : node.end].rstrip())
 
     return "\n".join(result_parts) + "\n", added_sections
@@ -0,0 +1,102 @@
+"""MinHash signatures for finding similar sections without comparing all pairs.
+
+Signatures use one-permutation hashing: each word shingle is hashed once,
+the hash picks one of NUM_PERM bins and the smallest value per bin is
+kept. The fraction of equal bins in two signatures estimates the Jaccard
+similarity of their shingle sets. Locality-sensitive hashing over bands
+of the signature proposes candidate pairs, so matching n sections against
+m costs about n + m signatures instead of n * m diffs.
+"""
+
+import hashlib
+import re
+from collections import defaultdict
+from collections.abc import Sequence
+
+NUM_PERM = 32
+# 8 bands of 4 rows: pairs above ~0.5 similarity almost always share a band
+BANDS = 8
+ROWS = NUM_PERM // BANDS
+SHINGLE_WORDS = 3
+
+_EMPTY = 1 << 64
+_WORD_RE = re.compile(r"\w+")
+
+Signature = tuple[int, ...]
+
+
+def shingles(text: str) -> set[str]:
+    """Lowercased word n-grams of text (single words for very short text)."""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < SHINGLE_WORDS:
+        return set(words)
+    return {
+        " ".join(words[i : i + SHINGLE_WORDS])
+        for i in range(len(words) - SHINGLE_WORDS + 1)
+    }
+
+
+def signature(text: str) -> Signature | None:
+    """MinHash signature of text's shingles, or None if it has no words."""
+    bins = [_EMPTY] * NUM_PERM
+    for shingle in shingles(text):
+        # blake2b rather than hash(): signatures must not vary between runs
+        h = int.from_bytes(
+            hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        slot, value = h % NUM_PERM, h // NUM_PERM
+        if value < bins[slot]:
+            bins[slot] = value
+    if all(value == _EMPTY for value in bins):
+        return None
+
+    # Fill empty bins from the next filled one, tagged with the distance,
+    # so short texts still compare bin by bin
+    filled: list[int] = []
+    for slot in range(NUM_PERM):
+        distance = 0
+        while bins[(slot + distance) % NUM_PERM] == _EMPTY:
+            distance += 1
+        filled.append(bins[(slot + distance) % NUM_PERM] + distance * _EMPTY)
+    return tuple(filled)
+
+
+def similarity(a: Signature, b: Signature) -> float:
+    """Estimated Jaccard similarity of the texts behind two signatures."""
+    return sum(x == y for x, y in zip(a, b, strict=True)) / NUM_PERM
+
+
+def best_pairs(
+    left: Sequence[Signature], right: Sequence[Signature], threshold: float
+) -> list[tuple[int, int]]:
+    """Pair left and right signatures by similarity, each used at most once.
+
+    Candidates come from LSH buckets; pairs at or above threshold are taken
+    greedily from most to least similar.
+
+    Returns:
+        (left index, right index) pairs
+    """
+    buckets: dict[tuple[int, Signature], list[int]] = defaultdict(list)
+    for j, sig in enumerate(right):
+        for band in range(BANDS):
+            buckets[band, sig[band * ROWS : (band + 1) * ROWS]].append(j)
+
+    scored: dict[tuple[int, int], float] = {}
+    for i, sig in enumerate(left):
+        for band in range(BANDS):
+            for j in buckets.get((band, sig[band * ROWS : (band + 1) * ROWS]), ()):
+                if (i, j) not in scored:
+                    scored[i, j] = similarity(sig, right[j])
+
+    pairs: list[tuple[int, int]] = []
+    used_left: set[int] = set()
+    used_right: set[int] = set()
+    # Most similar first; ties keep document order
+    for (i, j), score in sorted(scored.items(), key=lambda item: (-item[1], item[0])):
+        if score < threshold or i in used_left or j in used_right:
+            continue
+        pairs.append((i, j))
+        used_left.add(i)
+        used_right.add(j)
+    return pairs
@@ -3,6 +3,7 @@
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
 
 class SetupMode(Enum):
@@ -25,6 +26,18 @@ class ProjectConfig:
     linter: str | None = None
 
 
+@dataclass
+class TemplateEntry:
+    """A bundled template as recorded in the build-time manifest."""
+
+    path: str  # Output path relative to project root (no .j2)
+    source: str  # Path inside the templates package
+    size: int  # Source size in bytes
+    sha256: str  # Hex digest of the source bytes
+    is_jinja: bool
+    modes: list[str] = field(default_factory=lambda: ["full"])
+
+
 @dataclass
 class ValidationResult:
     """Result of a validation check."""
@@ -56,6 +69,90 @@ class MergeConflict:
     new_content: str
 
 
+@dataclass
+class MergeChunk:
+    """One region of a diff3 merge.
+
+    Stable chunks carry the merged lines. Conflict chunks carry each
+    side's lines for the same base range.
+    """
+
+    lines: list[str] = field(default_factory=list)
+    conflict: bool = False
+    base: list[str] = field(default_factory=list)
+    user: list[str] = field(default_factory=list)
+    new: list[str] = field(default_factory=list)
+
+
+@dataclass
+class OutlineNode:
+    """A markdown header and everything up to the next header at its level.
+
+    Offsets are character indices into the parsed text. The root node has
+    level 0 and spans the whole document.
+    """
+
+    title: str
+    level: int
+    start: int  # Start of the header line
+    body_start: int  # Start of the line after the header
+    end: int = 0  # End of the subtree (exclusive)
+    digest: str = ""  # SHA-256 of text[start:end].rstrip()
+    children: list["OutlineNode"] = field(default_factory=list)
+
+
+@dataclass
+class MergeStats:
+    """Counters accumulated across one or more merges."""
+
+    auto_resolved: int = 0  # Conflicts removed by finer-grained re-merging
+
+
+@dataclass
+class NewSectionsResult:
+    """Template sections missing from a user's file, found locally."""
+
+    content: str | None  # Sections to append, or None if there are none
+    titles: list[str]
+    confidence: float  # 0-1; below the threshold the AI is asked instead
+
+
+@dataclass
+class AIUsage:
+    """Token counts accumulated across AI requests.
+
+    Input is split three ways: prompt prefixes read from the prompt cache,
+    prefixes written to it (billed at a premium, once), and uncached input.
+    """
+
+    requests: int = 0
+    input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    output_tokens: int = 0
+
+    def add(self, usage: Any) -> None:
+        """Add the usage block of one API response."""
+        self.requests += 1
+        for name in (
+            "input_tokens",
+            "cache_read_input_tokens",
+            "cache_creation_input_tokens",
+            "output_tokens",
+        ):
+            # Cache fields are None when the request used no cache_control
+            setattr(self, name, getattr(self, name) + (getattr(usage, name, 0) or 0))
+
+    def summary(self) -> str:
+        """One-line description for the end of a batch."""
+        return (
+            f"{self.requests} AI request(s): "
+            f"{self.cache_read_input_tokens} input tokens from prompt cache, "
+            f"{self.cache_creation_input_tokens} written to it, "
+            f"{self.input_tokens} uncached; {self.output_tokens} output tokens"
+        )
+
+
 @dataclass
 class MergeResult:
     """Result of template merge operation."""
@@ -86,6 +183,19 @@ class FileConflict:
     resolution: ConflictResolution | None = None
 
 
+@dataclass
+class BatchProjectResult:
+    """Outcome of initializing one project in batch mode."""
+
+    path: Path
+    project_name: str
+    status: str  # "ok" or "error"
+    created: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    error: str | None = None
+    dry_run: bool = False  # created lists files that would be written
+
+
 @dataclass
 class SectionConflict:
     """A conflict at the markdown section level."""
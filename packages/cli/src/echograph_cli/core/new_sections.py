@@ -0,0 +1,157 @@
+"""Local detection of template sections missing from a user's markdown file.
+
+Answers the same question as the AI extract-new-sections prompt - which
+## sections of the template have no counterpart in the user's file - from
+the two outlines. Each template section is matched against the user's ##
+headers by title (exact, with [[PLACEHOLDER]] wildcards, or fuzzy) and by
+content similarity; headers at other levels can only make it ambiguous.
+A section is only decided when its best match is clearly strong or
+clearly absent; in between, the confidence of the whole answer drops and
+the caller should ask the AI instead.
+"""
+
+import re
+
+from echograph_cli.core.diff import similarity_ratio
+from echograph_cli.core.merge import normalize_title
+from echograph_cli.core.minhash import Signature, signature, similarity
+from echograph_cli.core.models import NewSectionsResult, OutlineNode
+from echograph_cli.core.outline import nodes_at_level, parse_outline
+
+# Below this, smart merge asks the AI rather than trusting the local answer
+MIN_LOCAL_CONFIDENCE = 0.8
+
+# Title similarity above which two headers are the same section, and
+# below which they are unrelated; the band in between is ambiguous
+TITLE_SAME = 0.85
+TITLE_UNRELATED = 0.6
+# Score for titles where one's words contain the other's (mid-band)
+TITLE_SUBSET = (TITLE_SAME + TITLE_UNRELATED) / 2
+# The same bounds for estimated content similarity (renamed sections)
+CONTENT_SAME = 0.5
+CONTENT_UNRELATED = 0.25
+
+# Template variables, as recognized by is_placeholder_only_diff
+_PLACEHOLDER_RE = re.compile(r"\[\[[A-Z_]+\]\]")
+
+
+def _all_nodes(node: OutlineNode) -> list[OutlineNode]:
+    """Every header below node, at any level, in document order."""
+    found: list[OutlineNode] = []
+    for child in node.children:
+        found.append(child)
+        found.extend(_all_nodes(child))
+    return found
+
+
+class _HeaderSet:
+    """Titles and content signatures of a group of the user's headers."""
+
+    def __init__(self, nodes: list[OutlineNode], content: str) -> None:
+        """Index the nodes' normalized titles and body signatures."""
+        self.nodes = nodes
+        self.titles = {normalize_title(node.title) for node in nodes}
+        self.signatures = [
+            sig
+            for node in nodes
+            if (sig := signature(content[node.body_start : node.end])) is not None
+        ]
+
+    def strength(self, node: OutlineNode, body_sig: Signature | None) -> float:
+        """How strongly these headers say the template node already exists."""
+        if not self.nodes:
+            return 0.0
+        if normalize_title(node.title) in self.titles:
+            return 1.0
+        pattern = _title_pattern(node.title)
+        if pattern and any(pattern.fullmatch(u.title) for u in self.nodes):
+            return 1.0
+        bare_title = normalize_title(_PLACEHOLDER_RE.sub("", node.title))
+        title_score = max(_title_similarity(bare_title, t) for t in self.titles)
+        content_score = max(
+            (similarity(body_sig, s) for s in self.signatures if body_sig is not None),
+            default=0.0,
+        )
+        return _match_strength(title_score, content_score)
+
+
+def _title_pattern(title: str) -> re.Pattern[str] | None:
+    """Regex matching a template title with its placeholders filled in."""
+    if not _PLACEHOLDER_RE.search(title):
+        return None
+    parts = [re.escape(part) for part in _PLACEHOLDER_RE.split(title)]
+    return re.compile(".+?".join(parts), re.IGNORECASE)
+
+
+def _title_similarity(a: str, b: str) -> float:
+    """Similarity of two normalized titles.
+
+    A title whose words all appear in the other ("Security Rules" and
+    "Security Rules (CRITICAL)") may name the same section, but "Commands"
+    and "Build Commands" may not: word containment alone lands in the
+    ambiguous band, so the section's content has to agree as well.
+    """
+    score = similarity_ratio(a, b)
+    a_words, b_words = set(a.split()), set(b.split())
+    if a_words and b_words and (a_words <= b_words or b_words <= a_words):
+        return max(score, TITLE_SUBSET)
+    return score
+
+
+def _match_strength(title_score: float, content_score: float) -> float:
+    """How strongly the best match says "exists", from 0 (new) to 1 (exists)."""
+    by_title = (title_score - TITLE_UNRELATED) / (TITLE_SAME - TITLE_UNRELATED)
+    by_content = (content_score - CONTENT_UNRELATED) / (
+        CONTENT_SAME - CONTENT_UNRELATED
+    )
+    return min(1.0, max(0.0, by_title, by_content))
+
+
+def detect_new_sections(user_content: str, template_content: str) -> NewSectionsResult:
+    """Find the template's ## sections that the user's file doesn't have.
+
+    Args:
+        user_content: User's current file content
+        template_content: New template content
+
+    Returns:
+        The new sections (template text, ready to append) and a
+        confidence in [0, 1]; 0 when the files have no headers to compare
+    """
+    template = nodes_at_level(parse_outline(template_content), 2)
+    user_nodes = _all_nodes(parse_outline(user_content))
+    if not template or not user_nodes:
+        return NewSectionsResult(content=None, titles=[], confidence=0.0)
+
+    # Only ## headers can decide that a ## section exists; a match at
+    # another level ("### Build Commands") leaves the answer to the AI
+    same_level = _HeaderSet([n for n in user_nodes if n.level == 2], user_content)
+    other_levels = _HeaderSet([n for n in user_nodes if n.level != 2], user_content)
+
+    confidence = 1.0
+    added: list[OutlineNode] = []
+    seen: set[str] = set()
+    for node in template:
+        normalized = normalize_title(node.title)
+        if normalized in seen:
+            continue  # A repeated template title already added
+        body = _PLACEHOLDER_RE.sub(" ", template_content[node.body_start : node.end])
+        body_sig = signature(body)
+        strength = max(
+            same_level.strength(node, body_sig),
+            min(0.5, other_levels.strength(node, body_sig)),
+        )
+        # Certain at either end of the band, a coin toss in the middle
+        confidence = min(confidence, abs(2 * strength - 1))
+        if strength < 0.5:
+            seen.add(normalized)
+            added.append(node)
+
+    content = "\n\n".join(
+        template_content[node.start : node.end].rstrip() for node in added
+    )
+    return NewSectionsResult(
+        content=content or None,
+        titles=[node.title for node in added],
+        confidence=confidence,
+    )
@@ -0,0 +1,112 @@
+"""Single-pass markdown outline parser.
+
+Builds a tree of ATX headers (# to ######) with character offsets and a
+content hash per subtree, so merges can skip branches that are equal on
+both sides without comparing their text. Headers inside fenced code
+blocks are ignored.
+"""
+
+import hashlib
+import re
+from collections.abc import Iterator
+
+from echograph_cli.core.models import OutlineNode
+
+_HEADER_RE = re.compile(r" {0,3}(#{1,6})[ \t]+(\S.*?)[ \t]*$")
+_FENCE_RE = re.compile(r" {0,3}(`{3,}|~{3,})")
+
+# Characters of text split into lines or hashed at a time, so large
+# documents are never copied whole
+_BLOCK_CHARS = 1 << 16
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """Yield text.splitlines(keepends=True) without building the whole list.
+
+    Blocks are cut just after a "\n", which always ends a line (and a
+    "\r\n" pair), so the lines are the same as splitting the full text.
+    """
+    pos = 0
+    while pos < len(text):
+        cut = text.find("\n", pos + _BLOCK_CHARS) + 1 or len(text)
+        yield from text[pos:cut].splitlines(keepends=True)
+        pos = cut
+
+
+def _close(node: OutlineNode, end: int, text: str) -> None:
+    """Finish a node at end and hash its subtree.
+
+    Trailing whitespace only separates a section from the next one, so it
+    is left out of the hash.
+    """
+    node.end = end
+    stop = end
+    while stop > node.start and text[stop - 1].isspace():
+        stop -= 1
+    digest = hashlib.sha256()
+    for pos in range(node.start, stop, _BLOCK_CHARS):
+        digest.update(text[pos : min(pos + _BLOCK_CHARS, stop)].encode("utf-8"))
+    node.digest = digest.hexdigest()
+
+
+def parse_outline(text: str) -> OutlineNode:
+    """Parse markdown into a header tree in one pass over its lines.
+
+    Args:
+        text: Markdown content
+
+    Returns:
+        Root node (level 0) whose children are the top-level headers
+    """
+    root = OutlineNode(title="", level=0, start=0, body_start=0)
+    stack = [root]
+    fence = ""  # Opening fence while inside a code block
+    offset = 0
+
+    for line in _iter_lines(text):
+        content = line.rstrip("\r\n")
+        fence_match = _FENCE_RE.match(content)
+        if fence:
+            # A closing fence uses the same character, at least as many times
+            if (
+                fence_match
+                and fence_match.group(1)[0] == fence[0]
+                and len(fence_match.group(1)) >= len(fence)
+                and not content[fence_match.end() :].strip()
+            ):
+                fence = ""
+        elif fence_match and "`" not in content[fence_match.end() :]:
+            fence = fence_match.group(1)
+        elif header := _HEADER_RE.match(content):
+            level = len(header.group(1))
+            while stack[-1].level >= level:
+                _close(stack.pop(), offset, text)
+            node = OutlineNode(
+                title=header.group(2),
+                level=level,
+                start=offset,
+                body_start=offset + len(line),
+            )
+            stack[-1].children.append(node)
+            stack.append(node)
+        offset += len(line)
+
+    while stack:
+        _close(stack.pop(), offset, text)
+    return root
+
+
+def nodes_at_level(node: OutlineNode, level: int) -> list[OutlineNode]:
+    """All nodes at a header level, in document order."""
+    found: list[OutlineNode] = []
+    for child in node.children:
+        if child.level == level:
+            found.append(child)
+        elif child.level < level:
+            found.extend(nodes_at_level(child, level))
+    return found
+
+
+def head_end(node: OutlineNode) -> int:
+    """End of a node's own text (header and intro) before its first child."""
+    return node.children[0].start if node.children else node.end
@@ -0,0 +1,206 @@
+"""Content-addressed storage for template base versions.
+
+Layout inside a project's .claude/ directory:
+
+    .echograph-meta.json          small index: version + path -> sha256
+    .echograph/objects/<sha256>   zlib-compressed file contents
+    .echograph/history.json       path -> sha256 snapshot per template version
+
+Identical content is stored once, however many files or template
+versions refer to it.
+"""
+
+import hashlib
+import json
+import re
+import zlib
+from pathlib import Path
+from typing import Any
+
+from echograph_cli.core.fileio import atomic_write_bytes, atomic_write_text
+
+# Index format written by save_metadata; older files store contents inline
+METADATA_FORMAT = 2
+STORE_DIR_NAME = ".echograph"
+HISTORY_NAME = "history.json"
+
+# template_version is written first, so it sits in the first few bytes
+_VERSION_PROBE_BYTES = 256
+_VERSION_RE = re.compile(r'^\s*\{\s*"template_version"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+def content_sha256(content: str) -> str:
+    """SHA-256 hex digest of UTF-8 text."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class BlobStore:
+    """Zlib-compressed, content-addressed object store."""
+
+    def __init__(self, root: Path) -> None:
+        """Initialize store rooted at root (objects live in root/objects)."""
+        self.root = root
+        self.objects_dir = root / "objects"
+
+    def _object_path(self, sha: str) -> Path:
+        """Path of the object file for a digest."""
+        if not re.fullmatch(r"[0-9a-f]{64}", sha):
+            raise KeyError(sha)
+        return self.objects_dir / sha
+
+    def has(self, sha: str) -> bool:
+        """Check if an object exists."""
+        try:
+            return self._object_path(sha).exists()
+        except KeyError:
+            return False
+
+    def put(self, content: str) -> str:
+        """Store content and return its digest (no-op if already stored)."""
+        sha = content_sha256(content)
+        path = self._object_path(sha)
+        if not path.exists():
+            self.objects_dir.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(path, zlib.compress(content.encode("utf-8")))
+        return sha
+
+    def get(self, sha: str) -> str:
+        """Load content by digest.
+
+        Raises:
+            KeyError: If the object doesn't exist or is corrupt
+        """
+        try:
+            data = zlib.decompress(self._object_path(sha).read_bytes())
+        except (OSError, zlib.error) as e:
+            raise KeyError(sha) from e
+        return data.decode("utf-8")
+
+
+def store_for(metadata_file: Path) -> BlobStore:
+    """Blob store that belongs to a metadata index file."""
+    return BlobStore(metadata_file.parent / STORE_DIR_NAME)
+
+
+def read_template_version(metadata_file: Path) -> str | None:
+    """Read the template version from a metadata index.
+
+    Only the first few bytes are read when the index was written by
+    save_metadata; other layouts fall back to a full JSON parse.
+
+    Returns:
+        The version string, or None if the file doesn't exist
+
+    Raises:
+        ValueError: If the file isn't valid metadata JSON
+    """
+    try:
+        with open(metadata_file, "rb") as f:
+            head = f.read(_VERSION_PROBE_BYTES)
+    except FileNotFoundError:
+        return None
+
+    match = _VERSION_RE.match(head.decode("utf-8", errors="ignore"))
+    if match:
+        version: str = json.loads(f'"{match.group(1)}"')
+        return version
+
+    metadata = json.loads(metadata_file.read_text(encoding="utf-8"))
+    if not isinstance(metadata, dict):
+        raise ValueError("Template metadata must be a JSON object")
+    return str(metadata.get("template_version", "unknown"))
+
+
+def save_metadata(metadata_file: Path, files: dict[str, str], version: str) -> None:
+    """Store file contents as blobs and write the index.
+
+    Blobs are written before the index, so the index never refers to
+    missing objects.
+    """
+    store = store_for(metadata_file)
+    hashes = {rel_path: store.put(content) for rel_path, content in files.items()}
+    _record_snapshot(store, version, hashes)
+    metadata: dict[str, Any] = {
+        "template_version": version,
+        "format": METADATA_FORMAT,
+        "files": hashes,
+    }
+    metadata_file.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_text(metadata_file, json.dumps(metadata, indent=2))
+
+
+def load_base_content(
+    metadata_file: Path, metadata: dict[str, Any], rel_path: str
+) -> str:
+    """Load the base version of one file recorded in metadata.
+
+    Handles both the blob index and the older inline-content format.
+    Returns "" when no base is recorded or its blob is missing.
+    """
+    entry = metadata.get("files", {}).get(rel_path)
+    if not entry:
+        return ""
+    if metadata.get("format") != METADATA_FORMAT:
+        return str(entry)  # Legacy: content stored inline
+    try:
+        return store_for(metadata_file).get(entry)
+    except KeyError:
+        return ""
+
+
+def load_history(store: BlobStore) -> list[dict[str, Any]]:
+    """Load template snapshots, oldest first.
+
+    Each snapshot is {"version": str, "files": {path: sha256}}.
+    """
+    try:
+        data = json.loads((store.root / HISTORY_NAME).read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+    versions: list[dict[str, Any]] = data.get("versions", [])
+    return versions
+
+
+def _record_snapshot(store: BlobStore, version: str, hashes: dict[str, str]) -> None:
+    """Add file hashes to the snapshot for a version (created if new)."""
+    history = load_history(store)
+    for snapshot in history:
+        if snapshot["version"] == version:
+            snapshot["files"].update(hashes)
+            break
+    else:
+        history.append({"version": version, "files": dict(hashes)})
+
+    store.root.mkdir(parents=True, exist_ok=True)
+    atomic_write_text(
+        store.root / HISTORY_NAME, json.dumps({"versions": history}, indent=2)
+    )
+
+
+def select_base_content(
+    metadata_file: Path,
+    metadata: dict[str, Any],
+    rel_path: str,
+) -> str:
+    """Pick the base version of a user's file for a three-way merge.
+
+    The base is the version the project last synced to; a file equal to
+    it fast-forwards to the new template. Older snapshots are never used:
+    snapshots are only recorded on sync, so a file matching (or resembling)
+    an older one is a deliberate revert, which a merge against that
+    snapshot would quietly undo.
+
+    Returns:
+        The base content, or "" when none is recorded
+    """
+    latest = load_base_content(metadata_file, metadata, rel_path)
+    if latest or metadata.get("format") != METADATA_FORMAT:
+        return latest  # Legacy projects have no history
+
+    # Index entry missing or its blob gone - fall back to the newest snapshot
+    store = store_for(metadata_file)
+    for snapshot in reversed(load_history(store)):
+        sha = snapshot["files"].get(rel_path)
+        if sha and store.has(sha):
+            return store.get(sha)
+    return ""
@@ -1,15 +1,28 @@
 """Template loading and rendering."""
 
+import hashlib
 import json
-import subprocess
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from importlib import resources
 from pathlib import Path
 from typing import Any
 
-from jinja2 import BaseLoader, Environment, TemplateNotFound
+from jinja2 import BaseLoader, BytecodeCache, Environment, TemplateNotFound
+from jinja2.bccache import FileSystemBytecodeCache
 
 from echograph_cli import __version__
-from echograph_cli.core.models import ConflictResolution, FileConflict, ProjectConfig
+from echograph_cli.core.fileio import write_text_if_changed
+from echograph_cli.core.models import (
+    ConflictResolution,
+    FileConflict,
+    ProjectConfig,
+    TemplateEntry,
+)
+from echograph_cli.core.store import save_metadata
 
 # Minimal templates - core files only
 # CLAUDE.md goes at project root, others in .claude/
@@ -19,6 +32,9 @@ MINIMAL_TEMPLATES = [
     ".claude/TASK.md",
 ]
 
+# Build-time manifest generated by scripts/sync-cli-templates.py
+MANIFEST_NAME = "_manifest.json"
+
 
 class PackageTemplateLoader(BaseLoader):
     """Load templates from package resources."""
@@ -41,6 +57,31 @@ class PackageTemplateLoader(BaseLoader):
             raise TemplateNotFound(template)
 
 
+def create_bytecode_cache() -> BytecodeCache | None:
+    """Create an on-disk Jinja bytecode cache for this CLI version.
+
+    Compiled templates are stored under <cache dir>/jinja/<version>, so
+    rendering in later runs skips lexing and compiling. Jinja itself
+    invalidates entries when the template source or Jinja/Python version
+    changes.
+
+    Returns:
+        The bytecode cache, or None if caching is disabled or the cache
+        directory isn't writable
+    """
+    from echograph_cli.core.config import cache_enabled, get_cache_dir
+
+    if not cache_enabled():
+        return None
+
+    cache_dir = get_cache_dir() / "jinja" / __version__
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(str(cache_dir))
+
+
 def create_template_env() -> Environment:
     """Create Jinja2 environment for template rendering."""
     loader = PackageTemplateLoader("echograph_cli")
@@ -50,136 +91,373 @@ def create_template_env() -> Environment:
         lstrip_blocks=True,
         keep_trailing_newline=True,
         autoescape=False,  # Not HTML, don't escape
+        bytecode_cache=create_bytecode_cache(),
     )
 
 
+def build_template_context(config: ProjectConfig | None) -> dict[str, Any]:
+    """Build the Jinja context for a project configuration."""
+    if config is None:
+        return {}
+    return {
+        "project_name": config.project_name,
+        "tech_stack": config.tech_stack,
+        "has_tests": config.has_tests,
+        "test_framework": config.test_framework,
+        "formatter": config.formatter,
+        "linter": config.linter,
+    }
+
+
+def config_key(config: ProjectConfig | None) -> tuple[Any, ...]:
+    """Hashable key identifying a ProjectConfig for render caching."""
+    if config is None:
+        return ()
+    return (
+        config.project_name,
+        tuple(config.tech_stack),
+        config.has_tests,
+        config.test_framework,
+        config.formatter,
+        config.linter,
+    )
+
+
+class TemplateCatalog:
+    """Process-wide cache of bundled templates.
+
+    Holds the template listing, one Jinja environment (and therefore the
+    compiled templates), rendered output per ProjectConfig and content
+    hashes, so each template is loaded and rendered at most once.
+    """
+
+    def __init__(self, package: str = "echograph_cli") -> None:
+        """Initialize an empty catalog for the given package."""
+        self.package = package
+        self._lock = threading.Lock()
+        self._env: Environment | None = None
+        self._entries: dict[str, TemplateEntry] | None = None
+        self._raw: dict[str, str] = {}
+        self._rendered: dict[tuple[str, tuple[Any, ...]], str] = {}
+        self._hashes: dict[tuple[str, tuple[Any, ...]], str] = {}
+
+    @property
+    def env(self) -> Environment:
+        """Shared Jinja environment (caches compiled templates)."""
+        if self._env is None:
+            with self._lock:
+                if self._env is None:
+                    self._env = create_template_env()
+        return self._env
+
+    @property
+    def entries(self) -> dict[str, TemplateEntry]:
+        """Template entries keyed by output path.
+
+        Read from the packaged manifest; source checkouts without one fall
+        back to walking the templates directory.
+        """
+        if self._entries is None:
+            manifest = load_template_manifest(self.package)
+            if manifest is None:
+                manifest = _walk_template_files(self.package)
+            self._entries = {e.path: e for e in manifest}
+        return self._entries
+
+    def entry(self, template_path: str) -> TemplateEntry | None:
+        """Manifest entry for a template output path."""
+        return self.entries.get(template_path)
+
+    def list_files(self, mode: str = "full") -> list[str]:
+        """List template output paths for the given mode."""
+        if mode == "minimal":
+            return [p for p, e in self.entries.items() if "minimal" in e.modes]
+        return list(self.entries)
+
+    def read_raw(self, template_path: str) -> str:
+        """Read a non-Jinja template file, or "" if it doesn't exist."""
+        if template_path not in self._raw:
+            try:
+                files = resources.files(self.package) / "templates"
+                content = (files / template_path).read_text(encoding="utf-8")
+            except (FileNotFoundError, TypeError):
+                content = ""
+            self._raw[template_path] = content
+        return self._raw[template_path]
+
+    def render(self, template_path: str, config: ProjectConfig | None = None) -> str:
+        """Render a template output path for a project configuration.
+
+        Tries the .j2 template first and falls back to the raw file.
+        With no config the template is rendered with an empty context.
+        """
+        key = (template_path, config_key(config))
+        if key not in self._rendered:
+            try:
+                template = self.env.get_template(f"{template_path}.j2")
+                content = template.render(**build_template_context(config))
+            except TemplateNotFound:
+                content = self.read_raw(template_path)
+            self._rendered[key] = content
+        return self._rendered[key]
+
+    def content_hash(
+        self, template_path: str, config: ProjectConfig | None = None
+    ) -> str:
+        """SHA-256 of the rendered template content."""
+        key = (template_path, config_key(config))
+        if key not in self._hashes:
+            content = self.render(template_path, config)
+            self._hashes[key] = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return self._hashes[key]
+
+    def clear(self) -> None:
+        """Drop all cached state."""
+        self._env = None
+        self._entries = None
+        self._raw.clear()
+        self._rendered.clear()
+        self._hashes.clear()
+
+
+_catalog: TemplateCatalog | None = None
+
+
+def get_template_catalog() -> TemplateCatalog:
+    """Return the process-wide template catalog."""
+    global _catalog
+    if _catalog is None:
+        _catalog = TemplateCatalog()
+    return _catalog
+
+
 def render_template(template_name: str, context: dict[str, Any]) -> str:
     """Render a template with the given context."""
-    env = create_template_env()
-    template = env.get_template(template_name)
+    template = get_template_catalog().env.get_template(template_name)
     return template.render(**context)
 
 
-def list_template_files(mode: str = "full") -> list[str]:
-    """List all template files for the given mode."""
+def load_template_manifest(
+    package: str = "echograph_cli",
+) -> list[TemplateEntry] | None:
+    """Load the build-time template manifest.
+
+    Returns:
+        Manifest entries, or None if the package has no manifest
+    """
     try:
-        files = resources.files("echograph_cli") / "templates"
-        templates: list[str] = []
+        manifest_file = resources.files(package) / "templates" / MANIFEST_NAME
+        data = json.loads(manifest_file.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    return [TemplateEntry(**entry) for entry in data["files"]]
 
-        def _walk_templates(base: Any, prefix: str = "") -> None:
-            """Recursively walk template directory."""
-            try:
-                for item in base.iterdir():
-                    rel_path = f"{prefix}/{item.name}" if prefix else item.name
-                    if item.is_file():
-                        # Remove .j2 extension for output path
-                        if rel_path.endswith(".j2"):
-                            rel_path = rel_path[:-3]
-                        templates.append(rel_path)
-                    else:
-                        _walk_templates(item, rel_path)
-            except (TypeError, AttributeError):
-                pass
-
-        _walk_templates(files)
 
-        if mode == "minimal":
-            return [t for t in templates if t in MINIMAL_TEMPLATES]
-        return templates
-    except Exception:
-        return MINIMAL_TEMPLATES if mode == "minimal" else []
+def _walk_template_files(package: str) -> list[TemplateEntry]:
+    """Walk the bundled templates directory and build manifest entries.
+
+    Only used when no manifest is packaged (e.g. a fresh source checkout).
+    """
+    files = resources.files(package) / "templates"
+    entries: list[TemplateEntry] = []
+
+    def _walk_templates(base: Any, prefix: str = "") -> None:
+        """Recursively walk template directory."""
+        for item in base.iterdir():
+            source = f"{prefix}/{item.name}" if prefix else item.name
+            if item.is_file():
+                if source == MANIFEST_NAME:
+                    continue
+                data = item.read_bytes()
+                # Remove .j2 extension for output path
+                is_jinja = source.endswith(".j2")
+                path = source[:-3] if is_jinja else source
+                entries.append(
+                    TemplateEntry(
+                        path=path,
+                        source=source,
+                        size=len(data),
+                        sha256=hashlib.sha256(data).hexdigest(),
+                        is_jinja=is_jinja,
+                        modes=(
+                            ["minimal", "full"]
+                            if path in MINIMAL_TEMPLATES
+                            else ["full"]
+                        ),
+                    )
+                )
+            else:
+                _walk_templates(item, source)
+
+    _walk_templates(files)
+    return sorted(entries, key=lambda e: e.path)
+
+
+def list_template_files(mode: str = "full") -> list[str]:
+    """List all template files for the given mode."""
+    return get_template_catalog().list_files(mode)
 
 
 def get_bundled_template(template_path: str) -> str:
     """Get content of a bundled template file."""
-    # Try with .j2 extension first
-    try:
-        env = create_template_env()
-        return env.get_template(f"{template_path}.j2").render()
-    except TemplateNotFound:
-        pass
+    return get_template_catalog().render(template_path)
 
-    # Try without extension
-    try:
-        files = resources.files("echograph_cli") / "templates"
-        return (files / template_path).read_text(encoding="utf-8")
-    except (FileNotFoundError, TypeError):
-        return ""
+
+# Marker files -> tech stack entry, in reporting order
+TECH_STACK_MARKERS: list[tuple[tuple[str, ...], str]] = [
+    (("pyproject.toml", "setup.py"), "python"),
+    (("package.json",), "nodejs"),
+    (("tsconfig.json",), "typescript"),
+    (("Cargo.toml",), "rust"),
+    (("go.mod",), "go"),
+]
+
+# Cache of detected configs: directory -> (mtime key, config)
+_project_config_cache: dict[Path, tuple[tuple[int, int], ProjectConfig]] = {}
+
+_GIT_SECTION_RE = re.compile(r'^\s*\[\s*([^\s\]"]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
 
 
 def get_project_config(path: Path) -> ProjectConfig:
-    """Detect project configuration from directory."""
-    project_name = _detect_project_name(path)
-    tech_stack = _detect_tech_stack(path)
+    """Detect project configuration from directory.
+
+    Results are cached per directory and reused until the directory or its
+    git config changes (by mtime).
+    """
+    git_config = _find_git_config(path)
+    key = (_mtime_ns(path), _mtime_ns(git_config) if git_config else 0)
+    cached = _project_config_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return replace(cached[1], tech_stack=list(cached[1].tech_stack))
+
+    # One directory scan collects every marker file
+    names = _scan_names(path)
+    project_name = _detect_project_name(path, git_config)
+    tech_stack = _detect_tech_stack(names)
 
     # Detect test framework
     test_framework = None
-    if (path / "pytest.ini").exists() or (path / "pyproject.toml").exists():
+    if "pytest.ini" in names or "pyproject.toml" in names:
         test_framework = "pytest"
-    elif (path / "package.json").exists():
+    elif "package.json" in names:
         test_framework = "jest"  # Common default for JS projects
 
-    return ProjectConfig(
+    config = ProjectConfig(
         project_name=project_name,
         tech_stack=tech_stack,
-        has_tests=(path / "tests").exists() or (path / "test").exists(),
+        has_tests="tests" in names or "test" in names,
         test_framework=test_framework,
-        formatter="ruff" if (path / "ruff.toml").exists() else None,
+        formatter="ruff" if "ruff.toml" in names else None,
         linter="ruff" if "python" in tech_stack else None,
     )
+    _project_config_cache[path] = (key, config)
+    return replace(config, tech_stack=list(tech_stack))
 
 
-def _detect_project_name(path: Path) -> str:
-    """Detect project name from git or folder name."""
-    # Try git remote
+def _mtime_ns(path: Path) -> int:
+    """Return st_mtime_ns, or 0 if the path can't be stat'ed."""
     try:
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=path,
-            capture_output=True,
-            text=True,
-            timeout=5,
-            shell=False,  # Explicit per CLAUDE.md security rules
-        )
-        if result.returncode == 0:
-            url = result.stdout.strip()
-            # Extract repo name from URL
-            name = url.rstrip("/").split("/")[-1]
-            if name.endswith(".git"):
-                name = name[:-4]
-            return name
-    except Exception:
-        pass
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
 
-    # Fall back to folder name
-    return path.name
+
+def _scan_names(path: Path) -> set[str]:
+    """List entry names in a directory with a single scandir pass."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
 
 
-def _detect_tech_stack(path: Path) -> list[str]:
-    """Detect tech stack from project files."""
-    stack: list[str] = []
+def _find_git_config(path: Path) -> Path | None:
+    """Locate the git config for the repository containing path.
 
-    # Python
-    if (path / "pyproject.toml").exists() or (path / "setup.py").exists():
-        stack.append("python")
+    Searches upwards like git does and follows `gitdir:` links used by
+    worktrees and submodules (plus `commondir` for worktrees).
+    """
+    for directory in (path, *path.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            git_dir = dot_git
+        elif dot_git.is_file():
+            try:
+                first_line = dot_git.read_text(encoding="utf-8").splitlines()[0]
+            except (OSError, IndexError):
+                return None
+            if not first_line.startswith("gitdir:"):
+                return None
+            git_dir = (directory / first_line[len("gitdir:") :].strip()).resolve()
+            commondir = git_dir / "commondir"
+            if commondir.is_file():
+                try:
+                    common = commondir.read_text(encoding="utf-8").strip()
+                except OSError:
+                    return None
+                git_dir = (git_dir / common).resolve()
+        else:
+            continue
+
+        config = git_dir / "config"
+        return config if config.is_file() else None
+    return None
+
+
+def _read_remote_url(git_config: Path, remote: str = "origin") -> str | None:
+    """Read a remote's URL from a git config file without running git."""
+    try:
+        lines = git_config.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    in_remote = False
+    for line in lines:
+        section = _GIT_SECTION_RE.match(line)
+        if section:
+            in_remote = (
+                section.group(1).lower() == "remote" and section.group(2) == remote
+            )
+            continue
+        if not in_remote or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        if key.strip().lower() != "url":
+            continue
+        value = value.strip()
+        if value.startswith('"'):
+            value = value[1:].split('"', 1)[0]
+        else:
+            value = re.split(r"\s[#;]", value, maxsplit=1)[0].strip()
+        return value or None
+    return None
 
-    # Node.js
-    if (path / "package.json").exists():
-        stack.append("nodejs")
 
-    # TypeScript
-    if (path / "tsconfig.json").exists():
-        stack.append("typescript")
+def _detect_project_name(path: Path, git_config: Path | None = None) -> str:
+    """Detect project name from git or folder name."""
+    # Try git remote
+    if git_config is None:
+        git_config = _find_git_config(path)
+    url = _read_remote_url(git_config) if git_config else None
+    if url:
+        # Extract repo name from URL (also handles scp-style git@host:repo)
+        name = url.rstrip("/").split("/")[-1].split(":")[-1]
+        if name.endswith(".git"):
+            name = name[:-4]
+        if name:
+            return name
 
-    # Rust
-    if (path / "Cargo.toml").exists():
-        stack.append("rust")
+    # Fall back to folder name
+    return path.name
 
-    # Go
-    if (path / "go.mod").exists():
-        stack.append("go")
 
-    return stack
+def _detect_tech_stack(names: set[str]) -> list[str]:
+    """Detect tech stack from the file names in a project directory."""
+    return [
+        stack
+        for markers, stack in TECH_STACK_MARKERS
+        if any(marker in names for marker in markers)
+    ]
 
 
 def get_template_metadata(metadata_file: Path) -> dict[str, Any]:
@@ -194,23 +472,43 @@ def get_template_metadata(metadata_file: Path) -> dict[str, Any]:
 def save_template_metadata(
     metadata_file: Path, files: dict[str, str], version: str | None = None
 ) -> None:
-    """Save template metadata to file."""
-    metadata = {
-        "template_version": version or __version__,
-        "files": files,
-    }
-    metadata_file.parent.mkdir(parents=True, exist_ok=True)
-    metadata_file.write_text(json.dumps(metadata, indent=2))
+    """Save template metadata to file.
+
+    File contents go to the content-addressed blob store next to the
+    metadata file; the metadata itself only records their hashes.
+    """
+    save_metadata(metadata_file, files, version or __version__)
+
+
+def _matches_template(target_path: Path, entry: TemplateEntry | None) -> bool:
+    """Check if an existing file is byte-identical to a raw template.
+
+    Compares size first, then the manifest hash, so template bodies are
+    never read. Jinja templates render per project and are never identical.
+    """
+    if entry is None or entry.is_jinja:
+        return False
+    try:
+        if target_path.stat().st_size != entry.size:
+            return False
+        return hashlib.sha256(target_path.read_bytes()).hexdigest() == entry.sha256
+    except OSError:
+        return False
 
 
 def detect_conflicts(path: Path, mode: str) -> list[FileConflict]:
-    """Detect files that would conflict during init."""
+    """Detect files that would conflict during init.
+
+    Files identical to their template are not conflicts.
+    """
     conflicts: list[FileConflict] = []
-    template_files = list_template_files(mode)
+    catalog = get_template_catalog()
 
-    for template_rel_path in template_files:
+    for template_rel_path in catalog.list_files(mode):
         target_path = path / template_rel_path
         if target_path.exists():
+            if _matches_template(target_path, catalog.entry(template_rel_path)):
+                continue
             conflicts.append(
                 FileConflict(
                     template_path=template_rel_path,
@@ -237,38 +535,30 @@ def preview_templates(path: Path, mode: str) -> list[tuple[str, bool]]:
     return preview
 
 
-def copy_templates(
+def plan_template_writes(
     path: Path,
-    mode: str,
-    config: ProjectConfig,
+    template_files: list[str],
     force: bool = False,
     conflict_resolutions: dict[str, ConflictResolution] | None = None,
-) -> list[Path]:
-    """Copy templates to target directory.
+    dry_run: bool = False,
+) -> list[str]:
+    """Decide which templates to write, applying conflict resolutions.
+
+    Existing files are skipped unless force is set or a resolution says
+    otherwise. RENAME backs up the existing file here, before any writes.
 
     Args:
         path: Target directory
-        mode: "minimal" or "full"
-        config: Project configuration for template rendering
+        template_files: Template output paths to consider
         force: If True, overwrite all existing files
         conflict_resolutions: Dict mapping template paths to resolution strategy
+        dry_run: If True, only plan - RENAME does not back anything up
+
+    Returns:
+        Template paths that should be written, in input order
     """
-    created_files: list[Path] = []
-    template_contents: dict[str, str] = {}
     conflict_resolutions = conflict_resolutions or {}
-
-    # Get list of templates for mode
-    template_files = list_template_files(mode)
-
-    # Context for template rendering
-    context = {
-        "project_name": config.project_name,
-        "tech_stack": config.tech_stack,
-        "has_tests": config.has_tests,
-        "test_framework": config.test_framework,
-        "formatter": config.formatter,
-        "linter": config.linter,
-    }
+    planned: list[str] = []
 
     for template_rel_path in template_files:
         target_path = path / template_rel_path
@@ -281,7 +571,7 @@ def copy_templates(
                 resolution = conflict_resolutions[template_rel_path]
                 if resolution == ConflictResolution.SKIP:
                     continue
-                elif resolution == ConflictResolution.RENAME:
+                elif resolution == ConflictResolution.RENAME and not dry_run:
                     # Rename existing file with .bak extension
                     backup_path = target_path.with_suffix(target_path.suffix + ".bak")
                     counter = 1
@@ -295,28 +585,85 @@ def copy_templates(
             else:
                 continue  # Skip by default if no resolution specified
 
-        # Get template content
-        try:
-            # Try .j2 template first
-            content = render_template(f"{template_rel_path}.j2", context)
-        except TemplateNotFound:
-            # Fall back to raw file
-            content = get_bundled_template(template_rel_path)
+        planned.append(template_rel_path)
 
-        if not content:
-            continue
+    return planned
+
+
+def render_templates(
+    template_files: list[str], config: ProjectConfig
+) -> dict[str, str]:
+    """Render templates for a project config on a thread pool.
 
-        # Create parent directories
-        target_path.parent.mkdir(parents=True, exist_ok=True)
+    Returns:
+        Dict mapping template path to content, in input order
+    """
+    catalog = get_template_catalog()
+
+    with ThreadPoolExecutor() as pool:
+        contents = pool.map(lambda p: catalog.render(p, config), template_files)
+        return dict(zip(template_files, contents, strict=True))
+
+
+def write_templates(
+    path: Path, contents: dict[str, str], changed_only: bool = False
+) -> list[Path]:
+    """Materialize rendered templates into a project directory.
 
-        # Write file with UTF-8 encoding for cross-platform compatibility
-        target_path.write_text(content, encoding="utf-8")
-        created_files.append(target_path)
-        template_contents[template_rel_path] = content
+    Creates the directory skeleton in one pass, then writes files on a
+    thread pool through temp file + os.replace. Files whose content is
+    already identical are left untouched. Empty templates are skipped.
+
+    Args:
+        path: Target directory
+        contents: Dict mapping template path to rendered content
+        changed_only: If True, return only the files actually written
+
+    Returns:
+        Paths of all materialized files, in input order
+    """
+    contents = {rel: content for rel, content in contents.items() if content}
+
+    # Directory skeleton - each parent is created once
+    for directory in sorted({(path / rel).parent for rel in contents}):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor() as pool:
+        written = list(
+            pool.map(
+                lambda item: write_text_if_changed(path / item[0], item[1]),
+                contents.items(),
+            )
+        )
 
     # Save metadata for future updates
-    if created_files:
+    if contents:
         metadata_file = path / ".claude" / ".echograph-meta.json"
-        save_template_metadata(metadata_file, template_contents)
+        save_template_metadata(metadata_file, contents)
 
-    return created_files
+    return [
+        path / rel
+        for rel, was_written in zip(contents, written, strict=True)
+        if was_written or not changed_only
+    ]
+
+
+def copy_templates(
+    path: Path,
+    mode: str,
+    config: ProjectConfig,
+    force: bool = False,
+    conflict_resolutions: dict[str, ConflictResolution] | None = None,
+) -> list[Path]:
+    """Copy templates to target directory.
+
+    Args:
+        path: Target directory
+        mode: "minimal" or "full"
+        config: Project configuration for template rendering
+        force: If True, overwrite all existing files
+        conflict_resolutions: Dict mapping template paths to resolution strategy
+    """
+    template_files = get_template_catalog().list_files(mode)
+    planned = plan_template_writes(path, template_files, force, conflict_resolutions)
+    return write_templates(path, render_templates(planned, config))
@@ -1,23 +1,97 @@
 """Main CLI entry point for EchoGraph."""
 
-from typing import Annotated
+from importlib import import_module
+from typing import Annotated, Any
 
 import typer
+from typer.core import TyperGroup
+
+# Lazy command registry: name -> (module, attribute, help).
+# Modules are only imported when the command is actually resolved, so
+# `echograph --version` or `echograph doctor` never pay for jinja2, yaml,
+# the merge engine or the AI client.
+LAZY_COMMANDS: dict[str, tuple[str, str, str | None]] = {
+    "init": ("echograph_cli.commands.init", "init_command", None),
+    "update": ("echograph_cli.commands.update", "update_command", None),
+    "validate": ("echograph_cli.commands.validate", "validate_command", None),
+    "doctor": ("echograph_cli.commands.doctor", "doctor_command", None),
+    # Placeholder command groups
+    "search": (
+        "echograph_cli.commands.placeholders",
+        "search_app",
+        "Search your codebase (coming soon)",
+    ),
+    "sync": (
+        "echograph_cli.commands.placeholders",
+        "sync_app",
+        "Sync external sources (coming soon)",
+    ),
+    "decision": (
+        "echograph_cli.commands.placeholders",
+        "decision_app",
+        "Track architectural decisions (coming soon)",
+    ),
+}
+
+
+def load_command(name: str) -> Any:
+    """Import a registered command and convert it to a click command.
+
+    Args:
+        name: Command name as registered in LAZY_COMMANDS
+
+    Returns:
+        The click command or group for the given name
+    """
+    module_name, attr, help_text = LAZY_COMMANDS[name]
+    target = getattr(import_module(module_name), attr)
+
+    if isinstance(target, typer.Typer):
+        group = typer.main.get_group(target)
+        group.name = name
+        if help_text:
+            group.help = help_text
+        return group
+
+    # Plain function command - wrap it in a single-command app so Typer
+    # builds the parameters from its annotations exactly as app.command would
+    single = typer.Typer()
+    single.command(name=name, help=help_text)(target)
+    return typer.main.get_command(single)
+
+
+class LazyGroup(TyperGroup):
+    """Typer group that resolves subcommands from LAZY_COMMANDS on demand."""
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        """List eager commands followed by lazy ones in registry order."""
+        names = list(super().list_commands(ctx))
+        return names + [n for n in LAZY_COMMANDS if n not in names]
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        """Resolve a command, importing its module on first use."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in LAZY_COMMANDS:
+            command = load_command(cmd_name)
+            self.add_command(command, cmd_name)
+        return command
 
-from echograph_cli import __version__
-from echograph_cli.output import console
 
 app = typer.Typer(
     name="echograph",
     help="EchoGraph - Context Engineering for Claude Code",
     add_completion=False,
     no_args_is_help=True,
+    cls=LazyGroup,
 )
 
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
+        from echograph_cli import __version__
+        from echograph_cli.output import console
+
         console.print(f"echograph {__version__}")
         raise typer.Exit()
 
@@ -40,36 +114,5 @@ def main(
     pass
 
 
-# Import and register commands after app is created to avoid circular imports
-def _register_commands() -> None:
-    """Register all commands with the app."""
-    from echograph_cli.commands import doctor, init, placeholders, update, validate
-
-    app.command(name="init")(init.init_command)
-    app.command(name="update")(update.update_command)
-    app.command(name="validate")(validate.validate_command)
-    app.command(name="doctor")(doctor.doctor_command)
-
-    # Register placeholder command groups
-    app.add_typer(
-        placeholders.search_app,
-        name="search",
-        help="Search your codebase (coming soon)",
-    )
-    app.add_typer(
-        placeholders.sync_app,
-        name="sync",
-        help="Sync external sources (coming soon)",
-    )
-    app.add_typer(
-        placeholders.decision_app,
-        name="decision",
-        help="Track architectural decisions (coming soon)",
-    )
-
-
-_register_commands()
-
-
 if __name__ == "__main__":
     app()
@@ -1,14 +1,16 @@
 """Rich output helpers for CLI."""
 
 import sys
+from typing import TYPE_CHECKING
 
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
 from echograph_cli.core.models import DoctorCheck, ValidationResult
 
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
 # Use UTF-8 encoding for console output on Windows
 # This prevents UnicodeEncodeError with emoji characters
 if sys.platform == "win32":
@@ -42,6 +44,8 @@ def print_info(message: str) -> None:
 
 def print_doctor_results(checks: list[DoctorCheck]) -> None:
     """Print doctor check results in a table."""
+    from rich.table import Table
+
     table = Table(title="EchoGraph Doctor", show_header=True)
     table.add_column("Check", style="cyan")
     table.add_column("Status")
@@ -91,8 +95,10 @@ def print_validation_results(results: list[ValidationResult]) -> None:
         )
 
 
-def create_progress() -> Progress:
+def create_progress() -> "Progress":
     """Create progress bar for file operations."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -146,11 +152,11 @@ def print_unified_diff(
         new_content: The new/template content
         filename: Name of the file being compared
     """
-    import difflib
-
     from rich.syntax import Syntax
 
-    diff_lines = difflib.unified_diff(
+    from echograph_cli.core.diff import unified_diff
+
+    diff_lines = unified_diff(
         old_content.splitlines(keepends=True),
         new_content.splitlines(keepends=True),
         fromfile=f"existing/{filename}",
@@ -5,6 +5,17 @@ from pathlib import Path
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Keep on-disk caches out of the user's real cache directory."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("ECHOGRAPH_CACHE_DIR", str(cache_dir))
+    monkeypatch.delenv("ECHOGRAPH_NO_CACHE", raising=False)
+    return cache_dir
+
+
 @pytest.fixture
 def temp_project(tmp_path: Path) -> Path:
     """Create a temporary project directory."""
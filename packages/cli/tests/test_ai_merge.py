@@ -0,0 +1,484 @@
+"""Tests for the concurrent AI merge pipeline."""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from functools import partial
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from rich.console import Console
+
+from echograph_cli.core import ai_merge as ai_merge_module
+from echograph_cli.core.ai_merge import (
+    AI_MAX_RETRIES,
+    AIMergePipeline,
+    SectionsStreamParser,
+    _extract_request,
+    ai_extract_new_sections,
+    ai_merge_content,
+    batch_smart_merge,
+    retry_delay,
+)
+from echograph_cli.core.models import AIUsage
+
+SECTIONS_RESPONSE = "```sections\n## {name}\n```\n```summary\n- Added {name}\n```"
+
+
+class FakeStatusError(Exception):
+    """Stands in for anthropic.APIStatusError."""
+
+    def __init__(self, status_code: int, headers: dict[str, str]) -> None:
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers)
+
+
+class APIConnectionError(Exception):
+    """Same name as the SDK's transport error."""
+
+
+class FakeAsyncStream:
+    """Stands in for the SDK's async message stream, a few characters at a time."""
+
+    def __init__(self, client: "FakeAsyncClient", text: str) -> None:
+        self.client = client
+        self.text = text
+        self.current_message_snapshot = SimpleNamespace(
+            usage=SimpleNamespace(
+                input_tokens=100,
+                cache_read_input_tokens=2000,
+                cache_creation_input_tokens=None,
+                output_tokens=10,
+            )
+        )
+
+    async def __aenter__(self) -> "FakeAsyncStream":
+        client = self.client
+        client.calls += 1
+        client.in_flight += 1
+        client.max_in_flight = max(client.max_in_flight, client.in_flight)
+        await asyncio.sleep(0.02)
+        if client.failures:
+            client.in_flight -= 1
+            raise client.failures.pop(0)
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.client.in_flight -= 1
+
+    @property
+    async def text_stream(self) -> AsyncIterator[str]:
+        """Yield the answer in small deltas, counting what was sent."""
+        for i in range(0, len(self.text), 4):
+            self.client.streamed += 4
+            yield self.text[i : i + 4]
+
+
+class FakeAsyncClient:
+    """Async client answering with a new section named after the file."""
+
+    def __init__(self, failures: list[Exception] | None = None) -> None:
+        self.failures = list(failures or [])
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+        self.streamed = 0
+        self.closed = False
+        self.messages = self
+
+    def stream(self, **request: Any) -> FakeAsyncStream:
+        """Start one messages.stream request."""
+        user_block = request["messages"][0]["content"][-1]["text"]
+        name = user_block.rsplit("## File: ", 1)[1].split("\n", 1)[0]
+        return FakeAsyncStream(self, SECTIONS_RESPONSE.format(name=name))
+
+    async def close(self) -> None:
+        """Record that the pipeline closed the client."""
+        self.closed = True
+
+
+def _feed(parser: SectionsStreamParser, text: str, size: int = 3) -> int:
+    """Feed text in small deltas until the parser is done; return chars fed."""
+    fed = 0
+    while fed < len(text) and not parser.done:
+        parser.feed(text[fed : fed + size])
+        fed += size
+    return fed
+
+
+class TestSectionsStreamParser:
+    """Tests for parsing the sections block as it streams in."""
+
+    def test_stops_at_closing_fence(self) -> None:
+        """The summary shouldn't be needed once the sections block closes."""
+        text = (
+            "Headers differ.\n```sections\n## Commands\n```bash\nmake test\n```\n\n"
+            "## Security\nNo secrets.\n```\n```summary\n- Added 2\n```\n"
+        )
+        parser = SectionsStreamParser()
+
+        fed = _feed(parser, text)
+
+        assert fed <= text.index("- Added")
+        assert parser.result() == (
+            "## Commands\n```bash\nmake test\n```\n\n## Security\nNo secrets.",
+            "- New section: Commands\n- New section: Security",
+        )
+
+    def test_bare_code_fence_inside_sections(self) -> None:
+        """A bare ``` opening a code block shouldn't end the sections."""
+        text = (
+            "```sections\n## Example\n```\nTitle: Login\n```\n\n## Next\nMore.\n"
+            "```\n\n```summary\n- Added 2\n```\n"
+        )
+        parser = SectionsStreamParser()
+
+        fed = _feed(parser, text)
+
+        assert fed <= text.index("- Added")
+        assert parser.result()[0] == (
+            "## Example\n```\nTitle: Login\n```\n\n## Next\nMore."
+        )
+
+    @pytest.mark.parametrize(
+        "between",
+        ["Those are all the new sections.\n", "\nHere is the summary:\n\n"],
+    )
+    def test_prose_between_blocks_is_dropped(self, between: str) -> None:
+        """Chatter after the sections block shouldn't end up in the file."""
+        text = (
+            "```sections\n## A\n```bash\nmake\n```\ntext\n```\n"
+            f"{between}```summary\n- Added A\n```\n"
+        )
+        parser = SectionsStreamParser()
+
+        fed = _feed(parser, text, size=1)
+
+        assert fed == text.index("- Added")
+        assert parser.result() == (
+            "## A\n```bash\nmake\n```\ntext",
+            "- New section: A",
+        )
+
+    def test_prose_after_sections_at_stream_end_is_dropped(self) -> None:
+        """Without a summary, prose after the closing ``` is still dropped."""
+        parser = SectionsStreamParser()
+        parser.feed("```sections\n## A\ntext\n```\nHope this helps!\n")
+
+        assert parser.result() == ("## A\ntext", "- New section: A")
+
+    def test_stream_ending_after_sections(self) -> None:
+        """Without a summary, the last bare ``` still closes the sections."""
+        parser = SectionsStreamParser()
+        parser.feed("```sections\n## A\ntext\n```\n")
+
+        assert parser.result() == ("## A\ntext", "- New section: A")
+
+    def test_stream_ending_without_newline(self) -> None:
+        """A closing fence with no trailing newline shouldn't reach the file."""
+        parser = SectionsStreamParser()
+        parser.feed("```sections\n## X\n\nbody\n```")
+
+        assert parser.partial == "## X\n\nbody"
+        assert parser.result() == ("## X\n\nbody", "- New section: X")
+
+    def test_stops_at_none_verdict(self) -> None:
+        """A NONE verdict should end the stream right away."""
+        text = "```sections\nNONE\n```\n```summary\n- No new sections\n```\n"
+        parser = SectionsStreamParser()
+
+        fed = _feed(parser, text)
+
+        assert fed < text.index("- No new")
+        assert parser.result() == (None, "No new sections found in template")
+
+    def test_complete_answer_keeps_summary(self) -> None:
+        """An answer fed whole should use its own summary."""
+        parser = SectionsStreamParser()
+        parser.feed("```sections\n## A\n```\n```summary\n- Added A\n```\n")
+
+        assert parser.result() == ("## A", "- Added A")
+
+    def test_without_sections_block_falls_back(self) -> None:
+        """Answers in another format should parse like before."""
+        parser = SectionsStreamParser()
+        parser.feed("```markdown\n## A\n```\n")
+
+        assert not parser.done
+        assert parser.result()[0] == "## A"
+
+
+class TestExtractRequest:
+    """Tests for the prompt-cache-friendly request layout."""
+
+    def test_template_prefix_is_cached_and_user_file_last(self) -> None:
+        """The user's file should follow the cache breakpoint, not precede it."""
+        request = _extract_request("my notes", "## Template body", "CLAUDE.md")
+        template_block, user_block = request["messages"][0]["content"]
+
+        assert "## Template body" in template_block["text"]
+        assert template_block["cache_control"] == {"type": "ephemeral"}
+        assert "my notes" in user_block["text"]
+        assert "CLAUDE.md" in user_block["text"]
+        assert "cache_control" not in user_block
+
+    def test_files_share_the_template_prefix(self) -> None:
+        """Different user files against one template should share the prefix."""
+        first = _extract_request("user a", "template", "a.md")
+        second = _extract_request("user b", "template", "b.md")
+
+        assert first["system"] == second["system"]
+        assert first["messages"][0]["content"][0] == second["messages"][0]["content"][0]
+
+
+class TestAIUsage:
+    """Tests for token accounting."""
+
+    def test_add_treats_missing_cache_counts_as_zero(self) -> None:
+        """Responses without cache fields should still add up."""
+        usage = AIUsage()
+
+        usage.add(SimpleNamespace(input_tokens=5, output_tokens=2))
+        usage.add(
+            SimpleNamespace(
+                input_tokens=1,
+                cache_read_input_tokens=None,
+                cache_creation_input_tokens=40,
+                output_tokens=3,
+            )
+        )
+
+        assert usage == AIUsage(
+            requests=2,
+            input_tokens=6,
+            cache_read_input_tokens=0,
+            cache_creation_input_tokens=40,
+            output_tokens=5,
+        )
+
+
+class TestRetryDelay:
+    """Tests for deciding whether and when to retry an API call."""
+
+    def test_honours_retry_after(self) -> None:
+        """Rate limited calls should wait as long as the API asks."""
+        assert retry_delay(FakeStatusError(429, {"retry-after": "7"}), 0) == 7.0
+        assert retry_delay(FakeStatusError(529, {"retry-after-ms": "250"}), 0) == 0.25
+
+    def test_backs_off_without_header(self) -> None:
+        """Without retry-after, delays should grow with each attempt."""
+        first = retry_delay(FakeStatusError(503, {}), 0)
+        third = retry_delay(FakeStatusError(503, {}), 2)
+
+        assert first is not None and third is not None
+        assert third > first
+
+    def test_transport_errors_are_retried(self) -> None:
+        """Connection failures carry no status code but are transient."""
+        assert retry_delay(APIConnectionError(), 0) is not None
+
+    def test_gives_up(self) -> None:
+        """Client errors and exhausted retries should not be retried."""
+        assert retry_delay(FakeStatusError(400, {}), 0) is None
+        assert retry_delay(ValueError("bad"), 0) is None
+        assert retry_delay(FakeStatusError(429, {}), AI_MAX_RETRIES) is None
+
+
+class TestAIMergePipeline:
+    """Tests for overlapping AI requests."""
+
+    def test_requests_overlap_up_to_limit(self) -> None:
+        """Requests should run concurrently but never past max_concurrency."""
+        client = FakeAsyncClient()
+        with AIMergePipeline(3, client_factory=lambda: client) as pipeline:
+            futures = [pipeline.submit("user", "template", f"f{i}") for i in range(7)]
+            results = [future.result(timeout=5) for future in futures]
+
+        assert client.max_in_flight == 3
+        assert [sections for sections, _ in results] == [f"## f{i}" for i in range(7)]
+        assert client.closed
+        assert pipeline.usage.requests == 7
+        assert pipeline.usage.cache_read_input_tokens == 7 * 2000
+
+    def test_stream_closed_after_sections(self) -> None:
+        """The pipeline should stop reading once the sections are known."""
+        client = FakeAsyncClient()
+        with AIMergePipeline(2, client_factory=lambda: client) as pipeline:
+            sections, explanation = pipeline.submit("u", "t", "a.json").result(5)
+
+        assert sections == "## a.json"
+        assert explanation == "- New section: a.json"
+        assert client.streamed < len(SECTIONS_RESPONSE.format(name="a.json"))
+
+    def test_rate_limited_request_is_retried(self) -> None:
+        """A 429 with retry-after should be retried, not reported."""
+        client = FakeAsyncClient([FakeStatusError(429, {"retry-after": "0.01"})])
+        with AIMergePipeline(2, client_factory=lambda: client) as pipeline:
+            sections, _ = pipeline.submit("user", "template", "a.json").result(5)
+
+        assert sections == "## a.json"
+        assert client.calls == 2
+
+    def test_fatal_error_reaches_caller(self) -> None:
+        """Errors that aren't worth retrying should surface from the future."""
+        client = FakeAsyncClient([FakeStatusError(401, {})])
+        with AIMergePipeline(2, client_factory=lambda: client) as pipeline:
+            future = pipeline.submit("user", "template", "a.json")
+
+            with pytest.raises(FakeStatusError):
+                future.result(timeout=5)
+
+        assert client.calls == 1
+
+    def test_missing_key_asked_once(self) -> None:
+        """A failed client setup should fail every request without re-asking."""
+        attempts: list[int] = []
+
+        def no_key() -> None:
+            attempts.append(1)
+            raise ValueError("Anthropic API key required for AI merge.")
+
+        pipeline = AIMergePipeline(2, client_factory=no_key)
+        futures = [pipeline.submit("user", "template", f"f{i}") for i in range(3)]
+        pipeline.close()
+
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+        assert attempts == [1]
+
+    def test_repeated_request_served_from_cache(self) -> None:
+        """Asking again about the same files should not call the API."""
+        client = FakeAsyncClient()
+        with AIMergePipeline(2, client_factory=lambda: client) as pipeline:
+            first = pipeline.submit("user", "template", "a.json").result(5)
+
+        def no_client() -> None:
+            raise AssertionError("client created")
+
+        with AIMergePipeline(2, client_factory=no_client) as pipeline:
+            second = pipeline.submit("user", "template", "a.json").result(5)
+
+        assert second == first
+        assert client.calls == 1
+
+    def test_cache_can_be_bypassed(self) -> None:
+        """use_cache=False should always ask the API."""
+        client = FakeAsyncClient()
+        for _ in range(2):
+            with AIMergePipeline(
+                2, client_factory=lambda: client, use_cache=False
+            ) as pipeline:
+                pipeline.submit("user", "template", "a.json").result(5)
+
+        assert client.calls == 2
+
+    def test_prefetch_skips_files_without_ai_step(self) -> None:
+        """Files settled locally should not start a request or need a key."""
+
+        def no_client() -> None:
+            raise AssertionError("client created")
+
+        with AIMergePipeline(2, client_factory=no_client) as pipeline:
+            merge = pipeline.prefetch("same\n", "same  \n", "notes.txt")
+
+        assert isinstance(merge, partial)
+        assert merge.func is ai_merge_content
+
+    def test_prefetch_fallback_keeps_cache_setting(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A fallback merge should bypass the AI cache when the pipeline does."""
+        calls: list[bool] = []
+
+        def fake_extract(*args: object, **kwargs: object) -> tuple[None, str]:
+            calls.append(bool(args[3]))  # use_cache
+            return None, "nothing new"
+
+        monkeypatch.setattr(ai_merge_module, "ai_extract_new_sections", fake_extract)
+        with AIMergePipeline(2, use_cache=False) as pipeline:
+            merge = pipeline.prefetch("same\n", "same  \n", "notes.txt")
+
+        merge("same\n", "same  \n", "notes.txt")
+
+        assert calls == [False]
+
+
+class TestBatchSmartMerge:
+    """Tests for merging many files with overlapping AI requests."""
+
+    def test_results_follow_file_order(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Each file should get its own AI answer, reviewed in order."""
+        client = FakeAsyncClient()
+        monkeypatch.setattr(
+            ai_merge_module, "get_async_anthropic_client", lambda: client
+        )
+        files = [
+            (f"config{i}.toml", f"user setting {i}\n" * 5, f"template key {i}\n" * 3)
+            for i in range(5)
+        ]
+        console = Console(record=True, width=200)
+
+        results = batch_smart_merge(files, console, auto_approve=True)
+
+        assert list(results) == [name for name, _, _ in files]
+        for name, user_content, _ in files:
+            assert results[name].merged_content == (
+                f"{user_content.rstrip()}\n\n## {name}\n"
+            )
+        output = console.export_text()
+        positions = [output.index(f"Merged: {name}") for name, _, _ in files]
+        assert positions == sorted(positions)
+        assert client.max_in_flight > 1
+
+
+class FakeSyncStream:
+    """Stands in for the SDK's blocking message stream."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.sent = 0
+        self.current_message_snapshot = SimpleNamespace(
+            usage=SimpleNamespace(input_tokens=50, output_tokens=5)
+        )
+
+    def __enter__(self) -> "FakeSyncStream":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+    @property
+    def text_stream(self) -> Iterator[str]:
+        """Yield the answer in small deltas."""
+        for i in range(0, len(self.text), 4):
+            self.sent = i + 4
+            yield self.text[i : i + 4]
+
+
+class TestStreamingExtract:
+    """Tests for the blocking, streamed extract-sections call."""
+
+    def test_reports_progress_and_stops_early(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Progress should show headers as they arrive, then the stream closes."""
+        stream = FakeSyncStream(SECTIONS_RESPONSE.format(name="Security"))
+        client = SimpleNamespace(messages=SimpleNamespace(stream=lambda **_: stream))
+        monkeypatch.setattr(ai_merge_module, "get_anthropic_client", lambda: client)
+        headers: list[str] = []
+        usage = AIUsage()
+
+        result = ai_extract_new_sections(
+            "user",
+            "template",
+            "CLAUDE.md",
+            usage=usage,
+            on_progress=lambda parser: headers.append(parser.last_header),
+        )
+
+        assert result == ("## Security", "- New section: Security")
+        assert "## Security" in headers
+        assert stream.sent < len(stream.text)
+        assert usage.requests == 1
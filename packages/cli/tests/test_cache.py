@@ -0,0 +1,178 @@
+"""Tests for the on-disk merge result cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from echograph_cli.core import cache as cache_module
+from echograph_cli.core.cache import (
+    DiskCache,
+    ai_cache_key,
+    cached_three_way_merge,
+    cached_three_way_merge_sections,
+    get_ai_cache,
+    get_merge_cache,
+    load_ai_response,
+    merge_cache_key,
+    store_ai_response,
+)
+from echograph_cli.core.merge import (
+    MergeBackend,
+    three_way_merge,
+    three_way_merge_sections,
+)
+from echograph_cli.core.models import MergeStats
+
+
+def _key(n: int) -> str:
+    """A valid cache key."""
+    return f"{n:064x}"
+
+
+class TestDiskCache:
+    """Tests for the LRU blob cache."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Stored bytes should come back unchanged."""
+        cache = DiskCache(tmp_path)
+
+        cache.put(_key(1), b"merged")
+
+        assert cache.get(_key(1)) == b"merged"
+        assert cache.get(_key(2)) is None
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Past the size limit, entries not read recently go first."""
+        cache = DiskCache(tmp_path, max_bytes=10**6)
+        for n in range(3):
+            cache.put(_key(n), os.urandom(1000))
+            os.utime(tmp_path / _key(n), (n, n))
+        cache.get(_key(0))  # Refreshes the oldest entry
+
+        cache.max_bytes = 2500
+        cache.evict()
+
+        assert cache.get(_key(0)) is not None
+        assert cache.get(_key(1)) is None
+        assert cache.get(_key(2)) is not None
+
+    def test_rejects_malformed_keys(self, tmp_path: Path) -> None:
+        """Keys must be hex digests, never paths."""
+        with pytest.raises(KeyError):
+            DiskCache(tmp_path).get("../outside")
+
+    def test_disabled_by_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """ECHOGRAPH_NO_CACHE should turn the merge cache off."""
+        monkeypatch.setenv("ECHOGRAPH_NO_CACHE", "1")
+
+        assert get_merge_cache() is None
+
+
+class TestCachedMerge:
+    """Tests for merges served from the cache."""
+
+    def test_key_covers_inputs_and_algorithm_version(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Any input or algorithm change should give a new key."""
+        key = merge_cache_key("lines", "a", "b", "c")
+
+        assert merge_cache_key("lines", "a", "b", "d") != key
+        assert merge_cache_key("sections", "a", "b", "c") != key
+        monkeypatch.setattr(cache_module, "MERGE_ALGORITHM_VERSION", 999)
+        assert merge_cache_key("lines", "a", "b", "c") != key
+
+    def test_line_merge_hit_matches_merge(self, tmp_path: Path) -> None:
+        """A cached result should equal a fresh merge, conflicts included."""
+        cache = DiskCache(tmp_path)
+        base, user, new = "a\nb\n", "a\nuser\n", "a\nnew\n"
+
+        first = cached_three_way_merge(cache, base, user, new)
+        second = cached_three_way_merge(cache, base, user, new)
+
+        assert first == second == three_way_merge(base, user, new)
+        assert len(list(tmp_path.iterdir())) == 1
+
+    def test_backends_do_not_share_entries(self, tmp_path: Path) -> None:
+        """A result from one merge backend should not be served for another."""
+        cache = DiskCache(tmp_path)
+        base, user, new = "a\nb\n", "a\nuser\n", "a\nnew\n"
+
+        cached_three_way_merge(cache, base, user, new, backend=MergeBackend.PYTHON)
+        cached_three_way_merge(cache, base, user, new, backend=MergeBackend.GIT)
+
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_section_merge_hit_restores_stats(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A hit should not merge again but still count auto-resolved edits."""
+        cache = DiskCache(tmp_path)
+        base = "## A\nUse pytest for tests.\n"
+        user = "## A\nUse pytest -q for tests.\n"
+        new = "## A\nUse pytest for all tests.\n"
+        cached_three_way_merge_sections(cache, base, user, new)
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("merged again")
+
+        monkeypatch.setattr(cache_module, "three_way_merge_sections", fail)
+        stats = MergeStats()
+        result = cached_three_way_merge_sections(cache, base, user, new, stats=stats)
+
+        assert result == three_way_merge_sections(base, user, new)
+        assert stats.auto_resolved == 1
+
+    def test_corrupt_entry_is_recomputed(self, tmp_path: Path) -> None:
+        """An unreadable entry should be replaced with a fresh merge."""
+        cache = DiskCache(tmp_path)
+        base, user, new = "a\n", "b\n", "c\n"
+        key = merge_cache_key("lines", base, user, new, "git", "python")
+        (tmp_path / key).write_bytes(b"not zlib")
+
+        result = cached_three_way_merge(cache, base, user, new)
+
+        assert result == three_way_merge(base, user, new)
+        assert cache.get(key) is not None
+
+
+class TestAIResponseCache:
+    """Tests for cached AI answers."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """A stored answer should come back for the same request only."""
+        cache = DiskCache(tmp_path)
+        request = {"model": "m", "system": "s", "messages": [{"content": "u"}]}
+        key = ai_cache_key(request)
+
+        store_ai_response(cache, key, "## New\n", "Added New")
+
+        assert load_ai_response(cache, key) == ("## New\n", "Added New")
+        assert load_ai_response(cache, ai_cache_key({**request, "model": "n"})) is None
+
+    def test_no_sections_answer_is_cached(self, tmp_path: Path) -> None:
+        """A NONE verdict is an answer too, not a miss."""
+        cache = DiskCache(tmp_path)
+
+        store_ai_response(cache, _key(1), None, "No new sections")
+
+        assert load_ai_response(cache, _key(1)) == (None, "No new sections")
+
+    def test_entries_expire(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Answers older than the TTL should be asked for again."""
+        cache = DiskCache(tmp_path)
+        store_ai_response(cache, _key(1), "## New\n", "Added New")
+
+        later = cache_module.time.time() + cache_module.AI_CACHE_TTL + 1
+        monkeypatch.setattr(cache_module.time, "time", lambda: later)
+
+        assert load_ai_response(cache, _key(1)) is None
+
+    def test_disabled_by_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """ECHOGRAPH_NO_CACHE should turn the AI cache off too."""
+        monkeypatch.setenv("ECHOGRAPH_NO_CACHE", "1")
+
+        assert get_ai_cache() is None
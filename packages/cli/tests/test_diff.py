@@ -0,0 +1,158 @@
+"""Tests for the line diff engine."""
+
+import difflib
+import random
+
+from echograph_cli.core.diff import (
+    LineInterner,
+    diff_opcodes,
+    matching_blocks,
+    similarity_ratio,
+    unified_diff,
+)
+from echograph_cli.core.merge import three_way_merge
+
+
+def _lcs_length(a: list[int], b: list[int]) -> int:
+    """Reference LCS length via dynamic programming."""
+    prev = [0] * (len(b) + 1)
+    for x in a:
+        cur = [0]
+        for j, y in enumerate(b):
+            cur.append(prev[j] + 1 if x == y else max(prev[j + 1], cur[j]))
+        prev = cur
+    return prev[-1]
+
+
+def _apply(a: list[int], b: list[int]) -> list[int]:
+    """Rebuild b from a using diff_opcodes, checking opcode invariants."""
+    out: list[int] = []
+    i = j = 0
+    for tag, i1, i2, j1, j2 in diff_opcodes(a, b):
+        assert (i1, j1) == (i, j)
+        if tag == "equal":
+            assert a[i1:i2] == b[j1:j2]
+        out.extend(b[j1:j2])
+        i, j = i2, j2
+    assert (i, j) == (len(a), len(b))
+    return out
+
+
+class TestDiffOpcodes:
+    """Tests for diff_opcodes()."""
+
+    def test_identical(self) -> None:
+        """Identical sequences should be a single equal opcode."""
+        assert diff_opcodes(["a", "b"], ["a", "b"]) == [("equal", 0, 2, 0, 2)]
+
+    def test_empty_sides(self) -> None:
+        """Empty inputs should produce pure inserts or deletes."""
+        assert diff_opcodes([], []) == []
+        assert diff_opcodes([], ["a"]) == [("insert", 0, 0, 0, 1)]
+        assert diff_opcodes(["a"], []) == [("delete", 0, 1, 0, 0)]
+
+    def test_replace_in_middle(self) -> None:
+        """A changed line should be a replace between equal runs."""
+        assert diff_opcodes(["a", "b", "c"], ["a", "x", "c"]) == [
+            ("equal", 0, 1, 0, 1),
+            ("replace", 1, 2, 1, 2),
+            ("equal", 2, 3, 2, 3),
+        ]
+
+    def test_repeated_lines_are_matched(self) -> None:
+        """Blank and table lines should match despite repetition."""
+        row = "| a | b |\n"
+        base = ["# T\n", "\n"] + [row] * 300 + ["\n", "end\n"]
+        user = ["# T\n", "\n"] + [row] * 150 + ["new\n"] + [row] * 150 + ["\n", "end\n"]
+
+        ops = [op for op in diff_opcodes(base, user) if op[0] != "equal"]
+
+        assert ops == [("insert", 152, 152, 152, 153)]
+
+    def test_random_edits_reconstruct(self) -> None:
+        """Opcodes should always transform a into b."""
+        rng = random.Random(42)
+        for _ in range(500):
+            a = [rng.randrange(4) for _ in range(rng.randrange(30))]
+            b = [rng.randrange(4) for _ in range(rng.randrange(30))]
+            assert _apply(a, b) == b
+
+    def test_myers_fallback_is_minimal(self) -> None:
+        """Without unique anchors the match count should equal the LCS."""
+        rng = random.Random(7)
+        for _ in range(200):
+            a = [rng.randrange(2) for _ in range(rng.randrange(1, 25))]
+            b = [rng.randrange(2) for _ in range(rng.randrange(1, 25))]
+            matched = sum(size for _, _, size in matching_blocks(a, b))
+            assert matched == _lcs_length(a, b)
+
+
+class TestLineInterner:
+    """Tests for LineInterner."""
+
+    def test_equal_lines_share_ids(self) -> None:
+        """Equal lines across sequences should get the same id."""
+        interner = LineInterner()
+
+        a = interner.intern(["x\n", "y\n", "x\n"])
+        b = interner.intern(["y\n", "z\n"])
+
+        assert list(a) == [0, 1, 0]
+        assert list(b) == [1, 2]
+        assert interner.lines() == ["x\n", "y\n", "z\n"]
+        assert len(interner) == 3
+
+
+class TestUnifiedDiff:
+    """Tests for unified_diff()."""
+
+    def test_matches_difflib_format(self) -> None:
+        """Output should be identical to difflib for a simple edit."""
+        a = [f"line {i}\n" for i in range(20)]
+        b = a[:5] + ["inserted\n"] + a[5:14] + a[15:]
+
+        ours = list(unified_diff(a, b, "old", "new"))
+        expected = list(difflib.unified_diff(a, b, "old", "new"))
+
+        assert ours == expected
+
+    def test_no_output_when_equal(self) -> None:
+        """Identical inputs should produce no diff."""
+        assert list(unified_diff(["a\n"], ["a\n"])) == []
+
+
+class TestSimilarityRatio:
+    """Tests for similarity_ratio()."""
+
+    def test_matches_sequence_matcher_on_small_edit(self) -> None:
+        """A one-word change should score like SequenceMatcher.ratio()."""
+        a = "# Title\nthis is a test\nmore\n"
+        b = "# Title\nthis is the test\nmore\n"
+
+        expected = difflib.SequenceMatcher(None, a, b).ratio()
+
+        assert abs(similarity_ratio(a, b) - expected) < 1e-9
+
+    def test_bounds(self) -> None:
+        """Identical texts score 1 and disjoint texts score 0."""
+        assert similarity_ratio("", "") == 1.0
+        assert similarity_ratio("abc\n", "abc\n") == 1.0
+        assert similarity_ratio("aaa", "bbb") == 0.0
+
+
+class TestThreeWayMergeRepeatedLines:
+    """three_way_merge on inputs that confused difflib's junk heuristic."""
+
+    def test_non_overlapping_edits_in_large_table(self) -> None:
+        """Edits at opposite ends of a long table should merge cleanly."""
+        rows = [f"| row | {i % 3} |\n" for i in range(400)]
+        base = "".join(["# Table\n", "\n"] + rows + ["\n"])
+        user = "".join(["# My Table\n", "\n"] + rows + ["\n"])
+        new = "".join(["# Table\n", "\n"] + rows + ["\n", "Footer\n"])
+
+        merged, conflicts = three_way_merge(base, user, new)
+
+        assert conflicts == []
+        assert merged.startswith("# My Table\n")
+        assert merged.endswith("Footer\n")
+        assert merged.count("| row |") == 400
@@ -0,0 +1,95 @@
+"""Tests for crash-safe file writing helpers."""
+
+import os
+import stat
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from echograph_cli.core.fileio import (
+    atomic_write_chunks,
+    atomic_write_text,
+    write_text_if_changed,
+)
+
+
+class TestAtomicWrite:
+    """Tests for atomic file writes."""
+
+    def test_writes_content(self, tmp_path: Path) -> None:
+        """Should write the given text."""
+        target = tmp_path / "file.md"
+
+        atomic_write_text(target, "hello\n")
+
+        assert target.read_text(encoding="utf-8") == "hello\n"
+
+    def test_leaves_no_temp_files(self, tmp_path: Path) -> None:
+        """Should not leave temp files behind."""
+        atomic_write_text(tmp_path / "file.md", "hello\n")
+
+        assert [p.name for p in tmp_path.iterdir()] == ["file.md"]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_preserves_existing_mode(self, tmp_path: Path) -> None:
+        """Should keep permissions of the file it replaces."""
+        target = tmp_path / "script.sh"
+        target.write_text("old\n")
+        target.chmod(0o755)
+
+        atomic_write_text(target, "new\n")
+
+        assert stat.S_IMODE(target.stat().st_mode) == 0o755
+
+
+class TestAtomicWriteChunks:
+    """Tests for streamed atomic writes."""
+
+    def test_writes_chunks_in_order(self, tmp_path: Path) -> None:
+        """Should write the concatenated chunks."""
+        target = tmp_path / "file.md"
+
+        atomic_write_chunks(target, (f"line {i}\n" for i in range(3)))
+
+        assert target.read_text(encoding="utf-8") == "line 0\nline 1\nline 2\n"
+
+    def test_failing_producer_keeps_old_file(self, tmp_path: Path) -> None:
+        """An error mid-stream should leave the target and no temp file."""
+        target = tmp_path / "file.md"
+        target.write_text("old\n", encoding="utf-8")
+
+        def chunks() -> Iterator[str]:
+            yield "partial\n"
+            raise RuntimeError("merge failed")
+
+        with pytest.raises(RuntimeError):
+            atomic_write_chunks(target, chunks())
+
+        assert target.read_text(encoding="utf-8") == "old\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["file.md"]
+
+
+class TestWriteIfChanged:
+    """Tests for hash-skipping writes."""
+
+    def test_writes_missing_file(self, tmp_path: Path) -> None:
+        """Should write when target doesn't exist."""
+        assert write_text_if_changed(tmp_path / "new.md", "content\n") is True
+
+    def test_skips_identical_content(self, tmp_path: Path) -> None:
+        """Should not rewrite a file that already has the content."""
+        target = tmp_path / "same.md"
+        target.write_text("content\n", encoding="utf-8")
+        os.utime(target, (0, 0))
+
+        assert write_text_if_changed(target, "content\n") is False
+        assert target.stat().st_mtime == 0
+
+    def test_rewrites_changed_content(self, tmp_path: Path) -> None:
+        """Should write when content differs."""
+        target = tmp_path / "changed.md"
+        target.write_text("old\n", encoding="utf-8")
+
+        assert write_text_if_changed(target, "new\n") is True
+        assert target.read_text(encoding="utf-8") == "new\n"
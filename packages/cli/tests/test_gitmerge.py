@@ -0,0 +1,191 @@
+"""Parity tests for the git merge-file backend against the Python engine."""
+
+import random
+
+import pytest
+
+from echograph_cli.core import gitmerge
+from echograph_cli.core import merge as merge_module
+from echograph_cli.core.merge import MergeBackend, three_way_merge
+
+requires_git = pytest.mark.skipif(
+    gitmerge.git_executable() is None, reason="git not installed"
+)
+
+
+def _both(base: str, user: str, new: str) -> tuple[object, object]:
+    """Merge with each backend."""
+    return (
+        three_way_merge(base, user, new, backend=MergeBackend.PYTHON),
+        three_way_merge(base, user, new, backend=MergeBackend.GIT),
+    )
+
+
+def _edit(lines: list[str], rng: random.Random, tag: str) -> str:
+    """Replace, insert or delete a few lines."""
+    lines = list(lines)
+    for _ in range(rng.randrange(1, 4)):
+        pos = rng.randrange(len(lines) + 1)
+        kind = rng.random()
+        if kind < 0.4 and pos < len(lines):
+            lines[pos] = f"{tag} {pos}\n"
+        elif kind < 0.7:
+            lines.insert(pos, f"{tag} insert {pos}\n")
+        elif pos < len(lines):
+            del lines[pos]
+    return "".join(lines)
+
+
+@requires_git
+class TestGitBackendParity:
+    """The git backend should produce exactly the Python engine's merge."""
+
+    @pytest.mark.parametrize(
+        ("base", "user", "new"),
+        [
+            ("a\nb\nc\nd\n", "a\nB\nc\nd\n", "a\nb\nc\nD\n"),  # Separate edits
+            ("a\nb\nc\n", "a\nuser\nc\n", "a\nnew\nc\n"),  # Same line
+            ("a\nb\nc\nd\n", "a\nB\nc\nd\n", "a\nb\nC\nd\n"),  # Adjacent edits
+            ("a\nb\n", "a\nb\nuser end\n", "a\nb\nnew end\n"),  # Both append
+            ("a\nb\nc\n", "a\nc\n", "a\nb\nc\nd\n"),  # Delete vs append
+            ("a\nb\n", "a\nb x\n", "a\nb\n"),  # One side only
+            ("a\nb\n", f"a\n{'<' * 40} not a marker\nb\n", "a\nnew\n"),
+            ("x = 1 # a\n", "x = 2 # a\n", "x = 1 # b\n"),  # Word refinement
+        ],
+        ids=[
+            "separate",
+            "same-line",
+            "adjacent",
+            "both-append",
+            "delete-vs-append",
+            "one-side",
+            "marker-like-line",
+            "refined",
+        ],
+    )
+    def test_known_cases(self, base: str, user: str, new: str) -> None:
+        """Clean merges, conflicts and refinements should all match."""
+        python, git = _both(base, user, new)
+
+        assert git == python
+
+    @pytest.mark.parametrize(
+        ("base", "user", "new"),
+        [
+            (
+                "# T\n\n## A\n\na\n\n---\n\n## B\n\nb\n",
+                "# T\n\n## A\n\na user\n\n---\n\n## B\n\nb\n",
+                "# T\n\n## A\n\na\n\n---\n\n## B\n\nb new\n",
+            ),
+            ("a\n\n\nb\n\n\nc\n", "a\n\n\nB\n\n\nc\n", "a\n\n\nb\n\n\nc\n\n\nd\n"),
+            (
+                "```\nx\n```\n\n```\ny\n```\n",
+                "```\nX\n```\n\n```\ny\n```\n",
+                "```\nx\n```\n\n```\nY\n```\n",
+            ),
+        ],
+        ids=["separators", "blank-runs", "fences"],
+    )
+    def test_repeated_lines(self, base: str, user: str, new: str) -> None:
+        """Repeated blank, rule and fence lines with unambiguous edits match."""
+        python, git = _both(base, user, new)
+
+        assert git == python
+
+    def test_repeated_lines_can_align_differently(self) -> None:
+        """Ambiguous repeats may merge differently, which is why git is opt-in."""
+        python, git = _both("b\na\na\n", "\nb\na\n", "b\na\n")
+
+        assert python == ("\nb\n", [])
+        assert git == ("\nb\na\n", [])
+
+    def test_seeded_random_edits(self) -> None:
+        """Random edits to files of distinct lines should merge identically."""
+        rng = random.Random(2024)
+        for _ in range(300):
+            base = [f"line {i}\n" for i in range(rng.randrange(1, 40))]
+            python, git = _both(
+                "".join(base), _edit(base, rng, "user"), _edit(base, rng, "new")
+            )
+
+            assert git == python
+
+
+class TestBackendSelection:
+    """Tests for choosing between git and the Python engine."""
+
+    @staticmethod
+    def _record_git_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        """Count calls to git merge-file without running it."""
+        calls: list[str] = []
+
+        def fake(base: str, user: str, new: str) -> None:
+            calls.append(base)
+            return None  # Falls back to Python
+
+        monkeypatch.setattr(gitmerge, "git_executable", lambda: "git")
+        monkeypatch.setattr(gitmerge, "git_diff3_chunks", fake)
+        return calls
+
+    def test_default_never_calls_git(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The default backend should merge in Python whatever the size."""
+        calls = self._record_git_calls(monkeypatch)
+        monkeypatch.setattr(merge_module, "GIT_MERGE_MIN_CHARS", 0)
+
+        base = "".join(f"line {i}\n" for i in range(10))
+        three_way_merge(base, base + "user\n", "new\n" + base)
+
+        assert calls == []
+
+    def test_auto_uses_git_only_for_large_inputs(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """AUTO should leave small merges on the Python engine."""
+        calls = self._record_git_calls(monkeypatch)
+        monkeypatch.setattr(merge_module, "GIT_MERGE_MIN_CHARS", 30)
+
+        three_way_merge("a\nb\n", "a\nB\n", "A\nb\n", backend=MergeBackend.AUTO)
+        assert calls == []
+
+        base = "".join(f"line {i}\n" for i in range(10))
+        three_way_merge(
+            base, base + "user\n", "new\n" + base, backend=MergeBackend.AUTO
+        )
+        assert calls == [base]
+
+    def test_python_backend_never_calls_git(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """PYTHON should not start git, whatever the size."""
+        calls = self._record_git_calls(monkeypatch)
+        monkeypatch.setattr(merge_module, "GIT_MERGE_MIN_CHARS", 0)
+
+        three_way_merge("a\n", "b\n", "c\n", backend=MergeBackend.PYTHON)
+
+        assert calls == []
+
+    @pytest.mark.parametrize(
+        ("base", "user", "new"),
+        [
+            ("a\nb", "a\nB", "A\nb"),  # No final newline
+            ("a\r\nb\r\n", "a\r\nB\r\n", "A\r\nb\r\n"),  # \r line breaks
+        ],
+    )
+    def test_unsupported_inputs_stay_on_python(
+        self, base: str, user: str, new: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Inputs git would split into different lines shouldn't go to git."""
+        calls = self._record_git_calls(monkeypatch)
+
+        merged = three_way_merge(base, user, new, backend=MergeBackend.GIT)
+
+        assert calls == []
+        assert merged == three_way_merge(base, user, new, backend=MergeBackend.PYTHON)
+
+    def test_missing_git_falls_back(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without git, the GIT backend should still merge in Python."""
+        monkeypatch.setattr(gitmerge, "git_executable", lambda: None)
+
+        merged = three_way_merge("a\nb\n", "a\nB\n", "A\nb\n", backend=MergeBackend.GIT)
+
+        assert merged == ("A\nB\n", [])
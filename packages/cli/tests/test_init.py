@@ -236,3 +236,83 @@ My custom security rules that should not be overwritten.
         assert not old_claude_md.exists()
         # Root should still have its content
         assert "Root content" in root_claude_md.read_text()
+
+
+class TestInitBatch:
+    """Tests for echograph init --batch."""
+
+    def _run(self, base: Path, *args: str) -> list[dict[str, object]]:
+        import json
+
+        result = runner.invoke(
+            app, ["init", str(base), "--minimal", "--workers", "2", *args]
+        )
+        assert result.exit_code == 0, result.output
+        return [json.loads(line) for line in result.output.splitlines()]
+
+    def test_batch_initializes_matching_projects(self, temp_project: Path) -> None:
+        """Should scaffold every directory matched by the glob."""
+        for name in ("svc-a", "svc-b", "svc-c"):
+            (temp_project / name).mkdir()
+
+        summaries = self._run(temp_project, "--batch", "svc-*")
+
+        assert [s["project_name"] for s in summaries] == ["svc-a", "svc-b", "svc-c"]
+        assert all(s["status"] == "ok" for s in summaries)
+        for name in ("svc-a", "svc-b", "svc-c"):
+            assert (temp_project / name / "CLAUDE.md").exists()
+            assert name in (temp_project / name / "CLAUDE.md").read_text()
+
+    def test_batch_applies_skip_policy(self, temp_project: Path) -> None:
+        """Should keep existing files with the default skip policy."""
+        project = temp_project / "svc"
+        project.mkdir()
+        (project / "CLAUDE.md").write_text("mine\n")
+
+        summaries = self._run(temp_project, "--batch", "svc")
+
+        assert "CLAUDE.md" in summaries[0]["skipped"]
+        assert (project / "CLAUDE.md").read_text() == "mine\n"
+
+    def test_batch_applies_rename_policy(self, temp_project: Path) -> None:
+        """Should back up existing files with --on-conflict rename."""
+        project = temp_project / "svc"
+        project.mkdir()
+        (project / "CLAUDE.md").write_text("mine\n")
+
+        summaries = self._run(temp_project, "--batch", "svc", "--on-conflict", "rename")
+
+        assert "CLAUDE.md" in summaries[0]["created"]
+        assert (project / "CLAUDE.md.bak").read_text() == "mine\n"
+
+    def test_batch_dry_run_writes_nothing(self, temp_project: Path) -> None:
+        """Should only report planned writes with --dry-run."""
+        project = temp_project / "svc"
+        project.mkdir()
+        (project / "CLAUDE.md").write_text("mine\n")
+
+        summaries = self._run(
+            temp_project, "--batch", "svc", "--on-conflict", "rename", "--dry-run"
+        )
+
+        assert summaries[0]["dry_run"] is True
+        assert "CLAUDE.md" in summaries[0]["created"]
+        assert sorted(p.name for p in project.iterdir()) == ["CLAUDE.md"]
+        assert (project / "CLAUDE.md").read_text() == "mine\n"
+
+    def test_batch_reports_only_written_files(self, temp_project: Path) -> None:
+        """Should leave identical files out of created on a re-run."""
+        (temp_project / "svc").mkdir()
+        first = self._run(temp_project, "--batch", "svc")
+
+        second = self._run(temp_project, "--batch", "svc", "--on-conflict", "overwrite")
+
+        assert first[0]["created"]
+        assert second[0]["created"] == []
+
+    def test_batch_fails_when_nothing_matches(self, temp_project: Path) -> None:
+        """Should exit with an error when no directories match."""
+        result = runner.invoke(app, ["init", str(temp_project), "--batch", "missing-*"])
+
+        assert result.exit_code == 1
+        assert "No project directories matched" in result.output
@@ -81,3 +81,38 @@ class TestPlaceholderCommands:
 
         assert result.exit_code == 0
         assert "coming soon" in result.output.lower()
+
+
+class TestLazyCommands:
+    """Tests for lazy subcommand loading."""
+
+    def test_light_commands_skip_heavy_imports(self) -> None:
+        """Should not import jinja2, yaml or the merge engine for doctor."""
+        import subprocess
+        import sys
+
+        script = (
+            "import sys\n"
+            "from echograph_cli.main import load_command\n"
+            "load_command('doctor')\n"
+            "heavy = ['jinja2', 'yaml', 'echograph_cli.core.ai_merge',\n"
+            "         'echograph_cli.core.interactive_merge', 'rich.syntax']\n"
+            "print(','.join(m for m in heavy if m in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            shell=False,
+        )
+
+        assert result.returncode == 0
+        assert result.stdout.strip() == ""
+
+    def test_help_lists_lazy_commands(self) -> None:
+        """Should list lazily registered commands in help output."""
+        result = runner.invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        assert "search" in result.output
+        assert "decision" in result.output
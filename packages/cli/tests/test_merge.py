@@ -1,6 +1,21 @@
 """Tests for three-way merge."""
 
-from echograph_cli.core.merge import three_way_merge
+import pytest
+
+from echograph_cli.core.merge import (
+    TitleIndex,
+    iter_diff3_chunks,
+    iter_three_way_merge,
+    iter_three_way_merge_sections,
+    merge_claude_md_sections,
+    normalize_title,
+    parse_markdown_sections,
+    refine_conflict,
+    three_way_merge,
+    three_way_merge_sections,
+)
+from echograph_cli.core.models import MergeConflict, MergeStats, SectionConflict
+from echograph_cli.core.outline import parse_outline
 
 
 class TestThreeWayMerge:
@@ -107,3 +122,393 @@ class TestThreeWayMerge:
         merged, conflicts = three_way_merge(base, user, new)
 
         assert merged == new
+
+    def test_merges_insertions_from_both_sides(self) -> None:
+        """Should apply a user insertion and a template append together."""
+        base = "line 1\nline 2\n"
+        user = "line 1\nuser added\nline 2\n"
+        new = "line 1\nline 2\ntemplate appended\n"
+
+        merged, conflicts = three_way_merge(base, user, new)
+
+        assert merged == "line 1\nuser added\nline 2\ntemplate appended\n"
+        assert len(conflicts) == 0
+
+
+class TestDiff3:
+    """Tests for hunk grouping in the diff3 merge core."""
+
+    def test_adjacent_changes_merge_cleanly(self) -> None:
+        """Changes to neighbouring lines should not conflict."""
+        base = "a\nb\nc\nd\n"
+        user = "a\nB\nc\nd\n"
+        new = "a\nb\nC\nd\n"
+
+        merged, conflicts = three_way_merge(base, user, new)
+
+        assert merged == "a\nB\nC\nd\n"
+        assert conflicts == []
+
+    def test_insertions_at_same_point_conflict(self) -> None:
+        """Different insertions at one position should conflict."""
+        base = "a\nb\n"
+        user = "a\nX\nb\n"
+        new = "a\nY\nb\n"
+
+        _, conflicts = three_way_merge(base, user, new)
+
+        assert len(conflicts) == 1
+        assert conflicts[0].base_content == ""
+        assert conflicts[0].user_content == "X\n"
+        assert conflicts[0].new_content == "Y\n"
+
+    def test_partial_overlap_is_one_minimal_conflict(self) -> None:
+        """Partially overlapping hunks should become a single conflict."""
+        base = "a\nb\nc\nd\ne\nf\n"
+        user = "a\nB\nC\nd\ne\nf\n"
+        new = "a\nb\nZ\nD\ne\nf\n"
+
+        merged, conflicts = three_way_merge(base, user, new)
+
+        assert len(conflicts) == 1
+        assert conflicts[0].base_content == "b\nc\nd\n"
+        assert conflicts[0].user_content == "B\nC\nd\n"
+        assert conflicts[0].new_content == "b\nZ\nD\n"
+        assert merged.startswith("a\n<<<<<<<")
+        assert merged.endswith(">>>>>>> NEW TEMPLATE\ne\nf\n")
+
+    def test_conflict_line_number_is_marker_line(self) -> None:
+        """line_number should point at the start marker in the output."""
+        base = "1\n2\n3\n4\n"
+        user = "1\n2\nuser\n4\n"
+        new = "1\n2\nnew\n4\n"
+
+        merged, conflicts = three_way_merge(base, user, new)
+
+        lines = merged.splitlines()
+        assert lines[conflicts[0].line_number - 1] == "<<<<<<< YOUR CHANGES"
+
+    def test_conflict_without_trailing_newline(self) -> None:
+        """Markers should stay on their own lines at end of file."""
+        merged, _ = three_way_merge("a\nb", "a\nuser", "a\nnew")
+
+        assert "user\n=======\nnew\n>>>>>>>" in merged
+
+    def test_chunks_stream_in_order(self) -> None:
+        """Stable and conflict chunks should rebuild the merged output."""
+        base = ["a\n", "b\n", "c\n"]
+        user = ["a\n", "x\n", "c\n"]
+        new = ["a\n", "y\n", "c\n", "d\n"]
+
+        chunks = list(iter_diff3_chunks(base, user, new))
+
+        assert [c.conflict for c in chunks] == [False, True, False, False]
+        assert chunks[1].base == ["b\n"]
+        assert chunks[-1].lines == ["d\n"]
+
+
+class TestRefinement:
+    """Tests for word-level re-merging of conflicting hunks."""
+
+    def test_refine_merges_edits_to_different_words(self) -> None:
+        """Edits to different words of one line should merge."""
+        merged = refine_conflict(
+            "Run pytest in src/ folder\n",
+            "Run pytest in app/ folder\n",
+            "Run pytest in src/ directory\n",
+        )
+
+        assert merged == "Run pytest in app/ directory\n"
+
+    def test_refine_keeps_overlapping_word_edits(self) -> None:
+        """Both sides changing the same word is still a conflict."""
+        assert refine_conflict("use tabs\n", "use spaces\n", "use nothing\n") is None
+
+    def test_refine_keeps_line_breaks(self) -> None:
+        """A word merge that would drop the hunk's final newline is refused."""
+        assert refine_conflict("\n", " (user edit)\n", "") is None
+
+    def test_line_conflict_resolved_and_counted(self) -> None:
+        """A same-line conflict with disjoint word edits should not get markers."""
+        base = "a\nport = 8000 # dev\nb\n"
+        user = "a\nport = 9000 # dev\nb\n"
+        new = "a\nport = 8000 # local dev\nb\n"
+        stats = MergeStats()
+
+        merged, conflicts = three_way_merge(base, user, new, stats=stats)
+
+        assert conflicts == []
+        assert merged == "a\nport = 9000 # local dev\nb\n"
+        assert stats.auto_resolved == 1
+
+    def test_refine_disabled_keeps_markers(self) -> None:
+        """refine=False should report the line-level conflict as before."""
+        base = "x = 1 # a\n"
+        user = "x = 2 # a\n"
+        new = "x = 1 # b\n"
+
+        merged, conflicts = three_way_merge(base, user, new, refine=False)
+
+        assert len(conflicts) == 1
+        assert "<<<<<<<" in merged
+
+    def test_section_conflict_resolved_within_section(self) -> None:
+        """Section edits on disjoint words should merge without a conflict."""
+        base = "## A\nUse pytest for tests.\n"
+        user = "## A\nUse pytest -q for tests.\n"
+        new = "## A\nUse pytest for all tests.\n"
+        stats = MergeStats()
+
+        merged, conflicts = three_way_merge_sections(base, user, new, stats=stats)
+
+        assert conflicts == []
+        assert merged == "## A\nUse pytest -q for all tests.\n"
+        assert stats.auto_resolved == 1
+
+
+class TestSectionMerge:
+    """Tests for outline-based section parsing and merging."""
+
+    def test_parse_keeps_duplicate_titles(self) -> None:
+        """Repeated titles should not overwrite each other."""
+        sections = parse_markdown_sections("## Notes\na\n## Notes\nb\n")
+
+        assert sections == {"Notes": "## Notes\na\n", "Notes (2)": "## Notes\nb\n"}
+
+    def test_parse_ignores_fenced_headers(self) -> None:
+        """A ## line inside a code fence should stay in its section."""
+        sections = parse_markdown_sections("## A\n```\n## B\n```\n")
+
+        assert list(sections) == ["A"]
+
+    def test_parse_keeps_text_under_later_h1(self) -> None:
+        """Intro text of a # header after a ## section should get a section."""
+        sections = parse_markdown_sections("## A\na\n\n# Title\nintro text\n")
+
+        assert sections == {"A": "## A\na\n\n", "Title": "# Title\nintro text\n"}
+
+    @pytest.mark.parametrize(
+        "doc",
+        [
+            "# P\nintro\n\n## A\na\n\n## B\nb\n",
+            "## A\na\n\n# Title\nintro text\n\n## B\nb\n",
+            "## A\na\n# Part 2\n### Detail\nd\n## A\nagain\n# Part 2\n",
+            "Preamble only\n",
+            "",
+        ],
+        ids=["preamble", "later-h1", "nested-and-repeated", "no-headers", "empty"],
+    )
+    def test_parse_then_merge_round_trips(self, doc: str) -> None:
+        """Sections and an edit-free merge should reproduce the input exactly."""
+        assert "".join(parse_markdown_sections(doc).values()) == doc
+        assert three_way_merge_sections(doc, doc, doc) == (doc, [])
+
+    def test_merge_keeps_text_under_later_h1(self) -> None:
+        """Edits elsewhere shouldn't drop the intro of a # header."""
+        base = "## A\na\n\n# Title\nintro text\n\n## B\nb\n"
+        user = base.replace("a\n", "a user\n", 1)
+        new = base.replace("b\n", "b new\n")
+
+        merged, conflicts = three_way_merge_sections(base, user, new)
+
+        assert conflicts == []
+        assert merged == "## A\na user\n\n# Title\nintro text\n\n## B\nb new\n"
+
+    def test_renamed_document_title_still_merges_sections(self) -> None:
+        """A renamed # title shouldn't make the template look like a new section."""
+        base = "# myrepo\n\n## A\na\n\n## B\nb\n"
+        user = "# My Repo\n\n## A\na\n\n## B\nb user\n"
+        new = "# myrepo\n\n## A\na new\n\n## B\nb\n"
+
+        merged, conflicts = three_way_merge_sections(base, user, new)
+
+        assert conflicts == []
+        assert merged == "# My Repo\n\n## A\na new\n\n## B\nb user\n"
+
+    def test_document_title_changed_on_both_sides_conflicts(self) -> None:
+        """Both sides renaming the # title should be reported, not dropped."""
+        base = "# myrepo\n\n## A\na\n"
+        user = "# My Repo\n\n## A\na\n"
+        new = "# other\n\n## A\na new\n"
+
+        merged, conflicts = three_way_merge_sections(base, user, new)
+
+        assert [c.section_title for c in conflicts] == ["My Repo"]
+        assert "# other" in merged
+        assert merged.endswith("## A\na new\n")
+
+    def test_takes_template_section_user_did_not_touch(self) -> None:
+        """Unchanged user sections should take the template's update."""
+        base = "# P\n\n## A\na\n\n## B\nb\n"
+        user = "# P\n\n## A\nmine\n\n## B\nb\n"
+        new = "# P\n\n## A\na\n\n## B\nb2\n"
+
+        merged, conflicts = three_way_merge_sections(base, user, new)
+
+        assert conflicts == []
+        assert merged == "# P\n\n## A\nmine\n\n## B\nb2\n"
+
+    def test_conflict_narrows_to_subsection(self) -> None:
+        """Both sides editing different ### subsections should not conflict."""
+        base = "## A\nintro\n\n### X\nx\n\n### Y\ny\n"
+        user = "## A\nintro\n\n### X\nuser x\n\n### Y\ny\n"
+        new = "## A\nintro\n\n### X\nx\n\n### Y\nnew y\n"
+
+        merged, conflicts = three_way_merge_sections(base, user, new)
+
+        assert conflicts == []
+        assert "user x" in merged
+        assert "new y" in merged
+
+    def test_conflict_reports_deepest_section(self) -> None:
+        """A real conflict should cover only the subsection both changed."""
+        base = "## A\n\n### X\nx\n\n### Y\ny\n"
+        user = "## A\n\n### X\nuser\n\n### Y\ny\n"
+        new = "## A\n\n### X\nnew\n\n### Y\nnew y\n"
+
+        merged, conflicts = three_way_merge_sections(base, user, new)
+
+        assert [c.section_title for c in conflicts] == ["X"]
+        assert "new y" in merged
+
+    def test_keeps_user_sections_and_appends_new(self) -> None:
+        """User-only sections stay; template-only sections are appended."""
+        base = "## A\na\n"
+        user = "## A\na\n\n## Mine\nm\n"
+        new = "## A\na2\n\n## Added\nn\n"
+
+        merged, conflicts = three_way_merge_sections(base, user, new)
+
+        assert conflicts == []
+        assert merged == "## A\na2\n\n## Mine\nm\n\n## Added\nn\n"
+
+
+class TestStreamingMerge:
+    """Tests for the generator merge APIs."""
+
+    def test_line_merge_chunks_match_full_merge(self) -> None:
+        """Joined chunks and collected conflicts should equal three_way_merge."""
+        base = "a\nb\nc\nd\n"
+        user = "a\nB\nc\nuser d\n"
+        new = "a\nb\nc\nnew d\n"
+        conflicts: list[MergeConflict] = []
+
+        chunks = list(iter_three_way_merge(base, user, new, conflicts=conflicts))
+
+        assert len(chunks) > 1
+        assert ("".join(chunks), conflicts) == three_way_merge(base, user, new)
+
+    def test_section_merge_chunks_match_full_merge(self) -> None:
+        """Section chunks should join to the three_way_merge_sections result."""
+        base = "# P\n\n## A\na\n\n## B\nb\n\n### X\nx\n"
+        user = "# P\n\n## A\nmine\n\n## B\nb\n\n### X\nuser x\n"
+        new = "# P\n\n## A\na\n\n## B\nb2\n\n### X\nnew x\n\n## C\nc\n"
+        conflicts: list[SectionConflict] = []
+
+        chunks = list(
+            iter_three_way_merge_sections(base, user, new, conflicts=conflicts)
+        )
+
+        assert len(chunks) > 1
+        assert ("".join(chunks), conflicts) == three_way_merge_sections(base, user, new)
+        assert [c.section_title for c in conflicts] == ["X"]
+
+
+class TestRenamedSections:
+    """Tests for pairing renamed sections by content similarity."""
+
+    BODY = (
+        "- run pytest with coverage enabled\n"
+        "- keep unit tests next to the code they cover\n"
+        "- mock external services only\n"
+    )
+
+    def _doc(self, title: str, body: str, extra: str = "") -> str:
+        """A document with one section under test and one other section."""
+        return f"# P\n\n## {title}\n\n{body}\n## Other\n\nx\n{extra}"
+
+    def test_untouched_section_takes_renamed_template_section(self) -> None:
+        """A renamed section should replace the user's unedited copy."""
+        base = self._doc("Testing", self.BODY)
+        new = self._doc("Testing Strategy", self.BODY + "- add integration tests\n")
+
+        merged, conflicts = three_way_merge_sections(base, base, new)
+
+        assert conflicts == []
+        assert merged == new
+
+    def test_user_edits_merge_into_renamed_section(self) -> None:
+        """User and template edits to different lines should both survive."""
+        base = self._doc("Testing", self.BODY)
+        user = self._doc("Testing", "- our rule: use factories\n" + self.BODY)
+        new = self._doc("Testing Strategy", self.BODY + "- add integration tests\n")
+
+        merged, conflicts = three_way_merge_sections(base, user, new)
+
+        assert conflicts == []
+        assert "## Testing Strategy" in merged
+        assert "## Testing\n" not in merged
+        assert "our rule: use factories" in merged
+        assert "add integration tests" in merged
+
+    def test_dissimilar_new_section_is_added(self) -> None:
+        """A dropped and an unrelated added section should not be paired."""
+        base = self._doc("Testing", self.BODY)
+        user = self._doc("Testing", self.BODY, extra="user notes\n")
+        new = self._doc("Deployment", "- ship with blue green rollouts\n")
+
+        merged, conflicts = three_way_merge_sections(base, user, new)
+
+        assert conflicts == []
+        assert "## Testing" in merged
+        assert "## Deployment" in merged
+
+    def test_user_sections_not_paired_without_base(self) -> None:
+        """Without a base, the user's sections are never treated as renamed."""
+        user = self._doc("Testing", self.BODY)
+        new = self._doc("Testing Strategy", self.BODY)
+
+        merged, conflicts = three_way_merge_sections("", user, new)
+
+        assert conflicts == []
+        assert "## Testing\n" in merged
+        assert "## Testing Strategy" in merged
+
+
+class TestTitleIndex:
+    """Tests for normalized-title matching."""
+
+    def test_normalize_ignores_case_and_emoji(self) -> None:
+        """Emoji and punctuation should not affect matching."""
+        assert normalize_title("🚀 Quick Start!") == normalize_title("quick start")
+
+    def test_index_keys_repeated_titles_by_occurrence(self) -> None:
+        """Repeated titles should get increasing occurrence numbers."""
+        root = parse_outline("## Notes\n## 📝 notes\n## Other\n")
+
+        index = TitleIndex(root.children)
+
+        assert [key for key, _ in index.entries] == [
+            ("notes", 1),
+            ("notes", 2),
+            ("other", 1),
+        ]
+        assert "notes" in index
+        assert ("notes", 2) in index
+        assert index.get(("notes", 3)) is None
+
+
+class TestMergeClaudeMdSections:
+    """Tests for merge_claude_md_sections()."""
+
+    def test_adds_only_missing_sections(self) -> None:
+        """Sections matching by normalized title should not be added."""
+        existing = "# P\n\n## 🚀 Quick Start\nmine\n"
+        template = "# P\n\n## Quick Start\ntemplate\n\n## Security Rules\nrules\n"
+
+        merged, added = merge_claude_md_sections(existing, template)
+
+        assert added == ["Security Rules"]
+        assert merged == (
+            "# P\n\n## 🚀 Quick Start\nmine\n\n\n## Security Rules\nrules\n"
+        )
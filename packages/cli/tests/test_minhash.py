@@ -0,0 +1,52 @@
+"""Tests for MinHash section signatures."""
+
+from echograph_cli.core.minhash import best_pairs, shingles, signature, similarity
+
+TEXT = "keep unit tests next to the code they cover and mock external services"
+
+
+class TestSignature:
+    """Tests for signatures and similarity estimates."""
+
+    def test_identical_texts_match(self) -> None:
+        """Equal texts should have equal signatures."""
+        assert signature(TEXT) == signature(TEXT)
+
+    def test_similarity_tracks_overlap(self) -> None:
+        """A small edit should score higher than an unrelated text."""
+        edited = signature(TEXT + " only")
+        unrelated = signature("deploy with blue green rollouts behind a flag")
+        original = signature(TEXT)
+        assert original is not None and edited is not None and unrelated is not None
+
+        assert similarity(original, edited) > 0.5
+        assert similarity(original, unrelated) < 0.2
+
+    def test_no_words_has_no_signature(self) -> None:
+        """Text without words can't be compared."""
+        assert signature("--- |\n") is None
+
+    def test_short_text_uses_words(self) -> None:
+        """Texts shorter than a shingle fall back to single words."""
+        assert shingles("Run tests") == {"run", "tests"}
+
+
+class TestBestPairs:
+    """Tests for greedy pairing of signatures."""
+
+    def test_pairs_each_side_once(self) -> None:
+        """Each signature should be paired with its most similar partner."""
+        texts = [TEXT, "deploy with blue green rollouts behind a feature flag"]
+        left = [signature(t) for t in texts]
+        right = [signature(t + " today") for t in reversed(texts)]
+
+        pairs = best_pairs(left, right, 0.5)  # type: ignore[arg-type]
+
+        assert sorted(pairs) == [(0, 1), (1, 0)]
+
+    def test_threshold_excludes_weak_pairs(self) -> None:
+        """Pairs below the threshold should be left out."""
+        left = [signature(TEXT)]
+        right = [signature("an entirely different paragraph about releases")]
+
+        assert best_pairs(left, right, 0.5) == []  # type: ignore[arg-type]
@@ -0,0 +1,140 @@
+"""Tests for local detection of new template sections."""
+
+import pytest
+from rich.console import Console
+
+from echograph_cli.core import ai_merge as ai_merge_module
+from echograph_cli.core.ai_merge import needs_ai_merge, smart_merge_file
+from echograph_cli.core.new_sections import MIN_LOCAL_CONFIDENCE, detect_new_sections
+
+TEMPLATE = """\
+# [[PROJECT_NAME]]
+
+## Overview
+Describe the project.
+
+## Tech Stack
+- Language
+
+## [[PROJECT_NAME]] Commands
+Run the tests before committing.
+
+## Security Rules (CRITICAL)
+Never commit secrets or API keys. Validate all external input.
+"""
+
+
+class TestDetectNewSections:
+    """Tests for detect_new_sections."""
+
+    def test_finds_missing_section(self) -> None:
+        """Sections with no similar header or content should be new."""
+        user = "# Acme\n\n## overview\nOur app.\n\n## Tech Stack 🔧\n- Rust\n"
+
+        result = detect_new_sections(user, TEMPLATE)
+
+        assert result.titles == [
+            "[[PROJECT_NAME]] Commands",
+            "Security Rules (CRITICAL)",
+        ]
+        assert result.content is not None
+        assert result.content.startswith("## [[PROJECT_NAME]] Commands\n")
+        assert result.content.endswith("Validate all external input.")
+        assert result.confidence >= MIN_LOCAL_CONFIDENCE
+
+    def test_placeholder_titles_match_filled_in_titles(self) -> None:
+        """A title with a placeholder should match the user's filled-in title."""
+        user = (
+            "## Overview\nx\n\n## Tech Stack\ny\n\n## Acme Commands\nmake test\n\n"
+            "## Security Rules\nNever commit secrets or API keys. "
+            "Validate all external input.\n"
+        )
+
+        result = detect_new_sections(user, TEMPLATE)
+
+        assert result.content is None
+        assert result.confidence >= MIN_LOCAL_CONFIDENCE
+
+    def test_renamed_section_matches_by_content(self) -> None:
+        """A section the user renamed but kept should not be added again."""
+        user = (
+            "## Overview\nx\n\n## Tech Stack\ny\n\n## Acme Commands\nz\n\n"
+            "### Safety\nNever commit secrets or API keys. Validate all external "
+            "input.\n"
+        )
+
+        result = detect_new_sections(user, TEMPLATE)
+
+        assert result.titles == []
+
+    def test_similar_title_is_uncertain(self) -> None:
+        """A half-matching title should defer to the AI."""
+        user = (
+            "## Overview\nx\n\n## Tech Stack\ny\n\n## Acme Commands\nz\n\n"
+            "## Security Rule\nBe careful.\n"
+        )
+
+        result = detect_new_sections(user, TEMPLATE)
+
+        assert result.confidence < MIN_LOCAL_CONFIDENCE
+
+    def test_contained_title_with_other_content_is_uncertain(self) -> None:
+        """Title words alone shouldn't settle a match when the content differs."""
+        user = (
+            "## Overview\nx\n\n## Tech Stack\ny\n\n## Acme Commands\nz\n\n"
+            "## Security Rules\nBe careful.\n"
+        )
+
+        result = detect_new_sections(user, TEMPLATE)
+
+        assert result.confidence < MIN_LOCAL_CONFIDENCE
+
+    def test_header_at_another_level_is_not_a_match(self) -> None:
+        """A ### header containing the title shouldn't hide a new ## section."""
+        user = "## Overview\nOur app.\n\n### Build Commands\nmake all\n"
+        template = (
+            "## Overview\nOur app.\n\n"
+            "## Commands\nRun the linter and the full test suite.\n"
+        )
+
+        result = detect_new_sections(user, template)
+
+        assert result.confidence < MIN_LOCAL_CONFIDENCE
+
+    def test_no_headers_means_no_confidence(self) -> None:
+        """Without headers to compare, the local answer can't be trusted."""
+        assert detect_new_sections("Just some notes.\n", TEMPLATE).confidence == 0.0
+
+
+class TestSmartMergeLocalSections:
+    """Tests for skipping the AI when new sections are found locally."""
+
+    @pytest.fixture
+    def no_ai(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Fail the test if the AI is asked."""
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("AI called")
+
+        monkeypatch.setattr(ai_merge_module, "ai_merge_content", fail)
+
+    def test_conflicting_markdown_merges_without_ai(self, no_ai: None) -> None:
+        """Conflicting sections plus a clear new section shouldn't need the AI."""
+        base = "## Overview\nBase text.\n\n## Tech Stack\n- Language\n"
+        user = "## Overview\nUser text.\n\n## Tech Stack\n- Rust\n"
+        template = (
+            "## Overview\nTemplate text.\n\n## Tech Stack\n- Python\n\n"
+            "## Security Rules\nNever commit secrets.\n"
+        )
+        console = Console(record=True, width=200)
+
+        assert not needs_ai_merge(user, template, "CLAUDE.md", base)
+        result = smart_merge_file(
+            user, template, "CLAUDE.md", console, auto_approve=True, base_content=base
+        )
+
+        assert result.user_approved
+        assert result.merged_content == (
+            user + "\n## Security Rules\nNever commit secrets.\n"
+        )
+        assert "Section Merge Preview" in console.export_text()
@@ -0,0 +1,68 @@
+"""Tests for the markdown outline parser."""
+
+import pytest
+
+from echograph_cli.core import outline
+from echograph_cli.core.outline import head_end, nodes_at_level, parse_outline
+
+
+class TestParseOutline:
+    """Tests for parse_outline()."""
+
+    def test_builds_nested_tree(self) -> None:
+        """### headers should nest under the preceding ## header."""
+        text = "# Title\n\n## A\na\n### A1\nx\n## B\nb\n"
+
+        root = parse_outline(text)
+
+        (title,) = root.children
+        assert title.title == "Title"
+        assert [c.title for c in title.children] == ["A", "B"]
+        assert [c.title for c in title.children[0].children] == ["A1"]
+
+    def test_offsets_slice_sections(self) -> None:
+        """Node offsets should slice exactly the section text."""
+        text = "pre\n## A\na\n### A1\nx\n## B\nb\n"
+
+        a, b = nodes_at_level(parse_outline(text), 2)
+
+        assert text[a.start : a.end] == "## A\na\n### A1\nx\n"
+        assert text[a.start : head_end(a)] == "## A\na\n"
+        assert text[a.body_start : head_end(a)] == "a\n"
+        assert text[b.start : b.end] == "## B\nb\n"
+
+    def test_ignores_headers_in_fences(self) -> None:
+        """Headers inside fenced code blocks should not start sections."""
+        text = (
+            "## A\n```bash\n## not a header\n```\n~~~~\n# nor this\n~~~\n~~~~\n## B\n"
+        )
+
+        root = parse_outline(text)
+
+        assert [c.title for c in root.children] == ["A", "B"]
+
+    def test_equal_subtrees_have_equal_digests(self) -> None:
+        """Digests should match for equal content regardless of position."""
+        one = parse_outline("## A\nsame\n\n## B\nx\n")
+        two = parse_outline("## Z\nz\n## A\nsame\n")
+
+        assert one.children[0].digest == two.children[1].digest
+        assert one.children[1].digest != two.children[0].digest
+
+    def test_requires_space_after_hashes(self) -> None:
+        """Tags like #hashtag should not be headers."""
+        root = parse_outline("#hashtag\n####### seven\n")
+
+        assert root.children == []
+
+    def test_block_boundaries_do_not_change_result(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Parsing in tiny blocks should give the same offsets and digests."""
+        text = "# T\r\n\r\n## A\ra\n```\n## no\n```\n## B  \n\nb \n\n"
+        expected = parse_outline(text)
+
+        monkeypatch.setattr(outline, "_BLOCK_CHARS", 3)
+        root = parse_outline(text)
+
+        assert root == expected
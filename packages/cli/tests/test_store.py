@@ -0,0 +1,182 @@
+"""Tests for the content-addressed template store."""
+
+import json
+import zlib
+from pathlib import Path
+
+import pytest
+
+from echograph_cli.core.merge import three_way_merge
+from echograph_cli.core.store import (
+    BlobStore,
+    load_base_content,
+    load_history,
+    read_template_version,
+    save_metadata,
+    select_base_content,
+    store_for,
+)
+
+
+class TestBlobStore:
+    """Tests for BlobStore."""
+
+    def test_round_trips_content(self, tmp_path: Path) -> None:
+        """Should return stored content by digest."""
+        store = BlobStore(tmp_path)
+
+        sha = store.put("# Title\n\nBody\n")
+
+        assert store.get(sha) == "# Title\n\nBody\n"
+
+    def test_stores_compressed_objects(self, tmp_path: Path) -> None:
+        """Should zlib-compress objects under objects/<sha>."""
+        store = BlobStore(tmp_path)
+
+        sha = store.put("x" * 1000)
+
+        raw = (tmp_path / "objects" / sha).read_bytes()
+        assert len(raw) < 1000
+        assert zlib.decompress(raw) == b"x" * 1000
+
+    def test_deduplicates_identical_content(self, tmp_path: Path) -> None:
+        """Should store identical content once."""
+        store = BlobStore(tmp_path)
+
+        assert store.put("same") == store.put("same")
+        assert len(list((tmp_path / "objects").iterdir())) == 1
+
+    def test_missing_object_raises_key_error(self, tmp_path: Path) -> None:
+        """Should raise KeyError for unknown or malformed digests."""
+        store = BlobStore(tmp_path)
+
+        with pytest.raises(KeyError):
+            store.get("0" * 64)
+        with pytest.raises(KeyError):
+            store.get("../escape")
+
+
+class TestTemplateMetadata:
+    """Tests for the metadata index."""
+
+    def test_index_stores_hashes_not_contents(self, tmp_path: Path) -> None:
+        """Should keep file bodies out of the index."""
+        metadata_file = tmp_path / ".claude" / ".echograph-meta.json"
+
+        save_metadata(metadata_file, {"CLAUDE.md": "body " * 100}, "1.0.0")
+
+        metadata = json.loads(metadata_file.read_text())
+        assert metadata["format"] == 2
+        assert "body" not in metadata_file.read_text()
+        assert load_base_content(metadata_file, metadata, "CLAUDE.md") == (
+            "body " * 100
+        )
+
+    def test_version_read_from_head_only(self, tmp_path: Path) -> None:
+        """Should read the version without parsing the whole index."""
+        metadata_file = tmp_path / ".echograph-meta.json"
+        metadata_file.write_text('{"template_version": "1.2.3", ' + "x" * 10_000)
+
+        assert read_template_version(metadata_file) == "1.2.3"
+
+    def test_version_from_legacy_layout(self, tmp_path: Path) -> None:
+        """Should fall back to a full parse for other layouts."""
+        metadata_file = tmp_path / ".echograph-meta.json"
+        metadata_file.write_text(json.dumps({"files": {}, "template_version": "0.4.0"}))
+
+        assert read_template_version(metadata_file) == "0.4.0"
+
+    def test_invalid_metadata_raises_value_error(self, tmp_path: Path) -> None:
+        """Should raise ValueError for invalid JSON."""
+        metadata_file = tmp_path / ".echograph-meta.json"
+        metadata_file.write_text("not json")
+
+        with pytest.raises(ValueError):
+            read_template_version(metadata_file)
+
+    def test_loads_legacy_inline_content(self, tmp_path: Path) -> None:
+        """Should read base content stored inline by older versions."""
+        metadata = {"template_version": "0.1.0", "files": {"a.md": "inline"}}
+
+        assert load_base_content(tmp_path / "meta.json", metadata, "a.md") == "inline"
+        assert load_base_content(tmp_path / "meta.json", metadata, "b.md") == ""
+
+
+class TestBaseHistory:
+    """Tests for multi-version base selection."""
+
+    def _save_versions(self, metadata_file: Path, versions: list[str]) -> dict:
+        for i, content in enumerate(versions):
+            save_metadata(metadata_file, {"a.md": content}, f"0.{i + 1}.0")
+        result: dict = json.loads(metadata_file.read_text())
+        return result
+
+    def test_records_one_snapshot_per_version(self, tmp_path: Path) -> None:
+        """Should keep a snapshot for every saved version."""
+        metadata_file = tmp_path / ".echograph-meta.json"
+
+        self._save_versions(metadata_file, ["v1\n", "v2\n", "v3\n"])
+
+        history = load_history(store_for(metadata_file))
+        assert [s["version"] for s in history] == ["0.1.0", "0.2.0", "0.3.0"]
+
+    def test_base_is_last_synced_version(self, tmp_path: Path) -> None:
+        """Should use the latest recorded version, not an older one."""
+        metadata_file = tmp_path / ".echograph-meta.json"
+        metadata = self._save_versions(metadata_file, ["v1\n", "v2\n", "v3\n"])
+
+        base = select_base_content(metadata_file, metadata, "a.md")
+
+        assert base == "v3\n"
+
+    def test_exact_revert_is_kept(self, tmp_path: Path) -> None:
+        """A file reverted to exactly an older release must not fast-forward."""
+        metadata_file = tmp_path / ".echograph-meta.json"
+        v1 = "".join(f"line {i}\n" for i in range(20))
+        v2 = v1 + "template addition\n"
+        metadata = self._save_versions(metadata_file, [v1, v2])
+        user = v1  # Synced to v2, then removed the addition again
+        v3 = v2 + "another addition\n"
+
+        base = select_base_content(metadata_file, metadata, "a.md")
+        merged, conflicts = three_way_merge(base, user, v3)
+
+        assert base == v2
+        assert not conflicts
+        assert merged == v1 + "another addition\n"
+
+    def test_reverted_template_change_is_kept(self, tmp_path: Path) -> None:
+        """Should not let a reverted change look unmodified against v1."""
+        metadata_file = tmp_path / ".echograph-meta.json"
+        v1 = "".join(f"line {i}\n" for i in range(20))
+        v2 = v1 + "template addition\n"
+        metadata = self._save_versions(metadata_file, [v1, v2])
+        # User synced to v2, then removed the addition and edited a line
+        user = v1.replace("line 3\n", "my line 3\n")
+        v3 = v2 + "another addition\n"
+
+        base = select_base_content(metadata_file, metadata, "a.md")
+        merged, conflicts = three_way_merge(base, user, v3)
+
+        assert base == v2
+        assert not conflicts
+        assert "template addition" not in merged
+        assert "another addition" in merged
+
+    def test_missing_index_entry_uses_newest_snapshot(self, tmp_path: Path) -> None:
+        """Without an index entry, the newest recorded snapshot is the base."""
+        metadata_file = tmp_path / ".echograph-meta.json"
+        metadata = self._save_versions(metadata_file, ["v1\n", "v2\n"])
+        metadata["files"] = {}
+
+        base = select_base_content(metadata_file, metadata, "a.md")
+
+        assert base == "v2\n"
+
+    def test_legacy_metadata_uses_inline_base(self, tmp_path: Path) -> None:
+        """Should use the inline base for projects without history."""
+        metadata = {"template_version": "0.1.0", "files": {"a.md": "inline"}}
+
+        base = select_base_content(tmp_path / "meta.json", metadata, "a.md")
+
+        assert base == "inline"
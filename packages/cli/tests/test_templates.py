@@ -0,0 +1,292 @@
+"""Tests for template loading and rendering."""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from echograph_cli.core import templates
+from echograph_cli.core.models import ProjectConfig
+from echograph_cli.core.templates import (
+    MINIMAL_TEMPLATES,
+    TemplateCatalog,
+    _walk_template_files,
+    copy_templates,
+    detect_conflicts,
+    get_bundled_template,
+    get_project_config,
+    get_template_catalog,
+    load_template_manifest,
+)
+
+
+class TestTemplateCatalog:
+    """Tests for the process-wide template catalog."""
+
+    def test_catalog_is_process_wide(self) -> None:
+        """Should return the same catalog instance on every call."""
+        assert get_template_catalog() is get_template_catalog()
+
+    def test_lists_minimal_subset(self) -> None:
+        """Should list only core files in minimal mode."""
+        catalog = TemplateCatalog()
+
+        minimal = catalog.list_files("minimal")
+
+        assert "CLAUDE.md" in minimal
+        assert all(t in MINIMAL_TEMPLATES for t in minimal)
+        assert set(minimal) <= set(catalog.list_files("full"))
+
+    def test_renders_jinja_template_with_config(self) -> None:
+        """Should render .j2 templates with project config values."""
+        catalog = TemplateCatalog()
+        config = ProjectConfig(project_name="catalog-demo", tech_stack=["python"])
+
+        content = catalog.render("CLAUDE.md", config)
+
+        assert "catalog-demo" in content
+
+    def test_renders_each_template_once_per_config(self) -> None:
+        """Should reuse rendered output for an equal config."""
+        catalog = TemplateCatalog()
+        first = catalog.render("CLAUDE.md", ProjectConfig(project_name="a"))
+        catalog._env = None  # Any re-render would need a new environment
+
+        second = catalog.render("CLAUDE.md", ProjectConfig(project_name="a"))
+
+        assert second is first
+        assert catalog._env is None
+
+    def test_falls_back_to_raw_file(self) -> None:
+        """Should return raw content for non-Jinja templates."""
+        catalog = TemplateCatalog()
+
+        content = catalog.render("PRPs/templates/prp-template.md")
+
+        assert content
+        assert content == get_bundled_template("PRPs/templates/prp-template.md")
+
+    def test_missing_template_renders_empty(self) -> None:
+        """Should return empty string for unknown templates."""
+        assert TemplateCatalog().render("does/not/exist.md") == ""
+
+    def test_content_hash_matches_rendered_content(self) -> None:
+        """Should hash rendered content with SHA-256."""
+        catalog = TemplateCatalog()
+        config = ProjectConfig(project_name="hashing")
+
+        digest = catalog.content_hash("CLAUDE.md", config)
+
+        expected = hashlib.sha256(
+            catalog.render("CLAUDE.md", config).encode("utf-8")
+        ).hexdigest()
+        assert digest == expected
+
+
+class TestTemplateManifest:
+    """Tests for the build-time template manifest."""
+
+    def test_manifest_is_packaged(self) -> None:
+        """Should ship a manifest with the templates."""
+        assert load_template_manifest() is not None
+
+    def test_manifest_matches_template_tree(self) -> None:
+        """Manifest should be regenerated whenever templates change.
+
+        Run: python scripts/sync-cli-templates.py --manifest-only
+        """
+        manifest = load_template_manifest()
+
+        assert manifest == _walk_template_files("echograph_cli")
+
+    def test_listing_does_not_walk_tree(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should list templates from the manifest alone."""
+
+        def _fail(package: str) -> list[str]:
+            raise AssertionError("template tree should not be walked")
+
+        monkeypatch.setattr(templates, "_walk_template_files", _fail)
+
+        assert "CLAUDE.md" in TemplateCatalog().list_files("full")
+
+    def test_identical_raw_file_is_not_conflict(self, temp_project: Path) -> None:
+        """Should not report files identical to their template."""
+        rel_path = "PRPs/templates/prp-template.md"
+        target = temp_project / rel_path
+        target.parent.mkdir(parents=True)
+        target.write_bytes(get_bundled_template(rel_path).encode("utf-8"))
+
+        conflicts = detect_conflicts(temp_project, "full")
+
+        assert rel_path not in [c.template_path for c in conflicts]
+
+    def test_modified_raw_file_is_conflict(self, temp_project: Path) -> None:
+        """Should report files that differ from their template."""
+        rel_path = "PRPs/templates/prp-template.md"
+        target = temp_project / rel_path
+        target.parent.mkdir(parents=True)
+        target.write_text("customized\n", encoding="utf-8")
+
+        conflicts = detect_conflicts(temp_project, "full")
+
+        assert rel_path in [c.template_path for c in conflicts]
+
+
+class TestBytecodeCache:
+    """Tests for the versioned Jinja bytecode cache."""
+
+    def test_compiled_templates_are_cached_on_disk(
+        self, isolated_cache_dir: Path
+    ) -> None:
+        """Should write compiled templates under the versioned cache dir."""
+        from echograph_cli import __version__
+
+        TemplateCatalog().render("CLAUDE.md", ProjectConfig(project_name="x"))
+
+        cache_dir = isolated_cache_dir / "jinja" / __version__
+        assert any(cache_dir.iterdir())
+
+    def test_second_process_skips_compilation(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should load bytecode instead of compiling in a fresh environment."""
+        from jinja2 import Environment
+
+        config = ProjectConfig(project_name="x")
+        expected = TemplateCatalog().render("CLAUDE.md", config)
+
+        def _fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("template should not be recompiled")
+
+        monkeypatch.setattr(Environment, "compile", _fail)
+
+        assert TemplateCatalog().render("CLAUDE.md", config) == expected
+
+    def test_cache_can_be_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should not use a bytecode cache with ECHOGRAPH_NO_CACHE set."""
+        monkeypatch.setenv("ECHOGRAPH_NO_CACHE", "1")
+
+        assert TemplateCatalog().env.bytecode_cache is None
+
+
+class TestCopyTemplates:
+    """Tests for the template write pipeline."""
+
+    def test_writes_templates_and_metadata(self, temp_project: Path) -> None:
+        """Should write all full-mode templates and metadata."""
+        config = ProjectConfig(project_name="pipeline")
+
+        created = copy_templates(temp_project, "full", config)
+
+        assert temp_project / "CLAUDE.md" in created
+        assert "pipeline" in (temp_project / "CLAUDE.md").read_text()
+        assert (temp_project / ".claude" / ".echograph-meta.json").exists()
+
+    def test_force_skips_identical_files(self, temp_project: Path) -> None:
+        """Should not rewrite files whose content already matches."""
+        import os
+
+        config = ProjectConfig(project_name="pipeline")
+        copy_templates(temp_project, "full", config)
+        claude_md = temp_project / "CLAUDE.md"
+        os.utime(claude_md, (0, 0))
+
+        copy_templates(temp_project, "full", config, force=True)
+
+        assert claude_md.stat().st_mtime == 0
+
+    def test_rename_backs_up_existing_file(self, temp_project: Path) -> None:
+        """Should back up an existing file before writing the template."""
+        from echograph_cli.core.models import ConflictResolution
+
+        (temp_project / "CLAUDE.md").write_text("mine\n")
+
+        copy_templates(
+            temp_project,
+            "minimal",
+            ProjectConfig(project_name="pipeline"),
+            conflict_resolutions={"CLAUDE.md": ConflictResolution.RENAME},
+        )
+
+        assert (temp_project / "CLAUDE.md.bak").read_text() == "mine\n"
+        assert "pipeline" in (temp_project / "CLAUDE.md").read_text()
+
+
+class TestProjectDetection:
+    """Tests for subprocess-free project detection."""
+
+    def _write_git_config(self, git_dir: Path, url: str) -> None:
+        git_dir.mkdir(parents=True, exist_ok=True)
+        (git_dir / "config").write_text(
+            "[core]\n\tbare = false\n"
+            '[remote "upstream"]\n\turl = https://example.com/other.git\n'
+            f'[remote "origin"]\n\turl = {url}\n'
+            "\tfetch = +refs/heads/*:refs/remotes/origin/*\n"
+        )
+
+    def test_reads_origin_from_git_config(self, temp_project: Path) -> None:
+        """Should take the project name from the origin URL."""
+        self._write_git_config(
+            temp_project / ".git", "git@github.com:acme/widget-service.git"
+        )
+
+        assert get_project_config(temp_project).project_name == "widget-service"
+
+    def test_matches_git_remote_get_url(self, temp_project_with_git: Path) -> None:
+        """Should agree with git for a remote added by git itself."""
+        import subprocess
+
+        subprocess.run(
+            ["git", "remote", "add", "origin", "https://example.com/a/parity.git"],
+            cwd=temp_project_with_git,
+            capture_output=True,
+            check=True,
+        )
+
+        assert get_project_config(temp_project_with_git).project_name == "parity"
+
+    def test_follows_worktree_gitdir_link(self, tmp_path: Path) -> None:
+        """Should follow a .git file to the worktree's common dir."""
+        main_git = tmp_path / "main" / ".git"
+        self._write_git_config(main_git, "https://example.com/org/mainrepo")
+        worktree_git = main_git / "worktrees" / "feature"
+        worktree_git.mkdir(parents=True)
+        (worktree_git / "commondir").write_text("../..\n")
+        worktree = tmp_path / "feature"
+        worktree.mkdir()
+        (worktree / ".git").write_text(f"gitdir: {worktree_git}\n")
+
+        assert get_project_config(worktree).project_name == "mainrepo"
+
+    def test_falls_back_to_folder_name(self, temp_project: Path) -> None:
+        """Should use the directory name without a git remote."""
+        project = temp_project / "plain-folder"
+        project.mkdir()
+
+        assert get_project_config(project).project_name == "plain-folder"
+
+    def test_detects_markers_in_one_scan(self, temp_project: Path) -> None:
+        """Should detect stack, tests and tooling from marker files."""
+        for name in ("pyproject.toml", "package.json", "tsconfig.json", "ruff.toml"):
+            (temp_project / name).write_text("")
+        (temp_project / "tests").mkdir()
+
+        config = get_project_config(temp_project)
+
+        assert config.tech_stack == ["python", "nodejs", "typescript"]
+        assert config.has_tests is True
+        assert config.test_framework == "pytest"
+        assert config.formatter == "ruff"
+        assert config.linter == "ruff"
+
+    def test_cache_invalidated_by_directory_change(self, temp_project: Path) -> None:
+        """Should re-detect when the directory mtime changes."""
+        import os
+
+        os.utime(temp_project, ns=(1_000_000_000, 1_000_000_000))
+        assert get_project_config(temp_project).tech_stack == []
+
+        (temp_project / "go.mod").write_text("")
+        os.utime(temp_project, ns=(2_000_000_000, 2_000_000_000))
+
+        assert get_project_config(temp_project).tech_stack == ["go"]
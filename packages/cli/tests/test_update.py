@@ -3,9 +3,15 @@
 import json
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from echograph_cli import __version__
+from echograph_cli.commands.update import _merge_into
+from echograph_cli.core import gitmerge
+from echograph_cli.core.cache import DiskCache
+from echograph_cli.core.merge import MergeBackend
+from echograph_cli.core.models import MergeStats
 from echograph_cli.main import app
 
 runner = CliRunner()
@@ -58,3 +64,111 @@ class TestUpdateCommand:
 
         assert "Dry run" in result.output
         assert claude_md.read_text() == original_content
+
+    def test_update_fast_forwards_unmodified_file(
+        self, temp_project_with_claude: Path
+    ) -> None:
+        """Should fast-forward a file unmodified since the last sync."""
+        from echograph_cli.core.store import save_metadata
+        from echograph_cli.core.templates import get_bundled_template
+
+        rel_path = "PRPs/templates/prp-template.md"
+        metadata_file = temp_project_with_claude / ".claude" / ".echograph-meta.json"
+        save_metadata(metadata_file, {rel_path: "release one\n"}, "0.0.1")
+        save_metadata(metadata_file, {rel_path: "release two\n"}, "0.0.2")
+        user_file = temp_project_with_claude / rel_path
+        user_file.parent.mkdir(parents=True)
+        user_file.write_text("release two\n")
+
+        result = runner.invoke(app, ["update", str(temp_project_with_claude)])
+
+        assert result.exit_code == 0
+        assert user_file.read_text() == get_bundled_template(rel_path)
+
+    def test_update_keeps_revert_to_older_release(
+        self, temp_project_with_claude: Path
+    ) -> None:
+        """A file reverted to an older release should merge, not fast-forward."""
+        from echograph_cli.core.store import save_metadata
+        from echograph_cli.core.templates import get_bundled_template
+
+        rel_path = "PRPs/templates/prp-template.md"
+        metadata_file = temp_project_with_claude / ".claude" / ".echograph-meta.json"
+        save_metadata(metadata_file, {rel_path: "release one\n"}, "0.0.1")
+        save_metadata(metadata_file, {rel_path: "release two\n"}, "0.0.2")
+        user_file = temp_project_with_claude / rel_path
+        user_file.parent.mkdir(parents=True)
+        user_file.write_text("release one\n")
+
+        runner.invoke(app, ["update", str(temp_project_with_claude)])
+
+        assert user_file.read_text() != get_bundled_template(rel_path)
+
+    def test_update_records_new_base_version(
+        self, temp_project_with_claude: Path
+    ) -> None:
+        """Should record the current release so the next update is a no-op."""
+        metadata_file = temp_project_with_claude / ".claude" / ".echograph-meta.json"
+        metadata_file.write_text(json.dumps({"template_version": "0.0.1", "files": {}}))
+
+        runner.invoke(app, ["update", str(temp_project_with_claude)])
+        result = runner.invoke(app, ["update", str(temp_project_with_claude)])
+
+        assert "up to date" in result.output.lower()
+
+
+class TestMergeBackendOption:
+    """Tests for choosing the line merge engine on update."""
+
+    def _run(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, backend: MergeBackend
+    ) -> list[str]:
+        """Merge a non-markdown file through _merge_into; return git calls."""
+        calls: list[str] = []
+
+        def fake(base: str, user: str, new: str) -> None:
+            calls.append(base)
+            return None  # Falls back to Python
+
+        monkeypatch.setattr(gitmerge, "git_executable", lambda: "git")
+        monkeypatch.setattr(gitmerge, "git_diff3_chunks", fake)
+        target = tmp_path / "settings.txt"
+        _merge_into(
+            target,
+            "a\nb\n",
+            "a\nB\n",
+            "A\nb\n",
+            is_markdown=False,
+            stats=MergeStats(),
+            cache=DiskCache(tmp_path / "cache"),
+            dry_run=False,
+            backend=backend,
+        )
+        assert target.read_text() == "A\nB\n"
+        return calls
+
+    def test_git_backend_reaches_git(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """--merge-backend git should run the merge through git merge-file."""
+        assert self._run(tmp_path, monkeypatch, MergeBackend.GIT) == ["a\nb\n"]
+
+    def test_default_backend_skips_git(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The default should merge in Python."""
+        assert self._run(tmp_path, monkeypatch, MergeBackend.PYTHON) == []
+
+    def test_option_is_accepted(self, temp_project_with_claude: Path) -> None:
+        """The CLI should accept --merge-backend."""
+        metadata_file = temp_project_with_claude / ".claude" / ".echograph-meta.json"
+        metadata_file.write_text(
+            json.dumps({"template_version": __version__, "files": {}})
+        )
+
+        result = runner.invoke(
+            app,
+            ["update", str(temp_project_with_claude), "--merge-backend", "auto"],
+        )
+
+        assert result.exit_code == 0
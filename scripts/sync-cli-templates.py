@@ -7,13 +7,19 @@ ensuring the published package has the latest commands and configuration.
 Project-specific files (in _project/ folders or listed in EXCLUDE_PATTERNS)
 are NOT synced - they stay only in EchoGraph's own .claude/ folder.
 
+It also regenerates templates/_manifest.json (path, size, sha256, is_jinja
+and mode membership for every bundled template). The CLI reads this one
+file instead of walking the package tree at runtime.
+
 Usage:
-    python scripts/sync-cli-templates.py [--dry-run]
+    python scripts/sync-cli-templates.py [--dry-run] [--manifest-only]
 
 Run this BEFORE bumping version and publishing to PyPI.
 """
 
 import argparse
+import hashlib
+import json
 import shutil
 from pathlib import Path
 
@@ -21,7 +27,19 @@ from pathlib import Path
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent
 SOURCE_DIR = PROJECT_ROOT / ".claude"
-TARGET_DIR = PROJECT_ROOT / "packages" / "cli" / "src" / "echograph_cli" / "templates" / ".claude"
+TEMPLATES_DIR = PROJECT_ROOT / "packages" / "cli" / "src" / "echograph_cli" / "templates"
+TARGET_DIR = TEMPLATES_DIR / ".claude"
+
+# Manifest shipped with the package (keep in sync with core/templates.py)
+MANIFEST_NAME = "_manifest.json"
+MANIFEST_VERSION = 1
+
+# Core files included in minimal mode (keep in sync with core/templates.py)
+MINIMAL_TEMPLATES = [
+    "CLAUDE.md",
+    ".claude/PLANNING.md",
+    ".claude/TASK.md",
+]
 
 # Files/folders to EXCLUDE from sync (project-specific, not for distribution)
 EXCLUDE_PATTERNS = [
@@ -161,6 +179,53 @@ def sync_templates(dry_run: bool = False) -> None:
     print("=" * 60)
 
 
+def build_manifest() -> dict:
+    """Build the template manifest for everything under TEMPLATES_DIR."""
+    entries = []
+    for src_file in sorted(TEMPLATES_DIR.rglob("*")):
+        # Only skip build junk here - EXCLUDE_PATTERNS is about the sync
+        # source and would drop bundled files such as .claude/TASK.md
+        if not src_file.is_file() or "__pycache__" in src_file.parts:
+            continue
+        if src_file.suffix == ".pyc" or src_file.name == ".DS_Store":
+            continue
+        source = str(src_file.relative_to(TEMPLATES_DIR)).replace("\\", "/")
+        if source == MANIFEST_NAME:
+            continue
+
+        data = src_file.read_bytes()
+        is_jinja = source.endswith(".j2")
+        path = source[:-3] if is_jinja else source
+        modes = ["minimal", "full"] if path in MINIMAL_TEMPLATES else ["full"]
+        entries.append(
+            {
+                "path": path,
+                "source": source,
+                "size": len(data),
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "is_jinja": is_jinja,
+                "modes": modes,
+            }
+        )
+
+    return {"manifest_version": MANIFEST_VERSION, "files": entries}
+
+
+def write_manifest(dry_run: bool = False) -> None:
+    """Regenerate the template manifest packaged with the CLI."""
+    manifest = build_manifest()
+    manifest_path = TEMPLATES_DIR / MANIFEST_NAME
+    content = json.dumps(manifest, indent=2) + "\n"
+
+    if manifest_path.exists() and manifest_path.read_text(encoding="utf-8") == content:
+        print(f"Manifest up to date ({len(manifest['files'])} templates)")
+        return
+
+    print(f"  [MANIFEST] {manifest_path.name} ({len(manifest['files'])} templates)")
+    if not dry_run:
+        manifest_path.write_text(content, encoding="utf-8")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Sync .claude/ templates to CLI package",
@@ -171,9 +236,16 @@ def main():
         action="store_true",
         help="Show what would be done without making changes"
     )
+    parser.add_argument(
+        "--manifest-only",
+        action="store_true",
+        help="Only regenerate templates/_manifest.json"
+    )
     args = parser.parse_args()
 
-    sync_templates(dry_run=args.dry_run)
+    if not args.manifest_only:
+        sync_templates(dry_run=args.dry_run)
+    write_manifest(dry_run=args.dry_run)
 
 
 if __name__ == "__main__":